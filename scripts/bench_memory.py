@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""Measure resident memory of variant and recommendation models on a synthetic catalogue."""
+
+# ruff: noqa: E402
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from dataclasses import replace
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from money_map.core.load import _load_variants as load_variants
+from money_map.core.load import load_app_data, load_profile
+from money_map.core.recommend import recommend
+
+
+def _fresh_mapping(mapping: dict) -> dict:
+    return {
+        "".join(key): "".join(value) if isinstance(value, str) else value
+        for key, value in mapping.items()
+    }
+
+
+def _synthetic_entries(seed: list, count: int) -> list[dict]:
+    """Seed variants repeated with unique ids, as plain dicts like a parsed YAML file."""
+    entries = []
+    for index in range(count):
+        variant = seed[index % len(seed)]
+        entries.append(
+            {
+                "variant_id": f"{variant.variant_id}.{index}",
+                "title": variant.title,
+                "summary": variant.summary,
+                # Fresh string copies per entry, as a YAML parser would produce them.
+                "cell_id": "".join(variant.cell_id),
+                "taxonomy_id": "".join(variant.taxonomy_id),
+                "tags": ["".join(tag) for tag in variant.tags],
+                "regulated_domain": variant.regulated_domain,
+                "feasibility": _fresh_mapping(variant.feasibility),
+                "prep_steps": list(variant.prep_steps),
+                "economics": _fresh_mapping(variant.economics),
+                "legal": _fresh_mapping(variant.legal),
+                "review_date": "".join(variant.review_date),
+            }
+        )
+    return entries
+
+
+def _measure(build) -> tuple[object, int]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-dir", default=str(ROOT / "data"))
+    parser.add_argument("--profile", default=str(ROOT / "profiles" / "demo_fast_start.yaml"))
+    parser.add_argument("--variants", type=int, default=100_000)
+    parser.add_argument("--results", type=int, default=4, help="Concurrent results to hold")
+    parser.add_argument("--top", type=int, default=50)
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir)
+    app_data = load_app_data(data_dir, use_cache=False)
+    profile = load_profile(args.profile)
+    # The parsed entries are dropped after loading, so only what the models keep is counted.
+    variants, variant_bytes = _measure(
+        lambda: load_variants({"variants": _synthetic_entries(app_data.variants, args.variants)})
+    )
+    catalogue = replace(app_data, variants=variants)
+
+    def _results() -> list:
+        return [
+            recommend(
+                profile,
+                catalogue.variants,
+                catalogue.rulepack,
+                catalogue.meta.staleness_policy,
+                top_n=args.top,
+            )
+            for _ in range(args.results)
+        ]
+
+    _, result_bytes = _measure(_results)
+
+    print(f"variants: {len(variants)}")
+    print(
+        f"variant_models_bytes: {variant_bytes} ({variant_bytes / len(variants):.0f} per variant)"
+    )
+    per_result = result_bytes / max(args.results * args.top, 1)
+    print(f"recommendation_results_bytes: {result_bytes} ({per_result:.0f} per ranked variant)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
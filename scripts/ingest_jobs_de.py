@@ -1,19 +1,38 @@
 #!/usr/bin/env python3
 """Ingest Germany Jobsuche snapshot data into JSONL files."""
 
+# ruff: noqa: E402
+
 from __future__ import annotations
 
 import argparse
 import datetime as dt
+import itertools
 import json
+import sys
 from pathlib import Path
 from typing import Any
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
-DEFAULT_ENDPOINT = "https://rest.arbeitsagentur.de/jobboerse/jobsuche-service/pc/v4/jobs"
-DEFAULT_API_KEY = "jobboerse-jobsuche"
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from money_map.app.jobs_ingest import (
+    DEFAULT_API_KEY,
+    DEFAULT_ENDPOINT,
+    DEFAULT_MAX_PAGES,
+    JobQuery,
+    JobsucheClient,
+    QueryProgress,
+    TokenBucket,
+    ingest_queries,
+)
+from money_map.storage.job_index import JobIndex
+from money_map.storage.job_snapshots import SnapshotStore
+
 SNAPSHOT_DIR = Path("data/snapshots/jobs_de")
+INDEX_PATH = SNAPSHOT_DIR / "jobs_index.sqlite"
 
 
 def _pick(obj: dict[str, Any], *keys: str) -> Any:
@@ -87,33 +106,13 @@ def _dedupe_jobs(jobs: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return [*unique.values(), *no_key_jobs]
 
 
-def _request_jobs(endpoint: str, params: dict[str, Any], timeout_s: float) -> list[dict[str, Any]]:
-    query = urlencode(params)
-    url = f"{endpoint}?{query}"
-    request = Request(url, headers={"X-API-Key": DEFAULT_API_KEY})
-    with urlopen(request, timeout=timeout_s) as response:
-        payload = json.loads(response.read().decode("utf-8"))
-    if isinstance(payload, list):
-        return payload
-    if isinstance(payload, dict):
-        for key in ("stellenangebote", "jobs", "items", "results"):
-            items = payload.get(key)
-            if isinstance(items, list):
-                return items
-    raise ValueError("Unexpected Jobsuche response format: expected list or dict with jobs array")
-
-
-def _read_jsonl(path: Path) -> list[dict[str, Any]]:
-    jobs: list[dict[str, Any]] = []
-    if not path.exists():
-        return jobs
-    with path.open("r", encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line:
-                continue
-            jobs.append(json.loads(line))
-    return jobs
+def _print_progress(progress: QueryProgress) -> None:
+    total = progress.pages_total if progress.pages_total is not None else "?"
+    print(
+        f"[{progress.query.label()}] pages {progress.pages_done}/{total}, "
+        f"jobs={progress.jobs}, retries={progress.retries}",
+        file=sys.stderr,
+    )
 
 
 def _write_jsonl(path: Path, jobs: list[dict[str, Any]]) -> None:
@@ -123,20 +122,8 @@ def _write_jsonl(path: Path, jobs: list[dict[str, Any]]) -> None:
             fh.write(json.dumps(job, ensure_ascii=False) + "\n")
 
 
-def _find_latest_snapshot_for_day(day: dt.date) -> Path | None:
-    pattern = f"{day.isoformat()}_*.jsonl"
-    files = sorted(SNAPSHOT_DIR.glob(pattern))
-    if not files:
-        return None
-    return files[-1]
-
-
-def _build_target_path(mode: str, now: dt.datetime) -> Path:
+def _build_target_path(now: dt.datetime) -> Path:
     SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
-    if mode == "update":
-        existing = _find_latest_snapshot_for_day(now.date())
-        if existing is not None:
-            return existing
     name = f"{now.date().isoformat()}_{now.strftime('%H%M%S')}.jsonl"
     return SNAPSHOT_DIR / name
 
@@ -149,8 +136,16 @@ def parse_args() -> argparse.Namespace:
         )
     )
     parser.add_argument("--endpoint", default=DEFAULT_ENDPOINT, help="Jobsuche endpoint URL")
-    parser.add_argument("--was", default="", help="Search term (what)")
-    parser.add_argument("--wo", default="", help="Search location")
+    parser.add_argument(
+        "--was",
+        action="append",
+        help="Search term (what); repeat to query several terms",
+    )
+    parser.add_argument(
+        "--wo",
+        action="append",
+        help="Search location; repeat to query several locations (every was x wo pair)",
+    )
     parser.add_argument("--umkreis", type=int, default=25, help="Search radius in km")
     parser.add_argument("--size", type=int, default=50, help="Page size")
     parser.add_argument(
@@ -159,49 +154,98 @@ def parse_args() -> argparse.Namespace:
         default=7,
         help="Days since publication",
     )
-    parser.add_argument("--page", type=int, default=1, help="Page number")
+    parser.add_argument("--page", type=int, default=1, help="First page to fetch")
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=DEFAULT_MAX_PAGES,
+        help="Maximum pages per query (all result pages up to this limit are fetched)",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent requests")
+    parser.add_argument("--rate", type=float, default=2.0, help="Requests per second (all workers)")
+    parser.add_argument("--retries", type=int, default=4, help="Retries per page on errors")
     parser.add_argument(
         "--mode",
         choices=("append", "update"),
         default="append",
-        help="append=create new snapshot, update=merge into latest snapshot of the day",
+        help=(
+            "append=create new snapshot file, update=append new/changed jobs to the "
+            "day partition of the snapshot store"
+        ),
     )
     parser.add_argument("--timeout", type=float, default=30.0, help="HTTP timeout in seconds")
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=INDEX_PATH,
+        help="SQLite job index tracking first/last seen and content changes across snapshots",
+    )
     return parser.parse_args()
 
 
-def main() -> None:
+def main() -> int:
     args = parse_args()
-    params = {
-        "was": args.was,
-        "wo": args.wo,
-        "umkreis": args.umkreis,
-        "size": args.size,
-        "veroeffentlichtseit": args.veroeffentlichtseit,
-        "page": args.page,
-    }
+    store = compaction = None
+    if args.mode == "update":
+        store = SnapshotStore(SNAPSHOT_DIR)
+        # While the pages are fetched, compact the days appended to since their last check;
+        # older days gain no new superseded records and are not loaded.
+        compaction = store.compact_in_background()
+    queries = [
+        JobQuery(was=was, wo=wo) for was, wo in itertools.product(args.was or [""], args.wo or [""])
+    ]
+    client = JobsucheClient(
+        args.endpoint,
+        api_key=DEFAULT_API_KEY,
+        timeout_s=args.timeout,
+        limiter=TokenBucket(args.rate),
+        max_retries=args.retries,
+    )
+    try:
+        results = ingest_queries(
+            queries,
+            client,
+            params={"umkreis": args.umkreis, "veroeffentlichtseit": args.veroeffentlichtseit},
+            page_size=args.size,
+            start_page=args.page,
+            max_pages=args.max_pages,
+            workers=args.workers,
+            on_progress=_print_progress,
+        )
+    finally:
+        client.close()
 
-    raw_jobs = _request_jobs(args.endpoint, params=params, timeout_s=args.timeout)
+    failed = [result for result in results if result.error]
+    for result in failed:
+        print(f"[{result.query.label()}] failed: {result.error}", file=sys.stderr)
+    raw_jobs = [job for result in results for job in result.jobs]
     normalized_jobs = [_normalize_job(job, endpoint=args.endpoint) for job in raw_jobs]
     incoming = _dedupe_jobs(normalized_jobs)
-
     now = dt.datetime.now(dt.timezone.utc)
-    target_path = _build_target_path(mode=args.mode, now=now)
-
-    if args.mode == "update" and target_path.exists():
-        existing = _read_jsonl(target_path)
-        merged = _dedupe_jobs([*existing, *incoming])
-        _write_jsonl(target_path, merged)
+    if incoming:
+        with JobIndex(args.index) as index:
+            seen = index.upsert(incoming, seen_at=now)
         print(
-            "Updated "
-            f"{target_path}: existing={len(existing)}, "
-            f"incoming={len(incoming)}, total={len(merged)}"
+            f"Index {args.index}: new={seen.new}, updated={seen.updated}, "
+            f"unchanged={seen.unchanged}"
         )
-        return
-
+    if store is not None and compaction is not None:
+        stats = store.append(now.date(), incoming) if incoming else None
+        compaction.join()
+        if stats is not None:
+            print(
+                f"Updated {SNAPSHOT_DIR / now.date().isoformat()}: new={stats.new}, "
+                f"changed={stats.changed}, unchanged={stats.unchanged}, total={stats.total}"
+            )
+        return 1 if failed else 0
+    if not incoming and failed:
+        return 1
+
+    target_path = _build_target_path(now=now)
     _write_jsonl(target_path, incoming)
     print(f"Written {target_path}: total={len(incoming)}")
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -2,19 +2,36 @@
 
 from __future__ import annotations
 
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import asdict
+from datetime import date, datetime
 from pathlib import Path
 from time import perf_counter
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from money_map.app.observability import get_run_context, log_event
-from money_map.core.classify import classify_idea_text
+from money_map.core.classify import Classifier, classify_idea_text, get_classifier
+from money_map.core.compiled import compiled_path, variant_store_path, write_compiled
 from money_map.core.errors import DataValidationError, MoneyMapError
 from money_map.core.graph import build_plan
-from money_map.core.load import load_app_data, load_profile
+from money_map.core.load import compile_app_data, load_app_data, load_profile
+from money_map.core.model import ClassifyResultV1, RecommendationResult
 from money_map.core.profile import profile_hash
 from money_map.core.recommend import recommend
-from money_map.core.validate import validate
+from money_map.core.scoring import variant_facts
+from money_map.core.validate import (
+    near_duplicate_warns,
+    validate_cached,
+    validate_with_timings,
+    validation_token,
+)
+from money_map.core.validate_packs import iter_pack_variants, validate_packs
+from money_map.core.validate_stream import stream_validate_file
+from money_map.core.variant_store import write_variant_store
 from money_map.render.plan_md import render_plan_md
 from money_map.render.result_json import render_result_json
 from money_map.storage.fs import write_json, write_text, write_yaml
@@ -44,21 +61,83 @@ def _write_validation_report(
     payload: dict[str, Any],
     out_dir: str | Path | None,
     run_id: str | None,
+    name: str = "validate-report",
 ) -> str | None:
     if not out_dir or not run_id:
         return None
-    report_path = Path(out_dir) / f"validate-report-{run_id}.json"
+    report_path = Path(out_dir) / f"{name}-{run_id}.json"
     write_json(report_path, payload, default=str)
     return str(report_path)
 
 
-def _validate_app_data(app_data, out_dir: str | Path | None, run_id: str | None):
+# Serialized validate reports by validation token, oldest first. Per-write fields are
+# placeholders that `_write_memoized_report` fills in, so only the first write of a
+# dataset pays for serializing the issues and sources.
+_REPORT_TEXTS: dict[str, str] = {}
+_REPORT_TEXTS_SIZE = 8
+_PER_WRITE_FIELDS = ("generated_at", "timings_ms")
+
+
+def _placeholder(field: str) -> str:
+    return json.dumps(f"\x00{field}\x00")
+
+
+def _write_memoized_report(
+    payload: dict[str, Any], out_dir: str | Path | None, run_id: str | None, token: str
+) -> str | None:
+    if not out_dir or not run_id:
+        return None
+    text = _REPORT_TEXTS.get(token)
+    if text is None:
+        template = {**payload, **{field: f"\x00{field}\x00" for field in _PER_WRITE_FIELDS}}
+        text = json.dumps(template, ensure_ascii=False, indent=2, default=str) + "\n"
+        _REPORT_TEXTS[token] = text
+        while len(_REPORT_TEXTS) > _REPORT_TEXTS_SIZE:
+            _REPORT_TEXTS.pop(next(iter(_REPORT_TEXTS)))
+    for field in _PER_WRITE_FIELDS:
+        value = json.dumps(payload[field], ensure_ascii=False, indent=2, default=str)
+        # Top-level values sit one level deep; indent them like `write_json` does.
+        text = text.replace(_placeholder(field), value.replace("\n", "\n  "))
+    report_path = Path(out_dir) / f"validate-report-{run_id}.json"
+    write_text(report_path, text)
+    return str(report_path)
+
+
+def _validate_app_data(
+    app_data,
+    out_dir: str | Path | None,
+    run_id: str | None,
+    *,
+    revalidate: bool = False,
+    rule_timings: bool = False,
+    near_duplicates: float | None = None,
+    extra_variants: Iterable[Any] = (),
+):
     start = perf_counter()
-    report = validate(app_data)
+    token = validation_token(app_data)
+    rule_timings_ms = None
+    if rule_timings:
+        revalidate = True
+        report, rule_timings_ms = validate_with_timings(app_data)
+    else:
+        report = validate_cached(app_data, revalidate=revalidate)
     duration_ms = (perf_counter() - start) * 1000
     payload = _validation_payload(report)
+    # Memoized reports carry the time of their first validation; stamp each write.
+    payload["generated_at"] = datetime.utcnow().replace(microsecond=0).isoformat()
     payload["timings_ms"] = {"validate": round(duration_ms, 2)}
-    report_path = _write_validation_report(payload, out_dir, run_id)
+    if rule_timings_ms is not None:
+        payload["rule_timings_ms"] = rule_timings_ms
+    if near_duplicates is not None:
+        revalidate = True  # the written report must include the extra warns
+        start = perf_counter()
+        variants = [*app_data.variants, *extra_variants]
+        payload["warns"] = [*payload["warns"], *near_duplicate_warns(variants, near_duplicates)]
+        payload["timings_ms"]["near_duplicates"] = round((perf_counter() - start) * 1000, 2)
+    if token and not revalidate:
+        report_path = _write_memoized_report(payload, out_dir, run_id, token)
+    else:
+        report_path = _write_validation_report(payload, out_dir, run_id)
     payload["report_path"] = report_path
     return report, payload
 
@@ -77,13 +156,29 @@ def _raise_on_fatals(report, payload: dict[str, Any], run_id: str | None) -> Non
         )
 
 
-def validate_data(data_dir: str | Path = "data") -> dict[str, Any]:
+def validate_data(
+    data_dir: str | Path = "data",
+    *,
+    revalidate: bool = False,
+    rule_timings: bool = False,
+    near_duplicates: float | None = None,
+) -> dict[str, Any]:
+    """Validate the dataset.
+
+    ``rule_timings`` adds ``rule_timings_ms`` (per check, fresh run). ``near_duplicates``
+    is a similarity threshold: variants of the dataset and of all packs that are at least
+    that similar are reported as ``VARIANT_NEAR_DUPLICATE`` warns.
+    """
     app_data = load_app_data(data_dir)
     run_context = get_run_context()
     report, payload = _validate_app_data(
         app_data,
         run_context.out_dir if run_context else None,
         run_context.run_id if run_context else None,
+        revalidate=revalidate,
+        rule_timings=rule_timings,
+        near_duplicates=near_duplicates,
+        extra_variants=iter_pack_variants(data_dir) if near_duplicates is not None else (),
     )
     log_event(
         "validate",
@@ -99,6 +194,80 @@ def validate_data(data_dir: str | Path = "data") -> dict[str, Any]:
     return payload
 
 
+def validate_all_packs(
+    data_dir: str | Path = "data", *, max_workers: int | None = None
+) -> dict[str, Any]:
+    """Validate every pack under ``<data_dir>/packs`` in parallel; merged, ordered report."""
+    run_context = get_run_context()
+    payload = validate_packs(data_dir, max_workers=max_workers)
+    payload["report_path"] = _write_validation_report(
+        payload,
+        run_context.out_dir if run_context else None,
+        run_context.run_id if run_context else None,
+        name="validate-packs-report",
+    )
+    log_event(
+        "validate_packs",
+        run_id=run_context.run_id if run_context else None,
+        status=payload["status"],
+        packs=[pack["pack_id"] for pack in payload["packs"]],
+        fatals=len(payload["fatals"]),
+        warns=len(payload["warns"]),
+        report_path=payload["report_path"],
+        timings_ms=payload["timings_ms"],
+    )
+    return payload
+
+
+def validate_stream(
+    data_dir: str | Path = "data", variants_file: str | Path | None = None
+) -> Iterator[dict[str, Any]]:
+    """Stream-validate variants in bounded memory: issue records, then a summary record."""
+    run_context = get_run_context()
+    start = perf_counter()
+    for record in stream_validate_file(data_dir, variants_file):
+        if record["type"] == "summary":
+            log_event(
+                "validate_stream",
+                run_id=run_context.run_id if run_context else None,
+                variants_file=str(variants_file) if variants_file else None,
+                timings_ms={"validate": round((perf_counter() - start) * 1000, 2)},
+                **{key: value for key, value in record.items() if key != "type"},
+            )
+        yield record
+
+
+def compile_dataset(data_dir: str | Path = "data") -> dict[str, Any]:
+    """Compile ``data_dir`` into the artifact that `load_app_data` picks up on later calls."""
+    run_context = get_run_context()
+    run_id = run_context.run_id if run_context else None
+    start = perf_counter()
+    compiled = compile_app_data(data_dir)
+    duration_ms = (perf_counter() - start) * 1000
+    payload = _validation_payload(compiled.validation)
+    _raise_on_fatals(compiled.validation, payload, run_id)
+    artifact_path = compiled_path(data_dir)
+    write_compiled(artifact_path, compiled)
+    store_path = variant_store_path(data_dir)
+    write_variant_store(store_path, compiled.app_data.variants, compiled.compiled_ns)
+    summary = {
+        "artifact_path": str(artifact_path),
+        "format_version": compiled.format_version,
+        "compiled_at": compiled.compiled_at,
+        "dataset_version": compiled.app_data.meta.dataset_version,
+        "fingerprint": compiled.app_data.fingerprint,
+        "variants": len(compiled.app_data.variants),
+        "sources": len(compiled.sources),
+        "validation_status": compiled.validation.status,
+        "warns": len(compiled.validation.warns),
+        "size_bytes": artifact_path.stat().st_size,
+        "variant_store_path": str(store_path),
+        "timings_ms": {"compile": round(duration_ms, 2)},
+    }
+    log_event("compile", run_id=run_id, **summary)
+    return summary
+
+
 def _resolve_profile(profile_path: str | Path | None, profile_data: dict | None) -> dict:
     if profile_data is not None:
         return profile_data
@@ -118,6 +287,8 @@ def recommend_variants(
     top_n: int = 5,
     data_dir: str | Path = "data",
     profile_data: dict | None = None,
+    *,
+    revalidate: bool = False,
 ):
     app_data = load_app_data(data_dir)
     run_context = get_run_context()
@@ -125,6 +296,7 @@ def recommend_variants(
         app_data,
         run_context.out_dir if run_context else None,
         run_context.run_id if run_context else None,
+        revalidate=revalidate,
     )
     _raise_on_fatals(report, payload, run_context.run_id if run_context else None)
     profile = _resolve_profile(profile_path, profile_data)
@@ -137,17 +309,10 @@ def recommend_variants(
         objective,
         filters,
         top_n,
+        facts=variant_facts(app_data),
     )
     duration_ms = (perf_counter() - start) * 1000
-    diagnostics = dict(result.diagnostics)
-    diagnostics.setdefault("warnings", {})
-    if report.stale:
-        diagnostics["warnings"].setdefault("stale_rulepack", 0)
-        diagnostics["warnings"]["stale_rulepack"] += 1
-    diagnostics["timings_ms"] = {
-        "validate": payload["timings_ms"]["validate"],
-        "recommend": round(duration_ms, 2),
-    }
+    result = _with_run_diagnostics(result, report, payload, duration_ms)
     log_event(
         "recommend",
         run_id=run_context.run_id if run_context else None,
@@ -157,9 +322,22 @@ def recommend_variants(
         profile_hash=result.profile_hash,
         objective=objective,
         top_n=top_n,
-        timings_ms=diagnostics.get("timings_ms"),
-        filtered_out=diagnostics.get("filtered_out"),
+        timings_ms=result.diagnostics.get("timings_ms"),
+        filtered_out=result.diagnostics.get("filtered_out"),
     )
+    return result
+
+
+def _with_run_diagnostics(result, report, payload: dict[str, Any], duration_ms: float):
+    diagnostics = dict(result.diagnostics)
+    diagnostics.setdefault("warnings", {})
+    if report.stale:
+        diagnostics["warnings"].setdefault("stale_rulepack", 0)
+        diagnostics["warnings"]["stale_rulepack"] += 1
+    diagnostics["timings_ms"] = {
+        "validate": payload["timings_ms"]["validate"],
+        "recommend": round(duration_ms, 2),
+    }
     return result.__class__(
         ranked_variants=result.ranked_variants,
         diagnostics=diagnostics,
@@ -167,9 +345,157 @@ def recommend_variants(
     )
 
 
+# Per-worker state for `recommend_batch` and `classify_batch`: the dataset and its variant
+# facts, or the dataset and its compiled classifier.
+_BATCH_STATE: dict[str, Any] = {}
+
+
+def _init_batch_worker(app_data, as_of: date) -> None:
+    _BATCH_STATE["app_data"] = app_data
+    _BATCH_STATE["facts"] = variant_facts(app_data, as_of=as_of)
+
+
+def _recommend_chunk(
+    profiles: list[dict], objective: str, filters: dict | None, top_n: int
+) -> list[tuple[Any, float]]:
+    app_data = _BATCH_STATE["app_data"]
+    results = []
+    for profile in profiles:
+        start = perf_counter()
+        result = recommend(
+            profile,
+            app_data.variants,
+            app_data.rulepack,
+            app_data.meta.staleness_policy,
+            objective,
+            filters,
+            top_n,
+            facts=_BATCH_STATE["facts"],
+        )
+        results.append((result, (perf_counter() - start) * 1000))
+    return results
+
+
+def _init_classify_worker(app_data, classifier: Classifier) -> None:
+    _BATCH_STATE["app_data"] = app_data
+    _BATCH_STATE["classifier"] = classifier
+
+
+def _classify_chunk(texts: list[str], fuzzy: bool = False) -> list[Any]:
+    app_data = _BATCH_STATE["app_data"]
+    classifier = _BATCH_STATE["classifier"]
+    return classifier.classify_many(texts, app_data, fuzzy=fuzzy)
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    chunk: list[Any] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _map_chunks(
+    chunks: Iterator[list],
+    workers: int,
+    initializer: Any,
+    initargs: tuple,
+    func: Any,
+    *args: Any,
+) -> Iterator[list]:
+    """Run ``func(chunk, *args)`` over a process pool with a bounded window, in input order.
+
+    If the pool cannot start or breaks, the unfinished chunks are processed in-process.
+    """
+    pending: deque[tuple[list, Any]] = deque()
+    # A chunk taken from ``chunks`` whose submit has not succeeded yet.
+    unsubmitted: list | None = None
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=initializer, initargs=initargs
+            ) as executor:
+                for chunk in chunks:
+                    unsubmitted = chunk
+                    pending.append((chunk, executor.submit(func, chunk, *args)))
+                    unsubmitted = None
+                    if len(pending) >= workers * 2:
+                        yield pending[0][1].result()
+                        pending.popleft()
+                while pending:
+                    yield pending[0][1].result()
+                    pending.popleft()
+            return
+        except (OSError, BrokenProcessPool, NotImplementedError):
+            pass
+    initializer(*initargs)
+    for chunk, _future in pending:
+        yield func(chunk, *args)
+    if unsubmitted is not None:
+        yield func(unsubmitted, *args)
+    for chunk in chunks:
+        yield func(chunk, *args)
+
+
+def recommend_batch(
+    profiles: Iterable[dict],
+    objective: str = "fastest_money",
+    filters: dict | None = None,
+    top_n: int = 5,
+    data_dir: str | Path = "data",
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = 16,
+    revalidate: bool = False,
+) -> Iterator[RecommendationResult]:
+    """Recommend for many profiles, yielding results in input order as they complete.
+
+    The dataset is loaded and validated once; profiles are fanned out over a process pool
+    whose workers each build the variant facts once. ``max_workers=1`` runs in-process.
+    """
+    app_data = load_app_data(data_dir)
+    run_context = get_run_context()
+    run_id = run_context.run_id if run_context else None
+    report, payload = _validate_app_data(
+        app_data, run_context.out_dir if run_context else None, run_id, revalidate=revalidate
+    )
+    _raise_on_fatals(report, payload, run_id)
+    initargs = (app_data, date.today())
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    chunks = _chunks(profiles, max(chunk_size, 1))
+
+    batches = _map_chunks(
+        chunks, workers, _init_batch_worker, initargs, _recommend_chunk, objective, filters, top_n
+    )
+
+    count = 0
+    start = perf_counter()
+    for batch in batches:
+        for result, duration_ms in batch:
+            count += 1
+            yield _with_run_diagnostics(result, report, payload, duration_ms)
+    log_event(
+        "recommend_batch",
+        run_id=run_id,
+        dataset_version=payload["dataset_version"],
+        stale=payload["stale"],
+        profiles=count,
+        objective=objective,
+        top_n=top_n,
+        workers=workers,
+        timings_ms={"total": round((perf_counter() - start) * 1000, 2)},
+    )
+
+
 def classify_idea(
     idea_text: str,
     data_dir: str | Path = "data",
+    *,
+    revalidate: bool = False,
+    fuzzy: bool = False,
 ):
     app_data = load_app_data(data_dir)
     run_context = get_run_context()
@@ -177,10 +503,11 @@ def classify_idea(
         app_data,
         run_context.out_dir if run_context else None,
         run_context.run_id if run_context else None,
+        revalidate=revalidate,
     )
     _raise_on_fatals(report, payload, run_context.run_id if run_context else None)
 
-    result = classify_idea_text(idea_text, app_data=app_data, data_dir=data_dir)
+    result = classify_idea_text(idea_text, app_data=app_data, data_dir=data_dir, fuzzy=fuzzy)
     log_event(
         "classify",
         run_id=run_context.run_id if run_context else None,
@@ -193,11 +520,59 @@ def classify_idea(
     return result
 
 
+def classify_batch(
+    idea_texts: Iterable[str],
+    data_dir: str | Path = "data",
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = 64,
+    revalidate: bool = False,
+    fuzzy: bool = False,
+) -> Iterator[ClassifyResultV1]:
+    """Classify many idea texts, yielding results in input order as they complete.
+
+    The dataset is loaded and validated once and the keyword model compiled once; chunks
+    of texts are fanned out over a process pool. ``max_workers=1`` runs in-process.
+    """
+    app_data = load_app_data(data_dir)
+    run_context = get_run_context()
+    run_id = run_context.run_id if run_context else None
+    report, payload = _validate_app_data(
+        app_data, run_context.out_dir if run_context else None, run_id, revalidate=revalidate
+    )
+    _raise_on_fatals(report, payload, run_id)
+    initargs = (app_data, get_classifier(data_dir))
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    chunks = _chunks(idea_texts, max(chunk_size, 1))
+
+    count = 0
+    start = perf_counter()
+    for batch in _map_chunks(
+        chunks, workers, _init_classify_worker, initargs, _classify_chunk, fuzzy
+    ):
+        for result in batch:
+            count += 1
+            yield result
+    duration_ms = (perf_counter() - start) * 1000
+    log_event(
+        "classify_batch",
+        run_id=run_id,
+        dataset_version=payload["dataset_version"],
+        stale=payload["stale"],
+        ideas=count,
+        workers=workers,
+        ideas_per_second=round(count / (duration_ms / 1000), 1) if duration_ms else None,
+        timings_ms={"total": round(duration_ms, 2)},
+    )
+
+
 def plan_variant(
     profile_path: str | Path | None,
     variant_id: str,
     data_dir: str | Path = "data",
     profile_data: dict | None = None,
+    *,
+    revalidate: bool = False,
 ):
     app_data = load_app_data(data_dir)
     run_context = get_run_context()
@@ -205,6 +580,7 @@ def plan_variant(
         app_data,
         run_context.out_dir if run_context else None,
         run_context.run_id if run_context else None,
+        revalidate=revalidate,
     )
     _raise_on_fatals(report, payload, run_context.run_id if run_context else None)
     profile = _resolve_profile(profile_path, profile_data)
@@ -235,6 +611,8 @@ def export_bundle(
     out_dir: str | Path = "exports",
     data_dir: str | Path = "data",
     profile_data: dict | None = None,
+    *,
+    revalidate: bool = False,
 ) -> dict[str, str]:
     app_data = load_app_data(data_dir)
     run_context = get_run_context()
@@ -242,6 +620,7 @@ def export_bundle(
         app_data,
         run_context.out_dir if run_context else None,
         run_context.run_id if run_context else None,
+        revalidate=revalidate,
     )
     _raise_on_fatals(report, payload, run_context.run_id if run_context else None)
     profile = _resolve_profile(profile_path, profile_data)
@@ -262,6 +641,7 @@ def export_bundle(
         "fastest_money",
         {},
         len(app_data.variants),
+        facts=variant_facts(app_data),
     )
     rec_duration_ms = (perf_counter() - rec_start) * 1000
     diagnostics = dict(recommendations.diagnostics)
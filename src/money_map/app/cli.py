@@ -8,18 +8,26 @@ import os
 import socket
 import subprocess
 import sys
+import time
+from collections import deque
 from dataclasses import asdict
 from pathlib import Path
+from typing import Iterator
 from uuid import uuid4
 
 import typer
 
 from money_map.app.api import (
+    classify_batch,
     classify_idea,
+    compile_dataset,
     export_bundle,
     plan_variant,
+    recommend_batch,
     recommend_variants,
+    validate_all_packs,
     validate_data,
+    validate_stream,
 )
 from money_map.app.observability import get_run_context, init_run_context, log_exception
 from money_map.core.errors import DataValidationError, InternalError, MoneyMapError
@@ -70,6 +78,14 @@ def _format_report(report: dict) -> str:
     if report["warns"]:
         lines.append("WARNS:")
         lines.extend([f"- {warn}" for warn in warn_codes])
+    near_duplicates = [
+        issue["message"]
+        for issue in report["warns"]
+        if issue.get("code") == "VARIANT_NEAR_DUPLICATE"
+    ]
+    if near_duplicates:
+        lines.append("NEAR DUPLICATES:")
+        lines.extend(f"- {message}" for message in near_duplicates)
     staleness = report.get("staleness", {})
     if staleness:
         lines.append("STALENESS:")
@@ -85,6 +101,13 @@ def _format_report(report: dict) -> str:
     return "\n".join(lines)
 
 
+def _format_rule_timings(timings_ms: dict[str, float]) -> str:
+    lines = ["RULE TIMINGS (ms):"]
+    for code, elapsed in sorted(timings_ms.items(), key=lambda item: -item[1]):
+        lines.append(f"- {code}: {elapsed:.3f}")
+    return "\n".join(lines)
+
+
 def _render_error(err: MoneyMapError) -> None:
     run_id = err.run_id or (get_run_context().run_id if get_run_context() else "unknown")
     typer.echo(f"[ERROR {err.code}] {err.message} (run_id={run_id})", err=True)
@@ -134,12 +157,56 @@ def _summarize_legal_reasons(checklist: list[str]) -> str | None:
 @app.command()
 def validate(
     data_dir: str = typer.Option("data", "--data-dir", "--data", help="Data directory"),
+    revalidate: bool = typer.Option(
+        False, "--revalidate", help="Ignore memoized validation results and validate again"
+    ),
+    stream: bool = typer.Option(
+        False, "--stream", help="Check variants one record at a time and print NDJSON issues"
+    ),
+    variants_file: str | None = typer.Option(
+        None, "--variants", help="Variants file to stream (YAML or JSONL); with --stream"
+    ),
+    rule_timings: bool = typer.Option(
+        False, "--rule-timings", help="Validate afresh and print the time spent per check"
+    ),
+    all_packs: bool = typer.Option(
+        False, "--all-packs", help="Validate every pack under <data-dir>/packs in parallel"
+    ),
+    workers: int | None = typer.Option(
+        None, "--workers", help="Worker processes for --all-packs (default: CPU count)"
+    ),
+    near_duplicates: bool = typer.Option(
+        False, "--near-duplicates", help="Also report near-identical variants (dataset and packs)"
+    ),
+    similarity: float = typer.Option(
+        0.8, "--similarity", min=0.01, max=1.0, help="Similarity threshold for --near-duplicates"
+    ),
 ) -> None:
     """Validate datasets and rules."""
     run_context = init_run_context("validate", data_dir)
+    if all_packs:
+        _validate_packs_command(run_context, data_dir, workers)
+        return
+    if stream:
+        _validate_stream_command(run_context, data_dir, variants_file)
+        return
     try:
-        report = validate_data(data_dir)
+        if variants_file:
+            raise MoneyMapError(
+                code="INVALID_OPTION",
+                message="--variants is only supported together with --stream.",
+                hint="Add --stream or drop --variants.",
+                run_id=run_context.run_id,
+            )
+        report = validate_data(
+            data_dir,
+            revalidate=revalidate,
+            rule_timings=rule_timings,
+            near_duplicates=similarity if near_duplicates else None,
+        )
         typer.echo(_format_report(report))
+        if rule_timings:
+            typer.echo(_format_rule_timings(report["rule_timings_ms"]))
         if report["fatals"]:
             fatal_codes = _issue_codes(report["fatals"])
             error = DataValidationError(
@@ -165,6 +232,156 @@ def validate(
         raise typer.Exit(code=1)
 
 
+def _validate_stream_command(run_context, data_dir: str, variants_file: str | None) -> None:
+    """Print one NDJSON record per issue and a final summary; exit 1 on fatals."""
+    status = None
+    try:
+        for record in validate_stream(data_dir, variants_file):
+            typer.echo(json.dumps(record, ensure_ascii=False, default=str))
+            status = record.get("status")
+    except MoneyMapError as exc:
+        _render_error(exc)
+        raise typer.Exit(code=1)
+    except Exception as exc:
+        error = InternalError(
+            message=str(exc) or "Unexpected error",
+            hint="Check logs for details.",
+            run_id=run_context.run_id,
+        )
+        _render_error(error)
+        log_exception("Unhandled validate --stream exception", run_id=run_context.run_id)
+        raise typer.Exit(code=1)
+    if status == "invalid":
+        raise typer.Exit(code=1)
+
+
+def _format_packs_report(report: dict) -> str:
+    lines = [
+        "packs validation report",
+        f"status: {report['status']}",
+        f"packs: {len(report['packs'])}",
+        f"fatals: {len(report['fatals'])}",
+        f"warns: {len(report['warns'])}",
+    ]
+    for pack in report["packs"]:
+        lines.append(
+            f"- {pack['pack_id']}: {pack['status']} "
+            f"(fatals={len(pack['fatals'])}, warns={len(pack['warns'])}, "
+            f"variants={pack['counts']['variants']}, {pack['timings_ms']['total']:.1f} ms)"
+        )
+    if report["fatals"]:
+        lines.append("FATALS:")
+        lines.extend(f"- {issue['pack']}: {issue['code']}" for issue in report["fatals"])
+    if report["warns"]:
+        lines.append("WARNS:")
+        lines.extend(f"- {issue['pack']}: {issue['code']}" for issue in report["warns"])
+    lines.append(f"total_ms: {report['timings_ms']['total']:.1f}")
+    return "\n".join(lines)
+
+
+def _validate_packs_command(run_context, data_dir: str, workers: int | None) -> None:
+    """Print the merged packs report; exit 1 on fatals."""
+    try:
+        report = validate_all_packs(data_dir, max_workers=workers)
+        typer.echo(_format_packs_report(report))
+    except MoneyMapError as exc:
+        _render_error(exc)
+        raise typer.Exit(code=1)
+    except Exception as exc:
+        error = InternalError(
+            message=str(exc) or "Unexpected error",
+            hint="Check logs for details.",
+            run_id=run_context.run_id,
+        )
+        _render_error(error)
+        log_exception("Unhandled validate --all-packs exception", run_id=run_context.run_id)
+        raise typer.Exit(code=1)
+    if report["fatals"]:
+        raise typer.Exit(code=1)
+
+
+@app.command("compile")
+def compile_command(
+    data_dir: str = typer.Option("data", "--data-dir", "--data", help="Data directory"),
+) -> None:
+    """Compile the data directory into an artifact that loads without parsing YAML."""
+    run_context = init_run_context("compile", data_dir)
+    try:
+        summary = compile_dataset(data_dir)
+        typer.echo(f"Compiled {summary['artifact_path']}")
+        typer.echo(f"variant store: {summary['variant_store_path']}")
+        typer.echo(f"dataset_version: {summary['dataset_version']}")
+        typer.echo(f"variants: {summary['variants']} | sources: {summary['sources']}")
+        typer.echo(f"validation: {summary['validation_status']} | warns: {summary['warns']}")
+        typer.echo(f"size_bytes: {summary['size_bytes']}")
+    except MoneyMapError as exc:
+        _render_error(exc)
+        raise typer.Exit(code=1)
+    except Exception as exc:
+        error = InternalError(
+            message=str(exc) or "Unexpected error",
+            hint="Check logs for details.",
+            run_id=run_context.run_id,
+        )
+        _render_error(error)
+        log_exception("Unhandled compile exception", run_id=run_context.run_id)
+        raise typer.Exit(code=1)
+
+
+def _recommendation_payloads(result) -> list[dict]:
+    return [
+        {
+            "variant_id": rec.variant.variant_id,
+            "score": rec.score,
+            "title": rec.variant.title,
+            "pros": rec.pros,
+            "cons": rec.cons,
+            "explanations": {
+                "pros": rec.pros,
+                "cons": rec.cons,
+                "legal_checklist": rec.legal.checklist,
+            },
+            "stale": rec.stale,
+            "staleness": rec.staleness,
+            "legal_gate": rec.legal.legal_gate,
+            "legal_checklist": rec.legal.checklist,
+            "applied_rules": [asdict(rule) for rule in rec.legal.applied_rules],
+        }
+        for rec in result.ranked_variants
+    ]
+
+
+def _read_profiles_jsonl(path: Path, run_id: str) -> Iterator[dict]:
+    """Yield one profile per non-blank line, failing on the first line that is not an object."""
+    try:
+        handle = path.open(encoding="utf-8")
+    except OSError as exc:
+        raise MoneyMapError(
+            code="PROFILES_NOT_FOUND",
+            message=f"Cannot read profiles file {path}.",
+            hint="Pass an existing JSONL file with one profile object per line.",
+            details=str(exc),
+            run_id=run_id,
+        ) from exc
+    with handle:
+        for line_no, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                profile = json.loads(line)
+            except json.JSONDecodeError as exc:
+                profile = exc
+            if not isinstance(profile, dict):
+                raise MoneyMapError(
+                    code="INVALID_PROFILES_JSONL",
+                    message=f"Line {line_no} of {path} is not a JSON object.",
+                    hint="Write one JSON profile object per line.",
+                    details=str(profile) if isinstance(profile, Exception) else None,
+                    run_id=run_id,
+                )
+            yield profile
+
+
 @app.command()
 def recommend(
     profile: str = typer.Option(..., "--profile", help="Path to profile YAML"),
@@ -192,26 +409,7 @@ def recommend(
             "objective": objective,
             "top_n": top,
             "profile_hash": result.profile_hash,
-            "recommendations": [
-                {
-                    "variant_id": rec.variant.variant_id,
-                    "score": rec.score,
-                    "title": rec.variant.title,
-                    "pros": rec.pros,
-                    "cons": rec.cons,
-                    "explanations": {
-                        "pros": rec.pros,
-                        "cons": rec.cons,
-                        "legal_checklist": rec.legal.checklist,
-                    },
-                    "stale": rec.stale,
-                    "staleness": rec.staleness,
-                    "legal_gate": rec.legal.legal_gate,
-                    "legal_checklist": rec.legal.checklist,
-                    "applied_rules": [asdict(rule) for rule in rec.legal.applied_rules],
-                }
-                for rec in result.ranked_variants
-            ],
+            "recommendations": _recommendation_payloads(result),
             "diagnostics": result.diagnostics,
         }
 
@@ -258,16 +456,76 @@ def recommend(
         raise typer.Exit(code=1)
 
 
+@app.command("recommend-batch")
+def recommend_batch_command(
+    profiles_jsonl: Path = typer.Option(
+        ..., "--profiles-jsonl", help="JSONL file with one profile object per line"
+    ),
+    top: int = typer.Option(5, "--top", help="Top N variants"),
+    objective: str = typer.Option("fastest_money", "--objective", help="Objective preset"),
+    data_dir: str = typer.Option("data", "--data-dir", "--data", help="Data directory"),
+    output_path: str | None = typer.Option(None, "--output", help="Write JSONL to file"),
+    workers: int | None = typer.Option(
+        None, "--workers", help="Worker processes (default: CPU count, 1 = in-process)"
+    ),
+) -> None:
+    """Recommend for every profile in a JSONL file, streaming one JSON line per profile."""
+    run_context = init_run_context("recommend_batch", data_dir)
+    try:
+        profiles = _read_profiles_jsonl(profiles_jsonl, run_context.run_id)
+        results = recommend_batch(
+            profiles, objective=objective, top_n=top, data_dir=data_dir, max_workers=workers
+        )
+        handle = open(output_path, "w", encoding="utf-8") if output_path else None
+        try:
+            for index, result in enumerate(results):
+                line = json.dumps(
+                    {
+                        "index": index,
+                        "run_id": run_context.run_id,
+                        "objective": objective,
+                        "top_n": top,
+                        "profile_hash": result.profile_hash,
+                        "recommendations": _recommendation_payloads(result),
+                        "diagnostics": result.diagnostics,
+                    },
+                    ensure_ascii=False,
+                    default=str,
+                )
+                if handle is not None:
+                    handle.write(line + "\n")
+                else:
+                    typer.echo(line)
+        finally:
+            if handle is not None:
+                handle.close()
+    except MoneyMapError as exc:
+        _render_error(exc)
+        raise typer.Exit(code=1)
+    except Exception as exc:
+        error = InternalError(
+            message=str(exc) or "Unexpected error",
+            hint="Check logs for details.",
+            run_id=run_context.run_id,
+        )
+        _render_error(error)
+        log_exception("Unhandled recommend-batch exception", run_id=run_context.run_id)
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def classify(
     idea_text: str = typer.Option(..., "--idea-text", help="Free-text idea to classify"),
     data_dir: str = typer.Option("data", "--data-dir", "--data", help="Data directory"),
     output_format: str = typer.Option("text", "--format", help="Output format: text or json"),
+    fuzzy: bool = typer.Option(
+        False, "--fuzzy", help="Also match compounds and inflections of keywords"
+    ),
 ) -> None:
     """Classify idea text into taxonomy + cell with deterministic explanations."""
     run_context = init_run_context("classify", data_dir)
     try:
-        result = classify_idea(idea_text=idea_text, data_dir=data_dir)
+        result = classify_idea(idea_text=idea_text, data_dir=data_dir, fuzzy=fuzzy)
         output_format = output_format.strip().lower()
         if output_format not in {"text", "json"}:
             raise MoneyMapError(
@@ -328,6 +586,99 @@ def classify(
         raise typer.Exit(code=1)
 
 
+def _read_ideas_jsonl(path: Path, run_id: str, ids: deque) -> Iterator[str]:
+    """Yield the idea text of each non-blank line; its ``id`` (if any) is appended to ``ids``.
+
+    A line is a JSON string or an object with ``idea_text`` (or ``text``).
+    """
+    try:
+        handle = path.open(encoding="utf-8")
+    except OSError as exc:
+        raise MoneyMapError(
+            code="IDEAS_NOT_FOUND",
+            message=f"Cannot read ideas file {path}.",
+            hint="Pass an existing JSONL file with one idea per line.",
+            details=str(exc),
+            run_id=run_id,
+        ) from exc
+    with handle:
+        for line_no, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                record = exc
+            if isinstance(record, dict):
+                text = record.get("idea_text", record.get("text"))
+                record_id = record.get("id")
+            else:
+                text, record_id = record, None
+            if not isinstance(text, str):
+                raise MoneyMapError(
+                    code="INVALID_IDEAS_JSONL",
+                    message=f"Line {line_no} of {path} has no idea text.",
+                    hint='Write one JSON string or {"idea_text": ...} object per line.',
+                    details=str(record) if isinstance(record, Exception) else None,
+                    run_id=run_id,
+                )
+            ids.append(record_id)
+            yield text
+
+
+@app.command("classify-batch")
+def classify_batch_command(
+    ideas_path: Path = typer.Option(..., "--in", help="JSONL file with one idea per line"),
+    output_path: str | None = typer.Option(
+        None, "--out", "--output", help="Write JSONL results to file"
+    ),
+    data_dir: str = typer.Option("data", "--data-dir", "--data", help="Data directory"),
+    workers: int | None = typer.Option(
+        None, "--workers", help="Worker processes (default: CPU count, 1 = in-process)"
+    ),
+    fuzzy: bool = typer.Option(
+        False, "--fuzzy", help="Also match compounds and inflections of keywords"
+    ),
+) -> None:
+    """Classify every idea in a JSONL file, streaming one ClassifyResultV1 line per idea."""
+    run_context = init_run_context("classify_batch", data_dir)
+    try:
+        ids: deque = deque()
+        ideas = _read_ideas_jsonl(ideas_path, run_context.run_id, ids)
+        start = time.perf_counter()
+        count = 0
+        handle = open(output_path, "w", encoding="utf-8") if output_path else None
+        try:
+            for index, result in enumerate(
+                classify_batch(ideas, data_dir=data_dir, max_workers=workers, fuzzy=fuzzy)
+            ):
+                record = {"index": index, "id": ids.popleft(), "run_id": run_context.run_id}
+                line = json.dumps({**record, **asdict(result)}, ensure_ascii=False, default=str)
+                if handle is not None:
+                    handle.write(line + "\n")
+                else:
+                    typer.echo(line)
+                count = index + 1
+        finally:
+            if handle is not None:
+                handle.close()
+        elapsed = time.perf_counter() - start
+        rate = count / elapsed if elapsed else 0.0
+        typer.echo(f"classified {count} ideas in {elapsed:.2f}s ({rate:.1f} ideas/s)", err=True)
+    except MoneyMapError as exc:
+        _render_error(exc)
+        raise typer.Exit(code=1)
+    except Exception as exc:
+        error = InternalError(
+            message=str(exc) or "Unexpected error",
+            hint="Check logs for details.",
+            run_id=run_context.run_id,
+        )
+        _render_error(error)
+        log_exception("Unhandled classify-batch exception", run_id=run_context.run_id)
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def plan(
     profile: str = typer.Option(..., "--profile", help="Path to profile YAML"),
@@ -0,0 +1,302 @@
+"""Concurrent, paginated Jobsuche ingestion.
+
+Every page of every (``was``, ``wo``) query is fetched over a bounded thread pool. All
+requests share one token-bucket rate limit. Connection errors, HTTP 429 and 5xx responses
+are retried with exponential backoff, and each worker thread keeps one keep-alive
+connection per host.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import math
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+from urllib.parse import urlencode, urlsplit
+
+DEFAULT_ENDPOINT = "https://rest.arbeitsagentur.de/jobboerse/jobsuche-service/pc/v4/jobs"
+DEFAULT_API_KEY = "jobboerse-jobsuche"
+DEFAULT_MAX_PAGES = 100
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class JobsucheError(Exception):
+    """A page could not be fetched (non-retryable status or retries exhausted)."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(frozen=True)
+class JobQuery:
+    was: str = ""
+    wo: str = ""
+
+    def label(self) -> str:
+        return f"was={self.was!r} wo={self.wo!r}"
+
+
+@dataclass(frozen=True)
+class QueryProgress:
+    query: JobQuery
+    pages_done: int
+    pages_total: int | None  # None until the result count is known
+    jobs: int
+    retries: int
+
+
+@dataclass
+class QueryResult:
+    query: JobQuery
+    jobs: list[dict[str, Any]] = field(default_factory=list)
+    pages: int = 0
+    total: int | None = None  # ``maxErgebnisse`` reported by the API
+    retries: int = 0
+    error: str | None = None
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, bursts of up to ``capacity``."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available; returns the time waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+def extract_jobs(payload: Any) -> list[dict[str, Any]]:
+    if isinstance(payload, list):
+        return [item for item in payload if isinstance(item, dict)]
+    if isinstance(payload, dict):
+        for key in ("stellenangebote", "jobs", "items", "results"):
+            items = payload.get(key)
+            if isinstance(items, list):
+                return [item for item in items if isinstance(item, dict)]
+    raise JobsucheError(
+        "Unexpected Jobsuche response format: expected list or dict with jobs array"
+    )
+
+
+def _total(payload: Any) -> int | None:
+    if isinstance(payload, dict):
+        value = payload.get("maxErgebnisse")
+        if isinstance(value, (int, str)) and str(value).isdigit():
+            return int(value)
+    return None
+
+
+class JobsucheClient:
+    """Fetches single result pages, reusing one keep-alive connection per thread and host."""
+
+    def __init__(
+        self,
+        endpoint: str = DEFAULT_ENDPOINT,
+        *,
+        api_key: str = DEFAULT_API_KEY,
+        timeout_s: float = 30.0,
+        limiter: TokenBucket | None = None,
+        max_retries: int = 4,
+        backoff_s: float = 0.5,
+        max_backoff_s: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        parts = urlsplit(endpoint)
+        if parts.scheme not in {"http", "https"}:
+            raise ValueError(f"Unsupported endpoint scheme: {endpoint}")
+        self.endpoint = endpoint
+        self._scheme = parts.scheme
+        self._host = parts.netloc
+        self._path = parts.path or "/"
+        self._headers = {"X-API-Key": api_key, "Accept": "application/json"}
+        self.timeout_s = timeout_s
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self._sleep = sleep
+        self._local = threading.local()
+        self._connections: list[http.client.HTTPConnection] = []
+        self._connections_lock = threading.Lock()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            factory = (
+                http.client.HTTPSConnection
+                if self._scheme == "https"
+                else http.client.HTTPConnection
+            )
+            connection = factory(self._host, timeout=self.timeout_s)
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def _drop_connection(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def close(self) -> None:
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+    def _backoff(self, attempt: int, retry_after: str | None) -> float:
+        if retry_after and retry_after.strip().isdigit():
+            return min(float(retry_after), self.max_backoff_s)
+        delay = min(self.backoff_s * 2**attempt, self.max_backoff_s)
+        # Equal jitter keeps concurrent workers from retrying in lockstep.
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def fetch_page(self, params: dict[str, Any]) -> tuple[Any, int]:
+        """GET one page; returns the decoded payload and the number of retries it took."""
+        target = f"{self._path}?{urlencode(params)}"
+        failure = JobsucheError(f"No attempt made for {target}")
+        for attempt in range(max(self.max_retries, 0) + 1):
+            if self.limiter is not None:
+                self.limiter.acquire()
+            retry_after = None
+            try:
+                connection = self._connection()
+                connection.request("GET", target, headers=self._headers)
+                response = connection.getresponse()
+                body = response.read()
+                if response.status == 200:
+                    try:
+                        return json.loads(body.decode("utf-8")), attempt
+                    except ValueError as exc:
+                        raise JobsucheError(f"Invalid JSON for {target}: {exc}") from exc
+                if response.status not in RETRY_STATUSES:
+                    raise JobsucheError(
+                        f"HTTP {response.status} for {target}", status=response.status
+                    )
+                retry_after = response.getheader("Retry-After")
+                failure = JobsucheError(f"HTTP {response.status} for {target}", response.status)
+                if response.getheader("Connection", "").lower() == "close":
+                    self._drop_connection()
+            except (OSError, http.client.HTTPException) as exc:
+                self._drop_connection()
+                failure = JobsucheError(f"{type(exc).__name__}: {exc} for {target}")
+            if attempt < self.max_retries:
+                self._sleep(self._backoff(attempt, retry_after))
+        raise JobsucheError(
+            f"Giving up after {self.max_retries + 1} attempts: {failure}", failure.status
+        )
+
+
+def ingest_queries(
+    queries: Iterable[JobQuery],
+    client: JobsucheClient,
+    *,
+    params: dict[str, Any] | None = None,
+    page_size: int = 50,
+    start_page: int = 1,
+    max_pages: int = DEFAULT_MAX_PAGES,
+    workers: int = 4,
+    on_progress: Callable[[QueryProgress], None] | None = None,
+) -> list[QueryResult]:
+    """Fetch every page of every query concurrently; results keep the query order.
+
+    The first page of a query reports ``maxErgebnisse``; the remaining pages (at most
+    ``max_pages`` in total) are then fetched in parallel. Without a reported total, pages
+    are walked one after another until a short page. A failed page marks its query with
+    an ``error`` but does not stop the other queries. ``on_progress`` is called from the
+    calling thread after every page.
+    """
+    results = {query: QueryResult(query) for query in dict.fromkeys(queries)}
+    pages: dict[JobQuery, dict[int, list[dict[str, Any]]]] = {query: {} for query in results}
+    # Last page to fetch per query, once the first page has reported the result count.
+    planned: dict[JobQuery, int | None] = {query: None for query in results}
+    last_page = start_page + max(max_pages, 1) - 1
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        pending: dict[Future, tuple[JobQuery, int]] = {}
+
+        def _submit(query: JobQuery, page: int) -> None:
+            page_params = {
+                **(params or {}),
+                "was": query.was,
+                "wo": query.wo,
+                "size": page_size,
+                "page": page,
+            }
+            pending[executor.submit(client.fetch_page, page_params)] = (query, page)
+
+        for query in results:
+            _submit(query, start_page)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                query, page = pending.pop(future)
+                result = results[query]
+                try:
+                    payload, retries = future.result()
+                    jobs = extract_jobs(payload)
+                except JobsucheError as exc:
+                    result.error = result.error or f"page {page}: {exc}"
+                    continue
+                pages[query][page] = jobs
+                result.pages += 1
+                result.retries += retries
+                if page == start_page:
+                    result.total = _total(payload)
+                    if result.total is not None:
+                        available = start_page + math.ceil(result.total / page_size) - 1
+                        planned[query] = min(last_page, max(available, start_page))
+                        for next_page in range(start_page + 1, planned[query] + 1):
+                            _submit(query, next_page)
+                if planned[query] is None and len(jobs) >= page_size and page < last_page:
+                    _submit(query, page + 1)
+                if on_progress is not None:
+                    on_progress(
+                        QueryProgress(
+                            query=query,
+                            pages_done=result.pages,
+                            pages_total=(
+                                None if planned[query] is None else planned[query] - start_page + 1
+                            ),
+                            jobs=sum(len(items) for items in pages[query].values()),
+                            retries=result.retries,
+                        )
+                    )
+
+    for query, result in results.items():
+        result.jobs = [job for page in sorted(pages[query]) for job in pages[query][page]]
+    return list(results.values())
@@ -0,0 +1,268 @@
+"""Compiled on-disk cache for loaded datasets."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from money_map import __version__
+
+CACHE_DIR_ENV = "MONEY_MAP_CACHE_DIR"
+DISABLE_CACHE_ENV = "MONEY_MAP_DISABLE_CACHE"
+MAX_BYTES_ENV = "MONEY_MAP_CACHE_MAX_MB"
+MAX_AGE_ENV = "MONEY_MAP_CACHE_MAX_AGE_DAYS"
+DEFAULT_CACHE_DIR = Path(".money_map_cache")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_AGE_S = 30 * 24 * 3600
+CACHE_FORMAT_VERSION = 3
+
+# Files modified this close to the cache write time are re-hashed instead of trusting
+# mtime/size, so coarse filesystem timestamps cannot hide a same-size rewrite.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class SourceFingerprint:
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+def cache_enabled() -> bool:
+    flag = os.getenv(DISABLE_CACHE_ENV, "").strip().lower()
+    return flag not in {"1", "true", "yes", "on"}
+
+
+def cache_dir() -> Path:
+    override = os.getenv(CACHE_DIR_ENV, "").strip()
+    return Path(override) if override else DEFAULT_CACHE_DIR
+
+
+def _env_number(name: str, default: float, scale: float) -> float:
+    raw = os.getenv(name, "").strip()
+    try:
+        return float(raw) * scale if raw else default
+    except ValueError:
+        return default
+
+
+def prune_cache(
+    directory: Path | None = None,
+    *,
+    max_bytes: float | None = None,
+    max_age_s: float | None = None,
+) -> int:
+    """Delete cache files unused for ``max_age_s``, then the least recently used ones
+    until the directory holds at most ``max_bytes``; returns the number removed.
+
+    Limits default to `MONEY_MAP_CACHE_MAX_MB` / `MONEY_MAP_CACHE_MAX_AGE_DAYS`.
+    """
+    directory = directory or cache_dir()
+    if max_bytes is None:
+        max_bytes = _env_number(MAX_BYTES_ENV, DEFAULT_MAX_BYTES, 1024 * 1024)
+    if max_age_s is None:
+        max_age_s = _env_number(MAX_AGE_ENV, DEFAULT_MAX_AGE_S, 24 * 3600)
+    try:
+        candidates = [path for path in directory.iterdir() if path.is_file()]
+    except OSError:
+        return 0
+    entries = []
+    for path in candidates:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort(key=lambda item: item[0])  # least recently used first
+    cutoff = time.time() - max_age_s
+    total = sum(size for _mtime, size, _path in entries)
+    removed = 0
+    for mtime, size, path in entries:
+        if mtime >= cutoff and total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_racy(mtime_ns: int, written_ns: int) -> bool:
+    """True when a file changed too close to ``written_ns`` for mtime/size to be trusted."""
+    return mtime_ns >= written_ns - _RACY_WINDOW_NS
+
+
+def fingerprint_file(path: Path) -> SourceFingerprint:
+    stat = path.stat()
+    return SourceFingerprint(
+        path=path.resolve().as_posix(),
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        sha256=file_sha256(path),
+    )
+
+
+def fingerprint_files(paths: list[Path]) -> list[SourceFingerprint]:
+    return [fingerprint_file(path) for path in paths]
+
+
+def dataset_fingerprint(fingerprints: list[SourceFingerprint]) -> str:
+    """Stable identifier of a loaded dataset (source paths, contents and mtimes)."""
+    payload = json.dumps(
+        {
+            "cwd": Path.cwd().as_posix(),
+            "sources": [[fp.path, fp.size, fp.mtime_ns, fp.sha256] for fp in fingerprints],
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cache_key(data_dir: Path, kind: str) -> str:
+    payload = "|".join(
+        [
+            kind,
+            data_dir.resolve().as_posix(),
+            Path.cwd().as_posix(),
+            str(CACHE_FORMAT_VERSION),
+            __version__,
+            f"{sys.version_info[0]}.{sys.version_info[1]}",
+        ]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:20]
+
+
+def cache_path(data_dir: str | Path, kind: str = "appdata") -> Path:
+    return cache_dir() / f"{kind}-{_cache_key(Path(data_dir), kind)}.pickle"
+
+
+def sources_unchanged(
+    fingerprints: list[SourceFingerprint],
+    paths: list[Path],
+    created_ns: int,
+) -> bool:
+    """Check recorded fingerprints against the current files using stat, hashing only racy files."""
+    current = [path.resolve().as_posix() for path in paths]
+    if current != [fp.path for fp in fingerprints]:
+        return False
+    for path, recorded in zip(paths, fingerprints):
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if stat.st_size != recorded.size or stat.st_mtime_ns != recorded.mtime_ns:
+            return False
+        if is_racy(stat.st_mtime_ns, created_ns) and file_sha256(path) != recorded.sha256:
+            return False
+    return True
+
+
+def read_entry(path: Path) -> dict[str, Any] | None:
+    try:
+        with path.open("rb") as fh:
+            entry = pickle.load(fh)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError):
+        return None
+    if not isinstance(entry, dict) or entry.get("format") != CACHE_FORMAT_VERSION:
+        return None
+    try:
+        os.utime(path)  # mtime tracks the last use, which `prune_cache` evicts by
+    except OSError:
+        pass
+    return entry
+
+
+def write_entry(path: Path, entry: dict[str, Any]) -> bool:
+    """Atomically write a cache entry; cache failures never break loading."""
+    payload = {"format": CACHE_FORMAT_VERSION, "created_ns": time.time_ns(), **entry}
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as fh:
+            pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
+    prune_cache(path.parent)
+    return True
+
+
+def load_cached(data_dir: str | Path, paths: list[Path], kind: str = "appdata") -> Any | None:
+    """Return the cached payload for ``data_dir`` if every source file is unchanged."""
+    if not cache_enabled():
+        return None
+    entry = read_entry(cache_path(data_dir, kind))
+    if entry is None:
+        return None
+    fingerprints = entry.get("sources") or []
+    if not sources_unchanged(fingerprints, paths, int(entry.get("created_ns", 0))):
+        return None
+    return entry.get("payload")
+
+
+def store_cached(
+    data_dir: str | Path,
+    fingerprints: list[SourceFingerprint],
+    payload: Any,
+    kind: str = "appdata",
+) -> bool:
+    if not cache_enabled():
+        return False
+    return write_entry(cache_path(data_dir, kind), {"sources": fingerprints, "payload": payload})
+
+
+def load_index(data_dir: str | Path, kind: str) -> dict[Any, Any]:
+    """Read a persisted sidecar index (e.g. per-file registry headers keyed by content hash)."""
+    if not cache_enabled():
+        return {}
+    entry = read_entry(cache_path(data_dir, kind))
+    payload = entry.get("payload") if entry else None
+    return payload if isinstance(payload, dict) else {}
+
+
+def store_index(data_dir: str | Path, kind: str, index: dict[Any, Any]) -> bool:
+    if not cache_enabled():
+        return False
+    return write_entry(cache_path(data_dir, kind), {"payload": index})
+
+
+def keyed_cache_path(kind: str, key: str) -> Path:
+    return cache_dir() / f"{kind}-{key[:20]}.pickle"
+
+
+def load_keyed(kind: str, key: str) -> Any | None:
+    """Return the payload stored under a content-derived ``key`` (no source-file check)."""
+    if not cache_enabled() or not key:
+        return None
+    entry = read_entry(keyed_cache_path(kind, key))
+    if entry is None or entry.get("key") != key:
+        return None
+    return entry.get("payload")
+
+
+def store_keyed(kind: str, key: str, payload: Any) -> bool:
+    if not cache_enabled() or not key:
+        return False
+    return write_entry(keyed_cache_path(kind, key), {"key": key, "payload": payload})
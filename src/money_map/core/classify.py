@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import math
 import re
-from collections import defaultdict
+from collections import deque
+from dataclasses import replace
+from datetime import date
 from pathlib import Path
+from typing import Any
 
 from money_map.core.model import (
     AppData,
@@ -14,11 +18,18 @@ from money_map.core.model import (
     LegalContract,
     MiniVariantCard,
     StalenessContract,
+    Variant,
 )
 from money_map.core.staleness import evaluate_staleness
 from money_map.storage.fs import read_mapping
 
 _TOKEN_PATTERN = re.compile(r"[\w€]+", re.UNICODE)
+_SAMPLE_SIZE = 5
+# Fuzzy stage: a term hits a token when this share of the term's character trigrams
+# occurs in the token; fuzzy hits score at FUZZY_WEIGHT of an exact hit.
+FUZZY_THRESHOLD = 0.8
+FUZZY_WEIGHT = 0.5
+_FUZZY_MIN_LENGTH = 5
 
 
 def _normalize_text(idea_text: str) -> str:
@@ -27,10 +38,8 @@ def _normalize_text(idea_text: str) -> str:
     return cleaned
 
 
-def _tokens_and_ngrams(normalized_text: str) -> list[str]:
-    tokens = _TOKEN_PATTERN.findall(normalized_text)
-    bigrams = [f"{tokens[idx]} {tokens[idx + 1]}" for idx in range(len(tokens) - 1)]
-    return tokens + bigrams
+def _tokens(normalized_text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(normalized_text)
 
 
 def _load_keywords(data_dir: str | Path) -> dict[str, dict]:
@@ -73,115 +82,594 @@ def _variant_cell_from_tags(tags: list[str]) -> str:
     return "A1"
 
 
-def _extract_signals(
-    phrases: list[str], keywords: dict[str, dict], mappings: dict[str, dict]
-) -> tuple[list[str], dict[str, float], dict[str, float], dict[str, str | None]]:
-    taxonomy_scores: defaultdict[str, float] = defaultdict(float)
-    cell_scores: defaultdict[str, float] = defaultdict(float)
-    matched: list[str] = []
-    suggested_tags: dict[str, str | None] = {
-        "sell": None,
-        "to_whom": None,
-        "value_measure": None,
-    }
-
-    seen = set(phrases)
-    for phrase, rule in keywords.items():
-        if phrase not in seen:
-            continue
-        matched.append(phrase)
-        for taxonomy_id, weight in (rule.get("taxonomy", {}) or {}).items():
-            taxonomy_scores[taxonomy_id] += float(weight)
-        for cell_id, weight in (rule.get("cell", {}) or {}).items():
-            cell_scores[cell_id] += float(weight)
-        for tag_name, tag_value in (rule.get("tags", {}) or {}).items():
-            if suggested_tags.get(tag_name) is None:
-                suggested_tags[tag_name] = str(tag_value)
-
-    tag_keywords = mappings.get("tag_keywords", {})
-    for tag_name, tag_map in tag_keywords.items():
-        for tag_value, words in tag_map.items():
-            if any(word in seen for word in words):
-                suggested_tags[tag_name] = suggested_tags.get(tag_name) or tag_value
-
-    return sorted(set(matched)), dict(taxonomy_scores), dict(cell_scores), suggested_tags
-
-
-def _score_taxonomy(
-    taxonomy_scores: dict[str, float],
-    mappings: dict[str, dict],
-    phrases: list[str],
-) -> list[tuple[str, float, list[str]]]:
-    scores: defaultdict[str, float] = defaultdict(float)
-    reasons: defaultdict[str, list[str]] = defaultdict(list)
-
-    for taxonomy_id, score in taxonomy_scores.items():
-        scores[taxonomy_id] += score
-        reasons[taxonomy_id].append(f"keyword_score={score:.2f}")
-
-    seen = set(phrases)
-    for taxonomy_id, info in (mappings.get("taxonomy", {}) or {}).items():
-        mapping_hits = [word for word in (info.get("keywords") or []) if word in seen]
-        if mapping_hits:
-            bonus = float(len(mapping_hits)) * 0.8
-            scores[taxonomy_id] += bonus
-            reasons[taxonomy_id].append(f"mapping_hits={', '.join(sorted(mapping_hits))}")
-
-    if not scores:
-        scores["service_fee"] = 0.1
-        reasons["service_fee"].append("fallback_default")
-
-    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
-    return [(taxonomy_id, score, reasons[taxonomy_id]) for taxonomy_id, score in ranked[:3]]
-
-
-def _score_cell(
-    cell_scores: dict[str, float],
-    mappings: dict[str, dict],
-    phrases: list[str],
-    top_taxonomy: str,
-) -> tuple[str, str | None, list[str]]:
-    scores: defaultdict[str, float] = defaultdict(float)
-    reasons: list[str] = []
-
-    for cell_id, score in cell_scores.items():
-        scores[cell_id] += score
-        reasons.append(f"cell_keywords:{cell_id}={score:.2f}")
-
-    cell_keywords = mappings.get("cell_keywords", {}) or {}
-    seen = set(phrases)
-    for cell_id, words in cell_keywords.items():
-        hits = [word for word in words if word in seen]
-        if hits:
-            bonus = float(len(hits)) * 0.6
-            scores[cell_id] += bonus
-            reasons.append(f"cell_mapping:{cell_id}={','.join(sorted(hits))}")
-
-    taxonomy_cells = (mappings.get("taxonomy", {}).get(top_taxonomy, {}) or {}).get(
-        "typical_cells", []
-    )
-    for idx, cell_id in enumerate(taxonomy_cells):
-        scores[cell_id] += max(0.0, 1.2 - idx * 0.3)
-        reasons.append(f"taxonomy_typical_cell:{cell_id}")
+class _PhraseAutomaton:
+    """Aho-Corasick automaton over token sequences.
+
+    One left-to-right scan over the tokens of a text reports every phrase that occurs in
+    it, whatever the number of phrases.
+    """
+
+    def __init__(self, phrases: list[tuple[str, ...]]) -> None:
+        self.goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for phrase_id, phrase in enumerate(phrases):
+            state = 0
+            for token in phrase:
+                if token not in self.goto[state]:
+                    self.goto.append({})
+                    outputs.append([])
+                    self.goto[state][token] = len(self.goto) - 1
+                state = self.goto[state][token]
+            outputs[state].append(phrase_id)
+
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, target in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and token not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[target] = self.goto[fallback].get(token, 0)
+                outputs[target].extend(outputs[self.fail[target]])
+                queue.append(target)
+        self.outputs = [tuple(output) for output in outputs]
+
+    def scan(self, tokens: list[str]) -> set[int]:
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        found: set[int] = set()
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
+class _SparseRows:
+    """Row-compressed sparse matrix (CSR) with phrase or keyword rows and score columns.
+
+    Explicit zeros are stored: a matched zero weight still enters its column into the
+    ranking, exactly like an accumulated ``0.0`` did.
+    """
+
+    def __init__(self, rows: list[list[tuple[int, float]]], width: int) -> None:
+        self.width = width
+        self.indptr = [0]
+        self.indices: list[int] = []
+        self.data: list[float] = []
+        for row in rows:
+            for column, value in row:
+                self.indices.append(column)
+                self.data.append(value)
+            self.indptr.append(len(self.indices))
+
+    def multiply(self, selections: list[list[int]]) -> list[tuple[list[float], list[int]]]:
+        """Sum the selected rows for every selection of a batch (a 0/1 matrix product).
+
+        Returns, per selection, the dense sums and the touched columns in first-touch
+        order. Rows must be given in ascending order: sums are accumulated row by row, so
+        floating-point results match adding the weights up in file order.
+        """
+        indptr, indices, data = self.indptr, self.indices, self.data
+        products: list[tuple[list[float], list[int]]] = []
+        for rows in selections:
+            sums = [0.0] * self.width
+            touched: list[int] = []
+            seen = [False] * self.width
+            for row in rows:
+                for offset in range(indptr[row], indptr[row + 1]):
+                    column = indices[offset]
+                    sums[column] += data[offset]
+                    if not seen[column]:
+                        seen[column] = True
+                        touched.append(column)
+            products.append((sums, touched))
+        return products
+
+
+def _trigrams(text: str) -> frozenset[str]:
+    return frozenset(text[start : start + 3] for start in range(len(text) - 2))
+
+
+class _TrigramIndex:
+    """Character-trigram inverted index over single-token terms.
+
+    A token's trigrams are looked up in the postings and the shared trigrams counted per
+    term, so only terms sharing trigrams with the token are ever touched. A term hits
+    when at least ``threshold`` of its trigrams occur in the token, which catches
+    compounds and inflections ("übersetzungsdienst" for "übersetzung").
+    """
+
+    def __init__(self, terms: list[tuple[int, str]], threshold: float) -> None:
+        self._phrase_ids: list[int] = []
+        self._needed: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        for phrase_id, term in terms:
+            grams = _trigrams(term)
+            index = len(self._phrase_ids)
+            self._phrase_ids.append(phrase_id)
+            self._needed.append(math.ceil(threshold * len(grams) - 1e-9))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(index)
+
+    def match(self, tokens: list[str], exclude: set[int]) -> list[tuple[int, str]]:
+        """``(phrase_id, token)`` for every term hit by a token, by phrase id.
+
+        Tokens that are terms themselves and terms in ``exclude`` (exact matches) are
+        skipped; each term keeps the first token that hit it.
+        """
+        hits: dict[int, str] = {}
+        for token in dict.fromkeys(tokens):
+            if len(token) < _FUZZY_MIN_LENGTH:
+                continue
+            shared: dict[int, int] = {}
+            for gram in _trigrams(token):
+                for index in self._postings.get(gram, ()):
+                    shared[index] = shared.get(index, 0) + 1
+            for index, count in shared.items():
+                phrase_id = self._phrase_ids[index]
+                if count >= self._needed[index] and phrase_id not in exclude:
+                    hits.setdefault(phrase_id, token)
+        return sorted(hits.items())
+
+
+def _fuzzy_scores(
+    keyword_product: tuple[list[float], list[int]],
+    mapping_product: tuple[list[float], list[int]],
+    mapping_bonus: float,
+) -> dict[int, float]:
+    keyword_sums, keyword_columns = keyword_product
+    hit_counts, hit_columns = mapping_product
+    scores = {column: keyword_sums[column] for column in keyword_columns}
+    for column in hit_columns:
+        scores[column] = scores.get(column, 0.0) + hit_counts[column] * mapping_bonus
+    return {column: score * FUZZY_WEIGHT for column, score in scores.items()}
+
+
+def _column(columns: dict[Any, int], key: Any) -> int:
+    return columns.setdefault(key, len(columns))
+
+
+def _count_rows(hits: list[list[int]], size: int) -> list[list[tuple[int, float]]]:
+    rows: list[list[tuple[int, float]]] = [[] for _ in range(size)]
+    for phrase_id, columns in enumerate(hits):
+        counts: dict[int, float] = {}
+        for column in columns:
+            counts[column] = counts.get(column, 0.0) + 1.0
+        rows[phrase_id] = sorted(counts.items())
+    return rows
+
+
+class Classifier:
+    """`keywords.yaml` and `mappings.yaml` compiled into a phrase automaton and sparse
+    score matrices.
+
+    Every keyword, taxonomy/cell mapping word and tag keyword becomes a phrase: any
+    sequence of whole tokens, whatever its length. Keyword weights form keyword×taxonomy
+    and keyword×cell matrices and mapping words form phrase×taxonomy and phrase×cell
+    hit-count matrices. Scoring a batch of texts is one automaton scan per text plus one
+    sparse product per matrix; reasons are rebuilt for the top-3 taxonomies only. Rows
+    are summed in file order, which keeps scores, reasons and tie-breaks identical to
+    evaluating the files rule by rule.
+
+    With ``fuzzy=True`` single-token keywords and mapping words are also looked up in a
+    character-trigram index; their hits add ``FUZZY_WEIGHT`` of their exact score.
+    """
+
+    def __init__(self, keywords: dict[str, dict], mappings: dict[str, dict]) -> None:
+        self.loading_warnings: list[str] = []
+        if not keywords:
+            self.loading_warnings.append("keywords_missing_or_invalid")
+        if not mappings:
+            self.loading_warnings.append("mappings_missing_or_invalid")
+
+        phrase_ids: dict[tuple[str, ...], int] = {}
+        self._phrases: list[str] = []
+        self._keyword_rows: list[int | None] = []
+        self._phrase_tags: list[list[int]] = []
+        taxonomy_hits: list[list[int]] = []
+        cell_hits: list[list[int]] = []
+
+        def _add(phrase: str) -> int | None:
+            if not isinstance(phrase, str):
+                return None
+            parts = tuple(phrase.split(" "))
+            # Texts are scanned token by token, so a phrase of any length matches as long
+            # as it consists of whole tokens.
+            if not all(_TOKEN_PATTERN.fullmatch(part) for part in parts):
+                return None
+            if parts not in phrase_ids:
+                phrase_ids[parts] = len(self._phrases)
+                self._phrases.append(phrase)
+                self._keyword_rows.append(None)
+                self._phrase_tags.append([])
+                taxonomy_hits.append([])
+                cell_hits.append([])
+            return phrase_ids[parts]
+
+        taxonomy = mappings.get("taxonomy", {}) or {}
+        cell_keywords = mappings.get("cell_keywords", {}) or {}
+        # Mapping ids come first, so column order is also mapping file order.
+        self._taxonomy_columns: dict[Any, int] = {key: index for index, key in enumerate(taxonomy)}
+        self._cell_columns: dict[Any, int] = {key: index for index, key in enumerate(cell_keywords)}
+
+        keyword_taxonomy: list[list[tuple[int, float]]] = []
+        keyword_cell: list[list[tuple[int, float]]] = []
+        self._keyword_tags: list[list[tuple[str, str]]] = []
+        for index, (phrase, rule) in enumerate(keywords.items()):
+            rule = rule or {}
+            keyword_taxonomy.append(
+                [
+                    (_column(self._taxonomy_columns, key), float(weight))
+                    for key, weight in (rule.get("taxonomy", {}) or {}).items()
+                ]
+            )
+            keyword_cell.append(
+                [
+                    (_column(self._cell_columns, key), float(weight))
+                    for key, weight in (rule.get("cell", {}) or {}).items()
+                ]
+            )
+            self._keyword_tags.append(
+                [(key, str(value)) for key, value in (rule.get("tags", {}) or {}).items()]
+            )
+            phrase_id = _add(phrase)
+            if phrase_id is not None:
+                self._keyword_rows[phrase_id] = index
+
+        for column, info in enumerate(taxonomy.values()):
+            for word in (info or {}).get("keywords") or []:
+                phrase_id = _add(word)
+                if phrase_id is not None:
+                    taxonomy_hits[phrase_id].append(column)
+        for column, words in enumerate(cell_keywords.values()):
+            for word in words or []:
+                phrase_id = _add(word)
+                if phrase_id is not None:
+                    cell_hits[phrase_id].append(column)
+
+        self._typical_cells = {
+            taxonomy_id: [
+                (_column(self._cell_columns, cell_id), cell_id)
+                for cell_id in (info or {}).get("typical_cells", []) or []
+            ]
+            for taxonomy_id, info in taxonomy.items()
+        }
+
+        self._tag_values: list[tuple[str, str]] = []
+        for tag_name, tag_map in (mappings.get("tag_keywords", {}) or {}).items():
+            for tag_value, words in tag_map.items():
+                index = len(self._tag_values)
+                self._tag_values.append((tag_name, tag_value))
+                for word in words:
+                    phrase_id = _add(word)
+                    if phrase_id is not None:
+                        self._phrase_tags[phrase_id].append(index)
+
+        self._taxonomy_ids = list(self._taxonomy_columns)
+        self._cell_ids = list(self._cell_columns)
+        self._keyword_taxonomy = _SparseRows(keyword_taxonomy, len(self._taxonomy_ids))
+        self._keyword_cell = _SparseRows(keyword_cell, len(self._cell_ids))
+        self._mapping_taxonomy = _SparseRows(
+            _count_rows(taxonomy_hits, len(self._phrases)), len(self._taxonomy_ids)
+        )
+        self._mapping_cell = _SparseRows(
+            _count_rows(cell_hits, len(self._phrases)), len(self._cell_ids)
+        )
+        self._automaton = _PhraseAutomaton(list(phrase_ids))
+        self._fuzzy_index: _TrigramIndex | None = None
+
+    def _fuzzy(self) -> _TrigramIndex:
+        """The trigram index over scoring single-token phrases, built on first use."""
+        if self._fuzzy_index is None:
+            terms = [
+                (phrase_id, phrase)
+                for phrase_id, phrase in enumerate(self._phrases)
+                if " " not in phrase
+                and len(phrase) >= _FUZZY_MIN_LENGTH
+                and (
+                    self._keyword_rows[phrase_id] is not None
+                    or self._mapping_taxonomy.indptr[phrase_id]
+                    < self._mapping_taxonomy.indptr[phrase_id + 1]
+                    or self._mapping_cell.indptr[phrase_id]
+                    < self._mapping_cell.indptr[phrase_id + 1]
+                )
+            ]
+            self._fuzzy_index = _TrigramIndex(terms, FUZZY_THRESHOLD)
+        return self._fuzzy_index
+
+    def _signals(
+        self, keyword_rows: list[int], phrases: list[int]
+    ) -> tuple[list[str], dict[str, str | None]]:
+        suggested_tags: dict[str, str | None] = {
+            "sell": None,
+            "to_whom": None,
+            "value_measure": None,
+        }
+        for index in keyword_rows:
+            for tag_name, tag_value in self._keyword_tags[index]:
+                if suggested_tags.get(tag_name) is None:
+                    suggested_tags[tag_name] = tag_value
+        for index in sorted({tag for phrase_id in phrases for tag in self._phrase_tags[phrase_id]}):
+            tag_name, tag_value = self._tag_values[index]
+            suggested_tags[tag_name] = suggested_tags.get(tag_name) or tag_value
+        matched = sorted(
+            {
+                self._phrases[phrase_id]
+                for phrase_id in phrases
+                if self._keyword_rows[phrase_id] is not None
+            }
+        )
+        return matched, suggested_tags
+
+    def _mapping_words(self, matrix: _SparseRows, phrases: list[int], column: int) -> list[str]:
+        words: list[str] = []
+        for phrase_id in phrases:
+            for offset in range(matrix.indptr[phrase_id], matrix.indptr[phrase_id + 1]):
+                if matrix.indices[offset] == column:
+                    words.extend([self._phrases[phrase_id]] * int(matrix.data[offset]))
+        return sorted(words)
+
+    def _score_taxonomy(
+        self,
+        keyword_product: tuple[list[float], list[int]],
+        mapping_product: tuple[list[float], list[int]],
+        phrases: list[int],
+        fuzzy: dict[int, float],
+    ) -> list[tuple[str, float, list[str]]]:
+        keyword_sums, keyword_columns = keyword_product
+        hit_counts, hit_columns = mapping_product
+        scores: dict[int, float] = {column: keyword_sums[column] for column in keyword_columns}
+        for column in hit_columns:
+            scores[column] = scores.get(column, 0.0) + hit_counts[column] * 0.8
+        for column, score in fuzzy.items():
+            scores[column] = scores.get(column, 0.0) + score
+        if not scores:
+            return [("service_fee", 0.1, ["fallback_default"])]
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self._taxonomy_ids[item[0]]))
+        keyword_touched = set(keyword_columns)
+        top3: list[tuple[str, float, list[str]]] = []
+        for column, score in ranked[:3]:
+            reasons: list[str] = []
+            if column in keyword_touched:
+                reasons.append(f"keyword_score={keyword_sums[column]:.2f}")
+            if hit_counts[column]:
+                words = self._mapping_words(self._mapping_taxonomy, phrases, column)
+                reasons.append(f"mapping_hits={', '.join(words)}")
+            if column in fuzzy:
+                reasons.append(f"fuzzy_score={fuzzy[column]:.2f}")
+            top3.append((self._taxonomy_ids[column], score, reasons))
+        return top3
+
+    def _score_cell(
+        self,
+        keyword_product: tuple[list[float], list[int]],
+        mapping_product: tuple[list[float], list[int]],
+        phrases: list[int],
+        fuzzy: dict[int, float],
+        top_taxonomy: str,
+    ) -> tuple[str, str | None, list[str]]:
+        keyword_sums, keyword_columns = keyword_product
+        hit_counts, hit_columns = mapping_product
+        scores: dict[int, float] = {}
+        reasons: list[str] = []
+
+        for column in keyword_columns:
+            scores[column] = keyword_sums[column]
+            reasons.append(f"cell_keywords:{self._cell_ids[column]}={keyword_sums[column]:.2f}")
+
+        for column in sorted(hit_columns):
+            scores[column] = scores.get(column, 0.0) + hit_counts[column] * 0.6
+            words = self._mapping_words(self._mapping_cell, phrases, column)
+            reasons.append(f"cell_mapping:{self._cell_ids[column]}={','.join(words)}")
+
+        for column, score in fuzzy.items():
+            scores[column] = scores.get(column, 0.0) + score
+            reasons.append(f"cell_fuzzy:{self._cell_ids[column]}={score:.2f}")
+
+        for idx, (column, cell_id) in enumerate(self._typical_cells.get(top_taxonomy, [])):
+            scores[column] = scores.get(column, 0.0) + max(0.0, 1.2 - idx * 0.3)
+            reasons.append(f"taxonomy_typical_cell:{cell_id}")
+
+        if not scores:
+            return "A1", None, ["fallback_cell:A1"]
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self._cell_ids[item[0]]))
+        cell_guess = self._cell_ids[ranked[0][0]]
+        backup = self._cell_ids[ranked[1][0]] if len(ranked) > 1 else None
+        return cell_guess, backup, reasons
+
+    def classify(
+        self, idea_text: str, app_data: AppData, *, fuzzy: bool = False
+    ) -> ClassifyResultV1:
+        return self.classify_many([idea_text], app_data, fuzzy=fuzzy)[0]
+
+    def classify_many(
+        self, idea_texts: list[str], app_data: AppData, *, fuzzy: bool = False
+    ) -> list[ClassifyResultV1]:
+        """Classify a batch of texts, scoring all of them with one product per matrix."""
+        tokens = [_tokens(_normalize_text(text)) for text in idea_texts]
+        phrases = [sorted(self._automaton.scan(text_tokens)) for text_tokens in tokens]
+        keyword_rows = [
+            sorted(
+                row for phrase_id in matched if (row := self._keyword_rows[phrase_id]) is not None
+            )
+            for matched in phrases
+        ]
+        keyword_taxonomy = self._keyword_taxonomy.multiply(keyword_rows)
+        keyword_cell = self._keyword_cell.multiply(keyword_rows)
+        mapping_taxonomy = self._mapping_taxonomy.multiply(phrases)
+        mapping_cell = self._mapping_cell.multiply(phrases)
+        fuzzy_hits: list[list[tuple[int, str]]] = [[] for _ in idea_texts]
+        fuzzy_taxonomy: list[dict[int, float]] = [{} for _ in idea_texts]
+        fuzzy_cell: list[dict[int, float]] = [{} for _ in idea_texts]
+        if fuzzy:
+            index = self._fuzzy()
+            fuzzy_hits = [
+                index.match(text_tokens, set(matched))
+                for text_tokens, matched in zip(tokens, phrases)
+            ]
+            fuzzy_phrases = [[phrase_id for phrase_id, _token in hits] for hits in fuzzy_hits]
+            fuzzy_rows = [
+                sorted(
+                    row for phrase_id in hits if (row := self._keyword_rows[phrase_id]) is not None
+                )
+                for hits in fuzzy_phrases
+            ]
+            fuzzy_taxonomy = [
+                _fuzzy_scores(keyword_product, mapping_product, 0.8)
+                for keyword_product, mapping_product in zip(
+                    self._keyword_taxonomy.multiply(fuzzy_rows),
+                    self._mapping_taxonomy.multiply(fuzzy_phrases),
+                )
+            ]
+            fuzzy_cell = [
+                _fuzzy_scores(keyword_product, mapping_product, 0.6)
+                for keyword_product, mapping_product in zip(
+                    self._keyword_cell.multiply(fuzzy_rows),
+                    self._mapping_cell.multiply(fuzzy_phrases),
+                )
+            ]
+        samples = _sample_index(app_data)
+
+        results: list[ClassifyResultV1] = []
+        for position, idea_text in enumerate(idea_texts):
+            matched, suggested_tags = self._signals(keyword_rows[position], phrases[position])
+            top3 = self._score_taxonomy(
+                keyword_taxonomy[position],
+                mapping_taxonomy[position],
+                phrases[position],
+                fuzzy_taxonomy[position],
+            )
+            top_taxonomy = top3[0][0]
+            cell_guess, backup_cell_guess, cell_reasons = self._score_cell(
+                keyword_cell[position],
+                mapping_cell[position],
+                phrases[position],
+                fuzzy_cell[position],
+                top_taxonomy,
+            )
+            results.append(
+                self._result(
+                    idea_text,
+                    samples,
+                    top3,
+                    (cell_guess, backup_cell_guess, cell_reasons),
+                    matched,
+                    suggested_tags,
+                    [
+                        f"{token}~{self._phrases[phrase_id]}"
+                        for phrase_id, token in fuzzy_hits[position]
+                    ],
+                )
+            )
+        return results
+
+    def _result(
+        self,
+        idea_text: str,
+        samples: _SampleIndex,
+        top3: list[tuple[str, float, list[str]]],
+        cell: tuple[str, str | None, list[str]],
+        matched: list[str],
+        suggested_tags: dict[str, str | None],
+        fuzzy_matches: list[str],
+    ) -> ClassifyResultV1:
+        cell_guess, backup_cell_guess, cell_reasons = cell
+        legal, evidence, stale = samples.contracts
+        top_taxonomy = top3[0][0]
+
+        candidates: list[ClassifyCandidate] = []
+        for taxonomy_id, score, reasons in top3:
+            candidates.append(
+                ClassifyCandidate(
+                    taxonomy_id=taxonomy_id,
+                    taxonomy_label=taxonomy_id.replace("_", " ").title(),
+                    cell_guess=cell_guess,
+                    score=round(float(score), 4),
+                    reasons=list(reasons[:6]),
+                    legal=legal,
+                    evidence=evidence,
+                    staleness=stale,
+                    sample_variants=samples.cards(taxonomy_id, cell_guess),
+                )
+            )
+
+        top1 = candidates[0].score if candidates else 0.0
+        top2 = candidates[1].score if len(candidates) > 1 else -999.0
+        confidence = 0.95 if (top1 - top2) >= 1.0 else 0.6
+        ambiguity = "ambiguous" if (top1 - top2) < 1.0 else "clear"
+
+        explanation: list[str] = []
+        if matched:
+            explanation.append(f"Matched keywords: {', '.join(matched[:6])}")
+        if fuzzy_matches:
+            explanation.append(f"Fuzzy matches: {', '.join(fuzzy_matches[:6])}")
+        explanation.append(f"Top taxonomy: {top_taxonomy}")
+        explanation.extend(cell_reasons[:3])
+        if ambiguity == "ambiguous":
+            explanation.append("Top-1 and Top-2 scores are close; clarification is recommended")
+        explanation.extend(self.loading_warnings)
+
+        return ClassifyResultV1(
+            idea_text=idea_text,
+            top3=candidates,
+            cell_guess=cell_guess,
+            backup_cell_guess=backup_cell_guess,
+            matched_keywords=matched,
+            suggested_tags=suggested_tags,
+            reasons=explanation[:6],
+            confidence=round(confidence, 4),
+            ambiguity=ambiguity,
+            legal=legal,
+            evidence=evidence,
+            staleness=stale,
+        )
+
+
+def _file_state(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
 
-    if not scores:
-        scores["A1"] = 0.1
-        reasons.append("fallback_cell:A1")
+# Compiled classifiers by data directory and keyword/mapping file state, oldest first.
+_CLASSIFIERS: dict[tuple, Classifier] = {}
+_CLASSIFIERS_SIZE = 4
 
-    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
-    cell_guess = ranked[0][0]
-    backup = ranked[1][0] if len(ranked) > 1 else None
-    return cell_guess, backup, reasons
+
+def get_classifier(data_dir: str | Path = "data") -> Classifier:
+    """The `Classifier` for ``data_dir``, compiled once and reused until its files change."""
+    data_dir = Path(data_dir).resolve()
+    key = (
+        str(data_dir),
+        _file_state(data_dir / "keywords.yaml"),
+        _file_state(data_dir / "mappings.yaml"),
+    )
+    classifier = _CLASSIFIERS.get(key)
+    if classifier is None:
+        classifier = Classifier(_load_keywords(data_dir), _load_mappings(data_dir))
+        while len(_CLASSIFIERS) >= _CLASSIFIERS_SIZE:
+            del _CLASSIFIERS[next(iter(_CLASSIFIERS))]
+        _CLASSIFIERS[key] = classifier
+    return classifier
 
 
 def _common_contracts(
-    app_data: AppData,
+    app_data: AppData, *, as_of: date | None = None
 ) -> tuple[LegalContract, EvidenceContract, StalenessContract]:
     staleness = evaluate_staleness(
         app_data.rulepack.reviewed_at,
         app_data.meta.staleness_policy,
         label="rulepack",
         invalid_severity="warn",
+        as_of=as_of,
     )
     staleness_status = (
         "hard"
@@ -214,112 +702,88 @@ def _common_contracts(
     return legal, evidence, stale
 
 
+class _SampleIndex:
+    """Sample-variant cards of one dataset, prebuilt per taxonomy.
+
+    Variants are grouped by the taxonomy their tags imply and sorted by id once; the
+    contracts are evaluated once. Cards are built per requested taxonomy on first use
+    and only the guessed cell is filled in per request.
+    """
+
+    def __init__(self, app_data: AppData, as_of: date) -> None:
+        self.contracts = _common_contracts(app_data, as_of=as_of)
+        self.size = len(app_data.variants)
+        ordered = sorted(app_data.variants, key=lambda variant: variant.variant_id)
+        self._by_taxonomy: dict[str, list[Variant]] = {}
+        for variant in ordered:
+            selected = self._by_taxonomy.setdefault(_variant_taxonomy_from_tags(variant.tags), [])
+            if len(selected) < _SAMPLE_SIZE:
+                selected.append(variant)
+        self._fallback = ordered[:_SAMPLE_SIZE]
+        self._cards: dict[str, list[MiniVariantCard]] = {}
+
+    def _templates(self, taxonomy_id: str) -> list[MiniVariantCard]:
+        cards = self._cards.get(taxonomy_id)
+        if cards is None:
+            legal, evidence, stale = self.contracts
+            cards = [
+                MiniVariantCard(
+                    variant_id=variant.variant_id,
+                    title=variant.title,
+                    taxonomy_id=taxonomy_id,
+                    taxonomy_label=taxonomy_id.replace("_", " ").title(),
+                    cell="",
+                    feasibility_status="feasible_with_prep",
+                    time_to_first_money_days_range=variant.economics.get(
+                        "time_to_first_money_days_range"
+                    ),
+                    typical_net_month_eur_range=variant.economics.get(
+                        "typical_net_month_eur_range"
+                    ),
+                    legal=legal,
+                    evidence=evidence,
+                    staleness=stale,
+                )
+                for variant in self._by_taxonomy.get(taxonomy_id) or self._fallback
+            ]
+            self._cards[taxonomy_id] = cards
+        return cards
+
+    def cards(self, taxonomy_id: str, cell_guess: str) -> list[MiniVariantCard]:
+        return [replace(card, cell=cell_guess) for card in self._templates(taxonomy_id)]
+
+
+# Sample indexes by dataset fingerprint and evaluation date, oldest first.
+_SAMPLE_INDEXES: dict[tuple[str, date], _SampleIndex] = {}
+_SAMPLE_INDEXES_SIZE = 4
+
+
+def _sample_index(app_data: AppData) -> _SampleIndex:
+    """The `_SampleIndex` for ``app_data``, reused while its fingerprint and the date match.
+
+    Datasets without a fingerprint (built in memory rather than loaded) are not cached.
+    """
+    key = (app_data.fingerprint, date.today())
+    index = _SAMPLE_INDEXES.get(key) if app_data.fingerprint else None
+    if index is not None and index.size == len(app_data.variants):
+        return index
+    index = _SampleIndex(app_data, key[1])
+    if app_data.fingerprint:
+        while len(_SAMPLE_INDEXES) >= _SAMPLE_INDEXES_SIZE:
+            del _SAMPLE_INDEXES[next(iter(_SAMPLE_INDEXES))]
+        _SAMPLE_INDEXES[key] = index
+    return index
+
+
 def _sample_variants(app_data: AppData, taxonomy_id: str, cell_guess: str) -> list[MiniVariantCard]:
-    legal, evidence, stale = _common_contracts(app_data)
-    selected = [
-        variant
-        for variant in app_data.variants
-        if _variant_taxonomy_from_tags(variant.tags) == taxonomy_id
-    ]
-    if not selected:
-        selected = list(app_data.variants)
-    selected = sorted(selected, key=lambda variant: variant.variant_id)[:5]
-
-    cards: list[MiniVariantCard] = []
-    for variant in selected:
-        cards.append(
-            MiniVariantCard(
-                variant_id=variant.variant_id,
-                title=variant.title,
-                taxonomy_id=taxonomy_id,
-                taxonomy_label=taxonomy_id.replace("_", " ").title(),
-                cell=cell_guess,
-                feasibility_status="feasible_with_prep",
-                time_to_first_money_days_range=variant.economics.get(
-                    "time_to_first_money_days_range"
-                ),
-                typical_net_month_eur_range=variant.economics.get("typical_net_month_eur_range"),
-                legal=legal,
-                evidence=evidence,
-                staleness=stale,
-            )
-        )
-    return cards
+    return _sample_index(app_data).cards(taxonomy_id, cell_guess)
 
 
 def classify_idea_text(
     idea_text: str,
     app_data: AppData,
     data_dir: str | Path = "data",
+    *,
+    fuzzy: bool = False,
 ) -> ClassifyResultV1:
-    normalized = _normalize_text(idea_text)
-    phrases = _tokens_and_ngrams(normalized)
-    keywords = _load_keywords(data_dir)
-    mappings = _load_mappings(data_dir)
-    loading_warnings: list[str] = []
-    if not keywords:
-        loading_warnings.append("keywords_missing_or_invalid")
-    if not mappings:
-        loading_warnings.append("mappings_missing_or_invalid")
-
-    matched, taxonomy_signals, cell_signals, suggested_tags = _extract_signals(
-        phrases,
-        keywords,
-        mappings,
-    )
-    top3 = _score_taxonomy(taxonomy_signals, mappings, phrases)
-    top_taxonomy = top3[0][0]
-
-    cell_guess, backup_cell_guess, cell_reasons = _score_cell(
-        cell_signals,
-        mappings,
-        phrases,
-        top_taxonomy,
-    )
-
-    legal, evidence, stale = _common_contracts(app_data)
-
-    candidates: list[ClassifyCandidate] = []
-    for taxonomy_id, score, reasons in top3:
-        candidates.append(
-            ClassifyCandidate(
-                taxonomy_id=taxonomy_id,
-                taxonomy_label=taxonomy_id.replace("_", " ").title(),
-                cell_guess=cell_guess,
-                score=round(float(score), 4),
-                reasons=list(reasons[:6]),
-                legal=legal,
-                evidence=evidence,
-                staleness=stale,
-                sample_variants=_sample_variants(app_data, taxonomy_id, cell_guess),
-            )
-        )
-
-    top1 = candidates[0].score if candidates else 0.0
-    top2 = candidates[1].score if len(candidates) > 1 else -999.0
-    confidence = 0.95 if (top1 - top2) >= 1.0 else 0.6
-    ambiguity = "ambiguous" if (top1 - top2) < 1.0 else "clear"
-
-    explanation: list[str] = []
-    if matched:
-        explanation.append(f"Matched keywords: {', '.join(matched[:6])}")
-    explanation.append(f"Top taxonomy: {top_taxonomy}")
-    explanation.extend(cell_reasons[:3])
-    if ambiguity == "ambiguous":
-        explanation.append("Top-1 and Top-2 scores are close; clarification is recommended")
-    explanation.extend(loading_warnings)
-
-    return ClassifyResultV1(
-        idea_text=idea_text,
-        top3=candidates,
-        cell_guess=cell_guess,
-        backup_cell_guess=backup_cell_guess,
-        matched_keywords=matched,
-        suggested_tags=suggested_tags,
-        reasons=explanation[:6],
-        confidence=round(confidence, 4),
-        ambiguity=ambiguity,
-        legal=legal,
-        evidence=evidence,
-        staleness=stale,
-    )
+    return get_classifier(data_dir).classify(idea_text, app_data, fuzzy=fuzzy)
@@ -0,0 +1,113 @@
+"""Precompiled dataset artifact built by `money-map compile`."""
+
+from __future__ import annotations
+
+import os
+import pickle
+from collections import defaultdict
+from pathlib import Path
+
+from money_map import __version__
+from money_map.core.cache import SourceFingerprint, file_sha256, is_racy
+from money_map.core.model import CompiledDataset, Variant
+from money_map.core.rules import _normalized_legal_gate
+
+COMPILED_FORMAT_VERSION = 3
+COMPILED_RELATIVE_PATH = Path("compiled") / "dataset.pickle"
+VARIANT_STORE_RELATIVE_PATH = Path("compiled") / "variants.columns"
+
+
+def compiled_path(data_dir: str | Path) -> Path:
+    return Path(data_dir) / COMPILED_RELATIVE_PATH
+
+
+def variant_store_path(data_dir: str | Path) -> Path:
+    return Path(data_dir) / VARIANT_STORE_RELATIVE_PATH
+
+
+def build_indexes(variants: list[Variant]) -> dict[str, dict[str, list[str]]]:
+    """Variant ids grouped by cell, taxonomy, declared legal gate and required asset."""
+    indexes: dict[str, defaultdict[str, list[str]]] = {
+        "by_cell": defaultdict(list),
+        "by_taxonomy": defaultdict(list),
+        "by_legal_gate": defaultdict(list),
+        "by_required_asset": defaultdict(list),
+    }
+    for variant in variants:
+        legal = variant.legal or {}
+        indexes["by_cell"][variant.cell_id].append(variant.variant_id)
+        indexes["by_taxonomy"][variant.taxonomy_id].append(variant.variant_id)
+        gate = _normalized_legal_gate(legal.get("legal_gate") or legal.get("gate") or "ok")
+        indexes["by_legal_gate"][gate].append(variant.variant_id)
+        for asset in sorted(set((variant.feasibility or {}).get("required_assets", []))):
+            indexes["by_required_asset"][str(asset)].append(variant.variant_id)
+    return {
+        name: {key: sorted(ids) for key, ids in sorted(groups.items())}
+        for name, groups in indexes.items()
+    }
+
+
+def read_compiled(path: Path) -> CompiledDataset | None:
+    try:
+        with path.open("rb") as fh:
+            compiled = pickle.load(fh)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError):
+        return None
+    if not isinstance(compiled, CompiledDataset):
+        return None
+    if compiled.format_version != COMPILED_FORMAT_VERSION:
+        return None
+    if compiled.package_version != __version__:
+        return None
+    return compiled
+
+
+def write_compiled(path: Path, compiled: CompiledDataset) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as fh:
+        pickle.dump(compiled, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def verify_sources(
+    compiled: CompiledDataset,
+    data_dir: str | Path,
+    source_paths: list[Path],
+) -> list[SourceFingerprint] | None:
+    """Current fingerprints if the artifact still matches every source file, else ``None``.
+
+    Paths are compared relative to ``data_dir`` so a copied data directory keeps its
+    artifact; files whose mtime changed (or is racy) are re-hashed rather than rejected.
+    """
+    root = Path(data_dir).resolve()
+    try:
+        relative = [path.relative_to(root).as_posix() for path in source_paths]
+    except ValueError:
+        return None
+    if relative != [str(source.get("path")) for source in compiled.sources]:
+        return None
+
+    fingerprints: list[SourceFingerprint] = []
+    for path, recorded in zip(source_paths, compiled.sources):
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if stat.st_size != recorded["size"]:
+            return None
+        sha256 = recorded["sha256"]
+        if stat.st_mtime_ns != recorded["mtime_ns"] or is_racy(
+            stat.st_mtime_ns, compiled.compiled_ns
+        ):
+            if file_sha256(path) != sha256:
+                return None
+        fingerprints.append(
+            SourceFingerprint(
+                path=path.as_posix(),
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                sha256=sha256,
+            )
+        )
+    return fingerprints
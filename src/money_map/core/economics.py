@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 from money_map.core.model import EconomicsResult, Variant
 
 ALLOWED_CONFIDENCE = {"low", "medium", "high", "unknown"}
@@ -29,8 +31,7 @@ def assess_economics(variant: Variant) -> EconomicsResult:
 
     volatility = economics.get("volatility_or_seasonality") or economics.get("volatility")
     confidence = str(economics.get("confidence", "unknown")).lower()
-    if confidence not in ALLOWED_CONFIDENCE:
-        confidence = "unknown"
+    confidence = sys.intern(confidence) if confidence in ALLOWED_CONFIDENCE else "unknown"
 
     return EconomicsResult(
         time_to_first_money_days_range=first_money,
@@ -2,12 +2,33 @@
 
 from __future__ import annotations
 
+import time
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from money_map import __version__
+from money_map.core.cache import (
+    SourceFingerprint,
+    dataset_fingerprint,
+    fingerprint_files,
+    load_cached,
+    load_index,
+    store_cached,
+    store_index,
+)
+from money_map.core.compiled import (
+    COMPILED_FORMAT_VERSION,
+    build_indexes,
+    compiled_path,
+    read_compiled,
+    variant_store_path,
+    verify_sources,
+)
 from money_map.core.model import (
     AppData,
+    CompiledDataset,
     DataSourceInfo,
     Meta,
     Rule,
@@ -15,7 +36,9 @@ from money_map.core.model import (
     StalenessPolicy,
     Variant,
 )
-from money_map.storage.fs import read_mapping, read_yaml
+from money_map.core.validate import validate
+from money_map.core.variant_store import VariantStore, open_variant_store
+from money_map.storage.fs import read_mapping, read_mappings, read_yaml
 
 
 def _resolve_data_file(*candidates: Path) -> Path:
@@ -31,13 +54,6 @@ def _iso_mtime(path: Path) -> str:
     return datetime.utcfromtimestamp(path.stat().st_mtime).replace(microsecond=0).isoformat()
 
 
-def _safe_read_mapping(path: Path) -> dict[str, Any]:
-    try:
-        return read_mapping(path)
-    except Exception:
-        return {}
-
-
 def _items_count(payload: dict[str, Any], source_type: str) -> int:
     list_keys = {
         "variants": "variants",
@@ -82,7 +98,7 @@ def _detect_source_type(path: Path) -> str:
     return "data"
 
 
-def _collect_source_registry(data_dir: Path) -> list[DataSourceInfo]:
+def _collect_source_paths(data_dir: Path) -> list[Path]:
     candidates: list[Path] = []
     core_known = [
         data_dir / "meta.yaml",
@@ -113,55 +129,96 @@ def _collect_source_registry(data_dir: Path) -> list[DataSourceInfo]:
             candidates.append(path)
 
     unique = sorted({p.resolve() for p in candidates})
-    registry: list[DataSourceInfo] = []
-    for path in unique:
-        if not path.is_file():
-            continue
-        payload = _safe_read_mapping(path)
-        source_type = _detect_source_type(path)
-        reviewed_at_raw = payload.get("reviewed_at") if isinstance(payload, dict) else ""
-        schema_version_raw = payload.get("schema_version") if isinstance(payload, dict) else ""
-        notes: dict[str, Any] = {
-            "group": (
-                "pack"
-                if "/packs/" in path.as_posix()
-                else "overlay"
-                if "/overlays/" in path.as_posix()
-                else "generated"
-                if "/generated/" in path.as_posix()
-                else "core"
-            )
-        }
-        if path.name.startswith("variants") and not reviewed_at_raw and source_type == "variants":
-            variants = payload.get("variants", []) if isinstance(payload, dict) else []
-            review_dates = [str(v.get("review_date", "")) for v in variants if isinstance(v, dict)]
-            review_dates = [d for d in review_dates if d]
-            if review_dates:
-                reviewed_at_raw = min(review_dates)
-                notes["reviewed_at_derived_from"] = "variants[].review_date"
-
-        try:
-            source_path = path.relative_to(Path.cwd()).as_posix()
-        except ValueError:
-            source_path = path.as_posix()
-
-        registry.append(
-            DataSourceInfo(
-                source=source_path,
-                type=source_type,
-                schema_version=str(schema_version_raw or ""),
-                items=_items_count(payload, source_type),
-                reviewed_at=str(reviewed_at_raw or ""),
-                mtime=_iso_mtime(path),
-                notes=notes,
-            )
-        )
+    return [path for path in unique if path.is_file()]
+
+
+def _source_group(path: Path) -> str:
+    posix = path.as_posix()
+    if "/packs/" in posix:
+        return "pack"
+    if "/overlays/" in posix:
+        return "overlay"
+    if "/generated/" in posix:
+        return "generated"
+    return "core"
+
+
+def _describe_source(path: Path, payload: dict[str, Any]) -> dict[str, Any]:
+    """Extract the registry header of a parsed source file (everything but path and mtime)."""
+    source_type = _detect_source_type(path)
+    reviewed_at_raw = payload.get("reviewed_at") if isinstance(payload, dict) else ""
+    schema_version_raw = payload.get("schema_version") if isinstance(payload, dict) else ""
+    notes: dict[str, Any] = {"group": _source_group(path)}
+    if path.name.startswith("variants") and not reviewed_at_raw and source_type == "variants":
+        variants = payload.get("variants", []) if isinstance(payload, dict) else []
+        review_dates = [str(v.get("review_date", "")) for v in variants if isinstance(v, dict)]
+        review_dates = [d for d in review_dates if d]
+        if review_dates:
+            reviewed_at_raw = min(review_dates)
+            notes["reviewed_at_derived_from"] = "variants[].review_date"
+    return {
+        "type": source_type,
+        "schema_version": str(schema_version_raw or ""),
+        "items": _items_count(payload, source_type),
+        "reviewed_at": str(reviewed_at_raw or ""),
+        "notes": notes,
+    }
 
+
+def _registry_key(path: Path, hashes: dict[str, str]) -> tuple[str, str]:
+    return (path.as_posix(), hashes.get(path.as_posix(), ""))
+
+
+def _source_label(path: Path) -> str:
+    try:
+        return path.relative_to(Path.cwd()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _source_headers(
+    paths: list[Path],
+    parsed: dict[Path, dict[str, Any] | Exception],
+    hashes: dict[str, str],
+    index: dict[tuple[str, str], dict[str, Any]],
+) -> dict[Path, dict[str, Any]]:
+    """Registry headers per path: from the index when the content hash is known, else parsed.
+
+    Payloads in ``parsed`` are reused; remaining files are parsed in one bulk read.
+    """
+    pending = [
+        path for path in paths if path not in parsed and _registry_key(path, hashes) not in index
+    ]
+    parsed = {**parsed, **dict(zip(pending, read_mappings(pending, return_exceptions=True)))}
+
+    headers: dict[Path, dict[str, Any]] = {}
+    for path in paths:
+        key = _registry_key(path, hashes)
+        header = index.get(key) if key[1] else None
+        if header is None:
+            payload = parsed[path]
+            header = _describe_source(path, {} if isinstance(payload, Exception) else payload)
+        headers[path] = header
+    return headers
+
+
+def _registry_from_headers(headers: dict[Path, dict[str, Any]]) -> list[DataSourceInfo]:
+    registry = [
+        DataSourceInfo(
+            source=_source_label(path),
+            type=header["type"],
+            schema_version=header["schema_version"],
+            items=header["items"],
+            reviewed_at=header["reviewed_at"],
+            mtime=_iso_mtime(path),
+            notes=dict(header["notes"]),
+        )
+        for path, header in headers.items()
+    ]
     return sorted(registry, key=lambda item: item.source)
 
 
-def _load_meta(meta_path: Path) -> Meta:
-    raw = read_mapping(meta_path)
+def _load_meta(raw: dict[str, Any]) -> Meta:
     staleness_policy = raw.get("staleness_policy", {})
     return Meta(
         dataset_version=str(raw.get("dataset_version", "")),
@@ -176,8 +233,7 @@ def _load_meta(meta_path: Path) -> Meta:
     )
 
 
-def _load_rulepack(rulepack_path: Path, meta_policy: StalenessPolicy) -> Rulepack:
-    raw = read_mapping(rulepack_path)
+def _load_rulepack(raw: dict[str, Any], meta_policy: StalenessPolicy) -> Rulepack:
     staleness_policy_raw = raw.get("staleness_policy") or {}
     staleness_policy = StalenessPolicy(
         warn_after_days=int(
@@ -200,47 +256,182 @@ def _load_rulepack(rulepack_path: Path, meta_policy: StalenessPolicy) -> Rulepac
     )
 
 
-def _load_variants(variants_path: Path) -> list[Variant]:
-    raw = read_mapping(variants_path)
-    variants: list[Variant] = []
-    for entry in raw.get("variants", []):
-        variants.append(
-            Variant(
-                variant_id=str(entry.get("variant_id", "")),
-                title=str(entry.get("title", "")),
-                summary=str(entry.get("summary", "")),
-                cell_id=str(entry.get("cell_id", "")),
-                taxonomy_id=str(entry.get("taxonomy_id", "")),
-                tags=list(entry.get("tags", [])),
-                regulated_domain=(
-                    None
-                    if entry.get("regulated_domain") in (None, "")
-                    else str(entry.get("regulated_domain"))
-                ),
-                feasibility=entry.get("feasibility", {}),
-                prep_steps=list(entry.get("prep_steps", [])),
-                economics=entry.get("economics", {}),
-                legal=entry.get("legal", {}),
-                review_date=str(entry.get("review_date", "")),
-            )
-        )
-    return variants
+def _load_variant(entry: dict[str, Any]) -> Variant:
+    return Variant(
+        variant_id=str(entry.get("variant_id", "")),
+        title=str(entry.get("title", "")),
+        summary=str(entry.get("summary", "")),
+        cell_id=str(entry.get("cell_id", "")),
+        taxonomy_id=str(entry.get("taxonomy_id", "")),
+        tags=tuple(entry.get("tags", [])),
+        regulated_domain=(
+            None
+            if entry.get("regulated_domain") in (None, "")
+            else str(entry.get("regulated_domain"))
+        ),
+        feasibility=entry.get("feasibility", {}),
+        prep_steps=list(entry.get("prep_steps", [])),
+        economics=entry.get("economics", {}),
+        legal=entry.get("legal", {}),
+        review_date=str(entry.get("review_date", "")),
+    )
 
 
-def load_app_data(data_dir: str | Path = "data") -> AppData:
-    data_dir = Path(data_dir)
+def _load_variants(raw: dict[str, Any]) -> list[Variant]:
+    return [_load_variant(entry) for entry in raw.get("variants", [])]
+
+
+def _core_paths(data_dir: Path) -> tuple[Path, Path, Path]:
+    """Resolved meta, rulepack and variants files of ``data_dir``."""
     meta_path = _resolve_data_file(data_dir / "meta.yaml", data_dir / "meta.json")
-    variants_path = _resolve_data_file(data_dir / "variants.yaml", data_dir / "variants.json")
     rulepack_path = _resolve_data_file(
         data_dir / "rulepacks" / "DE.yaml",
         data_dir / "rulepacks" / "DE.json",
     )
+    variants_path = _resolve_data_file(data_dir / "variants.yaml", data_dir / "variants.json")
+    return meta_path.resolve(), rulepack_path.resolve(), variants_path.resolve()
+
+
+def load_meta_and_rulepack(data_dir: str | Path = "data") -> tuple[Meta, Rulepack]:
+    """Load only `meta` and the rulepack, e.g. to check variants streamed from elsewhere."""
+    meta_path, rulepack_path, _variants_path = _core_paths(Path(data_dir))
+    meta = _load_meta(read_mapping(meta_path))
+    return meta, _load_rulepack(read_mapping(rulepack_path), meta.staleness_policy)
+
+
+def variants_path(data_dir: str | Path = "data") -> Path:
+    return _core_paths(Path(data_dir))[2]
+
+
+def _parse_dataset(
+    data_dir: Path,
+    source_paths: list[Path],
+    fingerprints: list[SourceFingerprint],
+    index: dict[tuple[str, str], dict[str, Any]],
+) -> tuple[AppData, dict[Path, dict[str, Any]]]:
+    hashes = {fp.path: fp.sha256 for fp in fingerprints}
+
+    # Core files and registry files missing from the index are parsed in one bulk read.
+    core_paths = list(_core_paths(data_dir))
+    pending = core_paths + [
+        path
+        for path in source_paths
+        if path not in core_paths and _registry_key(path, hashes) not in index
+    ]
+    parsed = dict(zip(pending, read_mappings(pending, return_exceptions=True)))
+    for path in core_paths:
+        if isinstance(parsed[path], Exception):
+            raise parsed[path]
+
+    meta = _load_meta(parsed[core_paths[0]])
+    rulepack = _load_rulepack(parsed[core_paths[1]], meta.staleness_policy)
+    variants = _load_variants(parsed[core_paths[2]])
+    headers = _source_headers(source_paths, parsed, hashes, index)
+    app_data = AppData(
+        meta=meta,
+        rulepack=rulepack,
+        variants=variants,
+        sources=_registry_from_headers(headers),
+        fingerprint=dataset_fingerprint(fingerprints),
+        source_hashes={
+            name: hashes.get(path.as_posix(), "")
+            for name, path in zip(("meta", "rulepack", "variants"), core_paths)
+        },
+    )
+    return app_data, headers
+
+
+def _load_fresh_compiled(data_dir: Path, source_paths: list[Path]) -> CompiledDataset | None:
+    compiled = read_compiled(compiled_path(data_dir))
+    if compiled is None:
+        return None
+    fingerprints = verify_sources(compiled, data_dir, source_paths)
+    if fingerprints is None:
+        return None
+    headers = {path: source["header"] for path, source in zip(source_paths, compiled.sources)}
+    app_data = replace(
+        compiled.app_data,
+        sources=_registry_from_headers(headers),
+        fingerprint=dataset_fingerprint(fingerprints),
+    )
+    return replace(compiled, app_data=app_data)
 
-    meta = _load_meta(meta_path)
-    rulepack = _load_rulepack(rulepack_path, meta.staleness_policy)
-    variants = _load_variants(variants_path)
-    sources = _collect_source_registry(data_dir)
-    return AppData(meta=meta, rulepack=rulepack, variants=variants, sources=sources)
+
+def load_compiled(data_dir: str | Path = "data") -> CompiledDataset | None:
+    """Return the `money-map compile` artifact of ``data_dir`` if it matches the sources."""
+    data_dir = Path(data_dir)
+    return _load_fresh_compiled(data_dir, _collect_source_paths(data_dir))
+
+
+def load_variant_store(data_dir: str | Path = "data") -> VariantStore | None:
+    """Memory-map the columnar variant store written alongside a fresh compiled artifact.
+
+    Worker processes that already know the artifact is current can call
+    `open_variant_store(path, compiled_ns=...)` directly and skip the source check.
+    """
+    compiled = load_compiled(data_dir)
+    if compiled is None:
+        return None
+    return open_variant_store(variant_store_path(data_dir), compiled_ns=compiled.compiled_ns)
+
+
+def compile_app_data(data_dir: str | Path = "data") -> CompiledDataset:
+    """Parse ``data_dir`` from source and build the compiled artifact (not written)."""
+    data_dir = Path(data_dir)
+    source_paths = _collect_source_paths(data_dir)
+    fingerprints = fingerprint_files(source_paths)
+    app_data, headers = _parse_dataset(data_dir, source_paths, fingerprints, {})
+    root = data_dir.resolve()
+    compiled_ns = time.time_ns()
+    return CompiledDataset(
+        format_version=COMPILED_FORMAT_VERSION,
+        package_version=__version__,
+        compiled_at=datetime.utcnow().replace(microsecond=0).isoformat(),
+        compiled_ns=compiled_ns,
+        app_data=app_data,
+        sources=[
+            {
+                "path": path.relative_to(root).as_posix(),
+                "size": fp.size,
+                "mtime_ns": fp.mtime_ns,
+                "sha256": fp.sha256,
+                "header": headers[path],
+            }
+            for path, fp in zip(source_paths, fingerprints)
+        ],
+        indexes=build_indexes(app_data.variants),
+        validation=validate(app_data),
+    )
+
+
+def load_app_data(data_dir: str | Path = "data", *, use_cache: bool = True) -> AppData:
+    """Load the dataset from its compiled artifact, the local cache or the source files.
+
+    A `money-map compile` artifact is used when it matches the sources; otherwise the
+    cache under `.money_map_cache/` is reused when no source file changed. With
+    ``use_cache=False`` the YAML/JSON sources are always parsed.
+    """
+    data_dir = Path(data_dir)
+    source_paths = _collect_source_paths(data_dir)
+    if use_cache:
+        compiled = _load_fresh_compiled(data_dir, source_paths)
+        if compiled is not None:
+            return compiled.app_data
+        cached = load_cached(data_dir, source_paths)
+        if isinstance(cached, AppData):
+            return cached
+
+    # Fingerprint before parsing so a concurrent edit invalidates the entry on the next load.
+    fingerprints = fingerprint_files(source_paths)
+    index = load_index(data_dir, "registry") if use_cache else {}
+    app_data, headers = _parse_dataset(data_dir, source_paths, fingerprints, index)
+    if use_cache:
+        hashes = {fp.path: fp.sha256 for fp in fingerprints}
+        next_index = {_registry_key(path, hashes): header for path, header in headers.items()}
+        if next_index != index:
+            store_index(data_dir, "registry", next_index)
+        store_cached(data_dir, fingerprints, app_data)
+    return app_data
 
 
 def load_profile(profile_path: str | Path) -> dict[str, Any]:
@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Any
 
 
+def _intern(value: Any) -> Any:
+    """Share one copy of short enum-like strings (ids, gates, tags) across objects."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _interned_mapping(mapping: dict[str, Any] | None) -> dict[str, Any]:
+    # dict() first, so malformed input fails with the same ValueError/TypeError as before.
+    return {_intern(key): _intern(value) for key, value in dict(mapping or {}).items()}
+
+
 @dataclass(frozen=True)
 class StalenessPolicy:
     warn_after_days: int = 180
@@ -41,14 +52,14 @@ class Rulepack:
     rules: list[Rule]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Variant:
     variant_id: str
     title: str
     summary: str
     cell_id: str = ""
     taxonomy_id: str = ""
-    tags: list[str] = None
+    tags: tuple[str, ...] = ()
     regulated_domain: str | None = None
     feasibility: dict[str, Any] = None
     prep_steps: list[str] = None
@@ -57,11 +68,15 @@ class Variant:
     review_date: str = ""
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "tags", list(self.tags or []))
-        object.__setattr__(self, "feasibility", dict(self.feasibility or {}))
+        object.__setattr__(self, "cell_id", _intern(self.cell_id))
+        object.__setattr__(self, "taxonomy_id", _intern(self.taxonomy_id))
+        object.__setattr__(self, "tags", tuple(_intern(tag) for tag in self.tags or ()))
+        object.__setattr__(self, "regulated_domain", _intern(self.regulated_domain))
+        object.__setattr__(self, "feasibility", _interned_mapping(self.feasibility))
         object.__setattr__(self, "prep_steps", list(self.prep_steps or []))
-        object.__setattr__(self, "economics", dict(self.economics or {}))
-        object.__setattr__(self, "legal", dict(self.legal or {}))
+        object.__setattr__(self, "economics", _interned_mapping(self.economics))
+        object.__setattr__(self, "legal", _interned_mapping(self.legal))
+        object.__setattr__(self, "review_date", _intern(self.review_date))
 
 
 @dataclass(frozen=True)
@@ -70,6 +85,9 @@ class AppData:
     rulepack: Rulepack
     variants: list[Variant]
     sources: list["DataSourceInfo"]
+    fingerprint: str = ""
+    # sha256 of the files behind `meta`, `rulepack` and `variants`, keyed by those names.
+    source_hashes: dict[str, str] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -83,6 +101,20 @@ class DataSourceInfo:
     notes: dict[str, Any]
 
 
+@dataclass(frozen=True)
+class CompiledDataset:
+    """Versioned dataset artifact produced by `money-map compile`."""
+
+    format_version: int
+    package_version: str
+    compiled_at: str
+    compiled_ns: int
+    app_data: AppData
+    sources: list[dict[str, Any]]  # data_dir-relative path, size, mtime_ns, sha256, header
+    indexes: dict[str, dict[str, list[str]]]  # by_cell|by_taxonomy|by_legal_gate|by_required_asset
+    validation: "ValidationReport"
+
+
 @dataclass(frozen=True)
 class UserProfile:
     name: str
@@ -109,7 +141,7 @@ class ValidationReport:
     staleness: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeasibilityResult:
     status: str
     blockers: list[str]
@@ -117,7 +149,7 @@ class FeasibilityResult:
     estimated_prep_weeks_range: list[int]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EconomicsResult:
     time_to_first_money_days_range: list[int]
     typical_net_month_eur_range: list[int]
@@ -128,7 +160,7 @@ class EconomicsResult:
     confidence: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LegalResult:
     legal_gate: str
     checklist: list[str]
@@ -136,7 +168,7 @@ class LegalResult:
     applied_rules: list[Rule]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecommendationVariant:
     variant: Variant
     score: float
@@ -0,0 +1,203 @@
+"""Near-duplicate variant detection with MinHash signatures and LSH banding.
+
+Each variant is reduced to a set of features: normalized word unigrams and bigrams of its
+title, summary and prep steps, plus its tags. A MinHash signature of ``num_perm``
+values estimates the Jaccard similarity of two feature sets. Locality-sensitive hashing
+splits the signature into bands. Only variants that agree on at least one whole band
+become candidate pairs, so the work grows with the number of similar variants, not with
+the number of pairs. Candidates are confirmed with the exact Jaccard similarity of their
+features and grouped into clusters.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 64
+
+_MAX_HASH = (1 << 32) - 1
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX = 0xBF58476D1CE4E5B9
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class NearDuplicateCluster:
+    variant_ids: tuple[str, ...]
+    similarity: float  # lowest Jaccard similarity among the pairs that linked the cluster
+
+
+@lru_cache(maxsize=1 << 16)
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _pair_hash(first: int, second: int) -> int:
+    # Order-sensitive mix of two token hashes (a bigram) without hashing a joined string.
+    mixed = ((first * _GOLDEN) ^ second) & _MASK64
+    return ((mixed ^ (mixed >> 29)) * _MIX) & _MASK64
+
+
+def variant_features(variant: Any) -> frozenset[int]:
+    """Hashed features of a `Variant` or a variant mapping (core, pack seed or draft).
+
+    Word unigrams and bigrams of title, summary and prep steps, plus the tags.
+    """
+    if isinstance(variant, dict):
+        get = variant.get
+    else:
+
+        def get(key: str, default: Any = None) -> Any:
+            return getattr(variant, key, default)
+
+    features: set[int] = set()
+    texts = [get("title"), get("summary"), *(get("prep_steps") or [])]
+    for text in texts:
+        hashes = [_token_hash(word) for word in _TOKEN_RE.findall(str(text or "").casefold())]
+        features.update(hashes)
+        features.update(map(_pair_hash, hashes, hashes[1:]))
+    features.update(_token_hash(f"#{str(tag).casefold()}") for tag in get("tags") or ())
+    return frozenset(features)
+
+
+def _variant_id(variant: Any) -> str:
+    if isinstance(variant, dict):
+        return str(variant.get("variant_id") or variant.get("id") or "")
+    return str(getattr(variant, "variant_id", "") or "")
+
+
+def minhash_signature(features: Iterable[int], num_perm: int = DEFAULT_NUM_PERM) -> tuple[int, ...]:
+    """One-permutation MinHash over 64-bit feature hashes, split into ``num_perm`` bins.
+
+    The signature keeps the minimum per bin. Empty bins borrow the value of the next
+    non-empty bin to the right, offset by the distance, so two sets still agree on a bin
+    with probability close to their Jaccard similarity. An empty set maps to all-max values.
+    """
+    # The bin comes from the low bits and the rank from the high bits. Iterating from the
+    # largest hash down leaves each bin holding its smallest rank.
+    bins = {value % num_perm: value >> 32 for value in sorted(features, reverse=True)}
+    if not bins:
+        return (_MAX_HASH,) * num_perm
+    if len(bins) == num_perm:
+        return tuple(bins[slot] for slot in range(num_perm))
+    signature = []
+    for slot in range(num_perm):
+        distance = 0
+        while (slot + distance) % num_perm not in bins:
+            distance += 1
+        signature.append(bins[(slot + distance) % num_perm] + distance * (_MAX_HASH + 1))
+    return tuple(signature)
+
+
+def lsh_params(threshold: float, num_perm: int) -> tuple[int, int]:
+    """Pick ``(bands, rows)`` whose S-curve midpoint ``(1/bands)**(1/rows)`` is closest to
+    ``threshold``.
+
+    Ties prefer more bands, which lowers the number of missed pairs.
+    """
+    options = [(bands, num_perm // bands) for bands in range(1, num_perm + 1)]
+    options = [(bands, rows) for bands, rows in options if bands * rows == num_perm]
+    return min(
+        options, key=lambda item: (abs((1 / item[0]) ** (1 / item[1]) - threshold), -item[0])
+    )
+
+
+def jaccard(first: frozenset[int], second: frozenset[int]) -> float:
+    """Jaccard similarity; 0.0 when either set is empty (blank variants share no text)."""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+class _Clusters:
+    """Union-find over variant indexes."""
+
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+
+    def find(self, index: int) -> int:
+        parent = self.parent
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def union(self, first: int, second: int) -> None:
+        first, second = self.find(first), self.find(second)
+        if first != second:
+            self.parent[max(first, second)] = min(first, second)
+
+
+def find_near_duplicates(
+    variants: Iterable[Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+) -> list[NearDuplicateCluster]:
+    """Clusters of variants whose feature sets have Jaccard similarity >= ``threshold``.
+
+    Within an LSH bucket each variant is compared against the bucket's cluster
+    representatives only, so a bucket of many copies costs linear, not quadratic, time.
+    Variants without any title, summary, prep step or tag have no features and are never
+    reported. Clusters are ordered by their first variant id.
+    """
+    if not 0 < threshold <= 1:
+        raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+    ids: list[str] = []
+    features: list[frozenset[int]] = []
+    for variant in variants:
+        ids.append(_variant_id(variant))
+        features.append(variant_features(variant))
+
+    bands, rows = lsh_params(threshold, num_perm)
+    buckets: list[dict[tuple[int, ...], list[int]]] = [{} for _ in range(bands)]
+    for index, feature_set in enumerate(features):
+        if not feature_set:
+            continue
+        signature = minhash_signature(feature_set, num_perm)
+        for band, table in enumerate(buckets):
+            key = signature[band * rows : (band + 1) * rows]
+            table.setdefault(key, []).append(index)
+
+    clusters = _Clusters(len(ids))
+    similarity: dict[tuple[int, int], float] = {}
+    for table in buckets:
+        for members in table.values():
+            if len(members) < 2:
+                continue
+            representatives: list[int] = []
+            for member in members:
+                for representative in representatives:
+                    if clusters.find(member) == clusters.find(representative):
+                        break
+                    score = jaccard(features[member], features[representative])
+                    if score >= threshold:
+                        clusters.union(member, representative)
+                        similarity[(representative, member)] = score
+                        break
+                else:
+                    representatives.append(member)
+
+    grouped: dict[int, list[int]] = {clusters.find(first): [] for first, _ in similarity}
+    for index in range(len(ids)):
+        root = clusters.find(index)
+        if root in grouped:
+            grouped[root].append(index)
+    lowest: dict[int, float] = {}
+    for (first, _second), score in similarity.items():
+        root = clusters.find(first)
+        lowest[root] = min(score, lowest.get(root, 1.0))
+    result = [
+        NearDuplicateCluster(
+            variant_ids=tuple(sorted(ids[index] for index in members)),
+            similarity=round(lowest[root], 4),
+        )
+        for root, members in grouped.items()
+    ]
+    return sorted(result, key=lambda cluster: cluster.variant_ids)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import sys
+from datetime import date
+
 from money_map.core.model import LegalResult, Rule, Rulepack, StalenessPolicy, Variant
 from money_map.core.staleness import evaluate_staleness, is_freshness_unknown
 
@@ -11,7 +14,7 @@ ALLOWED_LEGAL_GATES = {"ok", "require_check", "registration", "license", "blocke
 def _normalized_legal_gate(raw_gate: object) -> str:
     gate = str(raw_gate or "ok").strip().lower()
     if gate in ALLOWED_LEGAL_GATES:
-        return gate
+        return sys.intern(gate)
     return "require_check"
 
 
@@ -31,6 +34,8 @@ def evaluate_legal(
     rulepack: Rulepack,
     variant: Variant,
     staleness_policy: StalenessPolicy,
+    *,
+    as_of: date | None = None,
 ) -> LegalResult:
     legal = variant.legal
     legal_gate = _normalized_legal_gate(legal.get("legal_gate") or legal.get("gate") or "ok")
@@ -41,12 +46,14 @@ def evaluate_legal(
         rulepack.reviewed_at,
         staleness_policy,
         label="rulepack",
+        as_of=as_of,
     )
     variant_staleness = evaluate_staleness(
         variant.review_date,
         staleness_policy,
         label=f"variant:{variant.variant_id}",
         invalid_severity="warn",
+        as_of=as_of,
     )
     stale = rulepack_staleness.is_stale or variant_staleness.is_stale
     freshness_unknown = is_freshness_unknown(rulepack_staleness) or is_freshness_unknown(
@@ -0,0 +1,429 @@
+"""Column-at-a-time scoring of a whole variant catalogue for `recommend`.
+
+Profile-independent facts (economics ranges, final legal gate, staleness) are held as
+per-variant arrays in `CatalogueColumns`; `score_catalogue` then derives feasibility,
+filter masks, penalties and objective-weighted scores for every variant in one pass per
+column instead of building result objects per variant.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+from money_map.core.economics import assess_economics
+from money_map.core.feasibility import _language_rank
+from money_map.core.model import (
+    AppData,
+    EconomicsResult,
+    LegalResult,
+    Rulepack,
+    StalenessPolicy,
+    Variant,
+)
+from money_map.core.rules import evaluate_legal
+from money_map.core.staleness import StalenessResult, evaluate_staleness, is_freshness_unknown
+from money_map.core.variant_store import CONFIDENCE_LEVELS, LEGAL_GATES, VariantStore
+
+OBJECTIVE_WEIGHTS: dict[str, dict[str, float]] = {
+    "max_net": {
+        "time": 0.4,
+        "net": 1.2,
+        "legal": 0.7,
+        "feasibility": 0.8,
+        "prep": 0.5,
+        "confidence": 0.4,
+    },
+    "balanced": {
+        "time": 0.9,
+        "net": 0.9,
+        "legal": 0.9,
+        "feasibility": 0.9,
+        "prep": 0.9,
+        "confidence": 0.6,
+    },
+    # fastest_money, also the default for unknown presets
+    "fastest_money": {
+        "time": 1.2,
+        "net": 0.35,
+        "legal": 0.8,
+        "feasibility": 1.0,
+        "prep": 0.9,
+        "confidence": 0.4,
+    },
+}
+LEGAL_SCORES = {
+    "ok": 1.0,
+    "require_check": 0.4,
+    "registration": 0.2,
+    "license": 0.1,
+    "blocked": -1.0,
+}
+FEASIBILITY_SCORES = {
+    "feasible": 1.0,
+    "feasible_with_prep": 0.4,
+    "not_feasible": -0.8,
+}
+CONFIDENCE_SCORES = {
+    "low": 0.2,
+    "medium": 0.6,
+    "high": 1.0,
+    "unknown": 0.4,
+}
+REGULATED_MARKERS = frozenset(
+    {
+        "без лицензируемых сфер",
+        "no_regulated",
+        "no_regulated_domains",
+        "no_license",
+    }
+)
+
+# Feasibility status codes indexed by min(blocker count, 3), as in `assess_feasibility`.
+FEASIBILITY_STATUSES = ("feasible", "feasible_with_prep", "feasible_with_prep", "not_feasible")
+_PREP_MIDPOINTS = (0.0, 1.5, 3.0, 6.0)
+_BLOCKED = LEGAL_GATES.index("blocked")
+_REQUIRE_CHECK = LEGAL_GATES.index("require_check")
+_OK = LEGAL_GATES.index("ok")
+
+
+def objective_weights(objective: str) -> dict[str, float]:
+    return OBJECTIVE_WEIGHTS.get(objective, OBJECTIVE_WEIGHTS["fastest_money"])
+
+
+def normalized_constraints(profile: dict) -> set[str]:
+    raw = profile.get("constraints", [])
+    if not isinstance(raw, list):
+        return set()
+    return {str(item).strip().lower() for item in raw if str(item).strip()}
+
+
+@dataclass
+class CatalogueColumns:
+    """Profile-independent variant facts for one dataset, rulepack and as-of date."""
+
+    variants: list[Variant]
+    rulepack: Rulepack
+    staleness_policy: StalenessPolicy
+    store: VariantStore
+    required_assets: list[frozenset]
+    regulated_excludable: array  # regulated tag or restrictive declared gate
+    legal_gate: array  # LEGAL_GATES code after the `evaluate_legal` overrides
+    stale: array
+    as_of: date
+    fingerprint: str = ""
+    _base_scores: dict[str, list[float]] = field(default_factory=dict, repr=False)
+    _results: dict[int, tuple[EconomicsResult, LegalResult, StalenessResult]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def fixed_results(self, row: int) -> tuple[EconomicsResult, LegalResult, StalenessResult]:
+        """Economics, legal and staleness results of one variant, computed once per row."""
+        cached = self._results.get(row)
+        if cached is None:
+            variant = self.variants[row]
+            cached = (
+                assess_economics(variant),
+                evaluate_legal(self.rulepack, variant, self.staleness_policy, as_of=self.as_of),
+                evaluate_staleness(
+                    variant.review_date,
+                    self.staleness_policy,
+                    label=f"variant:{variant.variant_id}",
+                    as_of=self.as_of,
+                ),
+            )
+            self._results[row] = cached
+        return cached
+
+    def base_scores(self, objective: str) -> list[float]:
+        """Time, net and legal terms of the score, which do not depend on the profile."""
+        cached = self._base_scores.get(objective)
+        if cached is not None:
+            return cached
+        weights = objective_weights(objective)
+        w_time, w_net, w_legal = weights["time"], weights["net"], weights["legal"]
+        legal_scores = [LEGAL_SCORES.get(gate, 0.0) for gate in LEGAL_GATES]
+        store = self.store
+        scores = [
+            w_time * (-((time_min + time_max) / 2))
+            + w_net * (((net_min + net_max) / 2) / 100)
+            + w_legal * legal_scores[gate]
+            for time_min, time_max, net_min, net_max, gate in zip(
+                store.column("time_to_first_money_min"),
+                store.column("time_to_first_money_max"),
+                store.column("net_month_min"),
+                store.column("net_month_max"),
+                self.legal_gate,
+            )
+        ]
+        self._base_scores[objective] = scores
+        return scores
+
+
+def build_catalogue_columns(
+    variants: list[Variant],
+    rulepack: Rulepack,
+    staleness_policy: StalenessPolicy,
+    *,
+    store: VariantStore | None = None,
+    as_of: date | None = None,
+    fingerprint: str = "",
+) -> CatalogueColumns:
+    """Arrays mirroring `assess_economics`, `evaluate_legal` and `evaluate_staleness`.
+
+    ``store`` may be a memory-mapped `VariantStore` for the same variants; otherwise one
+    is encoded in memory.
+    """
+    if store is None:
+        store = VariantStore.from_variants(variants)
+    as_of = as_of or date.today()
+    rulepack_staleness = evaluate_staleness(rulepack.reviewed_at, staleness_policy, as_of=as_of)
+    rulepack_stale = rulepack_staleness.is_stale
+    rulepack_unknown = is_freshness_unknown(rulepack_staleness)
+    warn_after_days = int(staleness_policy.warn_after_days)
+    today = as_of.toordinal()
+    regulated_domains = set(rulepack.regulated_domains)
+
+    required_assets: list[frozenset] = []
+    excludable = array("b")
+    legal_gate = array("b")
+    stale = array("b")
+    for variant, gate, ordinal in zip(
+        variants, store.column("legal_gate"), store.column("review_ordinal")
+    ):
+        tags = variant.tags
+        required_assets.append(frozenset((variant.feasibility or {}).get("required_assets", [])))
+        raw_gate = str((variant.legal or {}).get("legal_gate", "")).lower()
+        excludable.append(
+            "regulated" in {str(tag).strip().lower() for tag in tags}
+            or raw_gate in {"registration", "license", "blocked"}
+        )
+        variant_stale = bool(ordinal) and today - ordinal > warn_after_days
+        regulated = (
+            bool(variant.regulated_domain)
+            or any(tag in regulated_domains for tag in tags)
+            or "regulated" in tags
+        )
+        if variant.regulated_domain and gate == _OK:
+            gate = _REQUIRE_CHECK
+        if regulated and (rulepack_stale or variant_stale or rulepack_unknown or not ordinal):
+            gate = _REQUIRE_CHECK
+        legal_gate.append(gate)
+        stale.append(variant_stale)
+    return CatalogueColumns(
+        variants=variants,
+        rulepack=rulepack,
+        staleness_policy=staleness_policy,
+        store=store,
+        required_assets=required_assets,
+        regulated_excludable=excludable,
+        legal_gate=legal_gate,
+        stale=stale,
+        as_of=as_of,
+        fingerprint=fingerprint,
+    )
+
+
+_FACTS_CACHE: dict[tuple[str, date], CatalogueColumns] = {}
+_FACTS_CACHE_SIZE = 4
+
+
+def variant_facts(
+    app_data: AppData,
+    *,
+    as_of: date | None = None,
+    store: VariantStore | None = None,
+) -> CatalogueColumns:
+    """Variant facts for ``app_data``, reused while its fingerprint and ``as_of`` match.
+
+    Datasets without a fingerprint (built in memory rather than loaded) are not cached.
+    """
+    as_of = as_of or date.today()
+    key = (app_data.fingerprint, as_of)
+    cached = _FACTS_CACHE.get(key) if app_data.fingerprint else None
+    if cached is not None and len(cached.variants) == len(app_data.variants):
+        return cached
+    facts = build_catalogue_columns(
+        app_data.variants,
+        app_data.rulepack,
+        app_data.meta.staleness_policy,
+        store=store,
+        as_of=as_of,
+        fingerprint=app_data.fingerprint,
+    )
+    if app_data.fingerprint:
+        # A changed dataset has a new fingerprint; the oldest entries are evicted first.
+        while len(_FACTS_CACHE) >= _FACTS_CACHE_SIZE:
+            del _FACTS_CACHE[next(iter(_FACTS_CACHE))]
+        _FACTS_CACHE[key] = facts
+    return facts
+
+
+@dataclass(frozen=True)
+class CatalogueScores:
+    rows: list[int]  # surviving row indices, in catalogue order
+    scores: list[float]  # aligned with ``rows``
+    statuses: list[str]  # feasibility status per surviving row
+    diagnostics: dict[str, Any]
+
+
+def _record_counts(target: dict[str, int], masks: list[tuple[str, list[bool]]]) -> None:
+    """Add non-zero counts in the order a row-by-row loop would first have seen them."""
+    found = []
+    for slot, (key, mask) in enumerate(masks):
+        count = sum(mask)
+        if count:
+            found.append((mask.index(True), slot, key, count))
+    for _first, _slot, key, count in sorted(found):
+        target[key] = target.get(key, 0) + count
+
+
+def score_catalogue(
+    profile: dict,
+    columns: CatalogueColumns,
+    objective: str = "fastest_money",
+    filters: dict | None = None,
+) -> CatalogueScores:
+    """Feasibility, filters, penalties and scores for every row, matching `recommend`."""
+    filters = filters or {}
+    store = columns.store
+    weights = objective_weights(objective)
+    diagnostics: dict[str, Any] = {
+        "filtered_out": 0,
+        "reasons": {},
+        "warnings": {},
+        "evaluated": len(store),
+        "candidates": 0,
+    }
+
+    assets = profile.get("assets")
+    candidate_assets = set(assets) if isinstance(assets, list) else set()
+    restrict_regulated = not normalized_constraints(profile).isdisjoint(REGULATED_MARKERS)
+    regulated_mask = [restrict_regulated and bool(flag) for flag in columns.regulated_excludable]
+    assets_mask = [
+        not regulated and bool(required) and not candidate_assets
+        for regulated, required in zip(regulated_mask, columns.required_assets)
+    ]
+    candidate = [not (a or b) for a, b in zip(regulated_mask, assets_mask)]
+    _record_counts(
+        diagnostics["reasons"],
+        [("constraint_regulated", regulated_mask), ("missing_assets_all", assets_mask)],
+    )
+    diagnostics["filtered_out"] = sum(regulated_mask) + sum(assets_mask)
+    diagnostics["candidates"] = sum(candidate)
+
+    language_rank = _language_rank(profile.get("language_level"))
+    capital = profile.get("capital_eur", 0)
+    weekly_time = profile.get("time_per_week", 0)
+    available = set(profile.get("assets", []))
+    blockers = [
+        min(
+            (min_rank > language_rank)
+            + (capital < min_capital)
+            + (weekly_time < min_time)
+            + (not required <= available),
+            3,
+        )
+        for min_rank, min_capital, min_time, required in zip(
+            store.column("min_language_rank"),
+            store.column("min_capital"),
+            store.column("min_time_per_week"),
+            columns.required_assets,
+        )
+    ]
+
+    max_time = filters.get("max_time_to_money_days")
+    exclude_blocked = bool(filters.get("exclude_blocked"))
+    exclude_not_feasible = bool(filters.get("exclude_not_feasible"))
+    time_mask = [
+        ok and bool(max_time) and time_max > max_time
+        for ok, time_max in zip(candidate, store.column("time_to_first_money_max"))
+    ]
+    blocked_mask = [
+        ok and not slow and exclude_blocked and gate == _BLOCKED
+        for ok, slow, gate in zip(candidate, time_mask, columns.legal_gate)
+    ]
+    not_feasible_mask = [
+        ok and not slow and not blocked and exclude_not_feasible and count == 3
+        for ok, slow, blocked, count in zip(candidate, time_mask, blocked_mask, blockers)
+    ]
+    survivors = [
+        ok and not (slow or blocked or infeasible)
+        for ok, slow, blocked, infeasible in zip(
+            candidate, time_mask, blocked_mask, not_feasible_mask
+        )
+    ]
+    _record_counts(
+        diagnostics["reasons"],
+        [
+            ("time_to_money", time_mask),
+            ("blocked", blocked_mask),
+            ("not_feasible", not_feasible_mask),
+        ],
+    )
+    diagnostics["filtered_out"] += sum(time_mask) + sum(blocked_mask) + sum(not_feasible_mask)
+
+    has_economics = store.column("has_economics")
+    rows = [index for index, keep in enumerate(survivors) if keep]
+    _record_counts(
+        diagnostics["warnings"],
+        [
+            ("stale_variant", [ok and bool(flag) for ok, flag in zip(candidate, columns.stale)]),
+            (
+                "missing_economics",
+                [keep and not has for keep, has in zip(survivors, has_economics)],
+            ),
+            (
+                "economics_first_money_unknown",
+                _zero_range_mask(survivors, store, "time_to_first_money"),
+            ),
+            ("economics_net_unknown", _zero_range_mask(survivors, store, "net_month")),
+            ("economics_costs_unknown", _zero_range_mask(survivors, store, "costs")),
+            (
+                "not_feasible_penalized",
+                [keep and count == 3 for keep, count in zip(survivors, blockers)],
+            ),
+        ],
+    )
+
+    base = columns.base_scores(objective)
+    w_feasibility, w_prep, w_confidence = (
+        weights["feasibility"],
+        weights["prep"],
+        weights["confidence"],
+    )
+    feasibility_scores = [FEASIBILITY_SCORES[status] for status in FEASIBILITY_STATUSES]
+    confidence_scores = [CONFIDENCE_SCORES[level] for level in CONFIDENCE_LEVELS]
+    confidence = store.column("confidence")
+    scores = []
+    for row in rows:
+        count = blockers[row]
+        score = (
+            base[row]
+            + w_feasibility * feasibility_scores[count]
+            + w_prep * (-_PREP_MIDPOINTS[count])
+            + w_confidence * confidence_scores[confidence[row]]
+        )
+        if not has_economics[row]:
+            score -= 50
+        if count == 3:
+            score -= 75
+        scores.append(score)
+
+    return CatalogueScores(
+        rows=rows,
+        scores=scores,
+        statuses=[FEASIBILITY_STATUSES[blockers[row]] for row in rows],
+        diagnostics=diagnostics,
+    )
+
+
+def _zero_range_mask(survivors: list[bool], store: VariantStore, prefix: str) -> list[bool]:
+    return [
+        keep and low == 0 and high == 0
+        for keep, low, high in zip(
+            survivors, store.column(f"{prefix}_min"), store.column(f"{prefix}_max")
+        )
+    ]
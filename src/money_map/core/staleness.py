@@ -39,6 +39,8 @@ def evaluate_staleness(
     policy: StalenessPolicy,
     label: str = "data",
     invalid_severity: str = "fatal",
+    *,
+    as_of: date | None = None,
 ) -> StalenessResult:
     if reviewed_at is None:
         parsed = None
@@ -68,7 +70,7 @@ def evaluate_staleness(
             message=f"{label} reviewed_at is missing or invalid.",
         )
 
-    age_days = (date.today() - parsed).days
+    age_days = ((as_of or date.today()) - parsed).days
     is_hard_stale = age_days > hard_after_days
     is_stale = age_days > warn_after_days
 
@@ -2,15 +2,38 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
-from datetime import datetime
-from typing import Any
-
-from money_map.core.model import AppData, DataSourceInfo, ValidationReport
-from money_map.core.staleness import evaluate_staleness
-
-ALLOWED_LEGAL_GATES = {"ok", "require_check", "registration", "license", "blocked"}
-ALLOWED_CONFIDENCE = {"low", "medium", "high"}
+import hashlib
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from time import perf_counter
+from typing import Any, Callable, Iterable
+
+from money_map import __version__
+from money_map.core.cache import load_keyed, store_keyed
+from money_map.core.model import (
+    AppData,
+    DataSourceInfo,
+    Rulepack,
+    StalenessPolicy,
+    ValidationReport,
+    Variant,
+)
+from money_map.core.near_duplicates import DEFAULT_THRESHOLD, find_near_duplicates
+from money_map.core.staleness import StalenessResult, evaluate_staleness
+from money_map.core.validation_rules import (
+    RuleContext,
+    check_variant,
+    rule_at,
+    rule_issue,
+    rules_signature,
+)
+
+# Validated reports by token, most recently stored last.
+_REPORT_CACHE: dict[str, ValidationReport] = {}
+_REPORT_CACHE_SIZE = 8
+# Per-source validation sections by content key, most recently stored last.
+_SECTION_CACHE: dict[str, Any] = {}
+_SECTION_CACHE_SIZE = 8
 
 
 def _issue(
@@ -30,43 +53,6 @@ def _issue(
     }
 
 
-def _is_range(value: Any) -> bool:
-    return (
-        isinstance(value, list)
-        and len(value) == 2
-        and all(isinstance(v, (int, float)) for v in value)
-    )
-
-
-def _validate_numeric_range(
-    value: Any,
-    *,
-    source: str,
-    location: str,
-    code: str,
-    warns: list[dict[str, str]],
-) -> None:
-    if not _is_range(value):
-        warns.append(
-            _issue(
-                code,
-                source=source,
-                location=location,
-                hint="Expected numeric range [min, max].",
-            )
-        )
-        return
-    if value[0] > value[1]:
-        warns.append(
-            _issue(
-                f"{code}_ORDER",
-                source=source,
-                location=location,
-                hint="Range min must be <= max.",
-            )
-        )
-
-
 def _parse_iso_date(raw: str | None) -> datetime | None:
     if not raw:
         return None
@@ -146,10 +132,26 @@ def _dataset_version_from_sources(app_data: AppData) -> str:
     return app_data.meta.dataset_version
 
 
-def validate(app_data: AppData) -> ValidationReport:
-    fatals: list[dict[str, str]] = []
-    warns: list[dict[str, str]] = []
+@dataclass(frozen=True)
+class _RulepackSection:
+    fatals: list[dict[str, str]]
+    warns: list[dict[str, str]]
+    known_rule_ids: set[str]
+    staleness: StalenessResult
+
 
+@dataclass(frozen=True)
+class _VariantSection:
+    # Issues plus deferred cross-source checks, (rule position, variant_id, value, index)
+    # tuples resolved against the rulepack by `_resolve_checks`.
+    fatals: list[dict[str, str] | tuple]
+    warns: list[dict[str, str] | tuple]
+    stale_variants: list[str]
+    staleness_by_id: dict[str, dict]
+
+
+def _meta_fatals(app_data: AppData) -> list[dict[str, str]]:
+    fatals: list[dict[str, str]] = []
     if not app_data.meta.dataset_version:
         fatals.append(
             _issue(
@@ -159,6 +161,12 @@ def validate(app_data: AppData) -> ValidationReport:
             )
         )
 
+    return fatals
+
+
+def _rulepack_section(app_data: AppData) -> _RulepackSection:
+    fatals: list[dict[str, str]] = []
+    warns: list[dict[str, str]] = []
     reviewed_at = app_data.rulepack.reviewed_at
     rulepack_staleness = evaluate_staleness(
         reviewed_at,
@@ -205,6 +213,40 @@ def validate(app_data: AppData) -> ValidationReport:
             )
         known_rule_ids.add(rule.rule_id)
 
+    return _RulepackSection(fatals, warns, known_rule_ids, rulepack_staleness)
+
+
+def _check_variant(
+    variant: Variant,
+    policy: StalenessPolicy,
+    ctx: RuleContext,
+    fatals: list[dict[str, str] | tuple],
+    warns: list[dict[str, str] | tuple],
+    timings: dict[str, float] | None = None,
+) -> StalenessResult:
+    """Run the rule table over one variant in a single pass.
+
+    Cross-source rules only record their value; ``timings`` (seconds per rule code) is
+    filled when given.
+    """
+    variant_id = variant.variant_id
+    start = perf_counter() if timings is not None else 0.0
+    ctx.staleness = evaluate_staleness(
+        variant.review_date,
+        policy,
+        label=f"variant:{variant_id}",
+        invalid_severity="warn",
+    )
+    if timings is not None:
+        timings["staleness"] = timings.get("staleness", 0.0) + perf_counter() - start
+    check_variant(variant, ctx, fatals, warns, timings)
+    return ctx.staleness
+
+
+def _variant_section(app_data: AppData, timings: dict[str, float] | None = None) -> _VariantSection:
+    """Checks that only read `variants` (and the staleness policy); see `_resolve_checks`."""
+    fatals: list[dict[str, str] | tuple] = []
+    warns: list[dict[str, str] | tuple] = []
     if not app_data.variants:
         fatals.append(
             _issue(
@@ -216,214 +258,90 @@ def validate(app_data: AppData) -> ValidationReport:
 
     stale_variants: list[str] = []
     variant_staleness_by_id: dict[str, dict] = {}
-    known_variant_ids: set[str] = set()
+    ctx = RuleContext()
 
     for variant in app_data.variants:
-        if not variant.variant_id:
-            fatals.append(
-                _issue(
-                    "VARIANT_ID_MISSING",
-                    source="variants",
-                    location="variants[].variant_id",
-                )
-            )
-        elif variant.variant_id in known_variant_ids:
-            fatals.append(
-                _issue(
-                    "VARIANT_ID_DUPLICATE",
-                    message=f"Duplicate variant_id: {variant.variant_id}",
-                    source="variants",
-                    location=f"variants[{variant.variant_id}].variant_id",
-                )
-            )
-        known_variant_ids.add(variant.variant_id)
+        variant_staleness = _check_variant(
+            variant, app_data.meta.staleness_policy, ctx, fatals, warns, timings
+        )
+        if variant_staleness.is_stale:
+            stale_variants.append(variant.variant_id)
+        variant_staleness_by_id[variant.variant_id] = asdict(variant_staleness)
 
-        if not variant.title:
-            fatals.append(
-                _issue(
-                    "VARIANT_TITLE_MISSING",
-                    message=f"Variant title missing for {variant.variant_id}",
-                    source="variants",
-                    location=f"variants[{variant.variant_id}].title",
-                )
-            )
-        if not variant.summary:
-            warns.append(
-                _issue(
-                    "VARIANT_SUMMARY_MISSING",
-                    message=f"Variant summary missing for {variant.variant_id}",
-                    source="variants",
-                    location=f"variants[{variant.variant_id}].summary",
-                )
-            )
+    return _VariantSection(fatals, warns, stale_variants, variant_staleness_by_id)
 
-        if not variant.prep_steps:
-            warns.append(
-                _issue(
-                    "VARIANT_PREP_STEPS_EMPTY",
-                    source="variants",
-                    location=f"variants[{variant.variant_id}].prep_steps",
-                )
-            )
 
-        if not variant.economics:
-            warns.append(
-                _issue(
-                    "VARIANT_ECONOMICS_MISSING",
-                    message=f"Variant economics missing for {variant.variant_id}",
-                    source="variants",
-                    location=f"variants[{variant.variant_id}].economics",
-                )
-            )
-        else:
-            _validate_numeric_range(
-                variant.economics.get("time_to_first_money_days_range"),
-                source="variants",
-                location=f"variants[{variant.variant_id}].economics.time_to_first_money_days_range",
-                code="VARIANT_ECONOMICS_TIME_RANGE_INVALID",
-                warns=warns,
-            )
-            _validate_numeric_range(
-                variant.economics.get("typical_net_month_eur_range"),
-                source="variants",
-                location=f"variants[{variant.variant_id}].economics.typical_net_month_eur_range",
-                code="VARIANT_ECONOMICS_NET_RANGE_INVALID",
-                warns=warns,
-            )
-            _validate_numeric_range(
-                variant.economics.get("costs_eur_range"),
-                source="variants",
-                location=f"variants[{variant.variant_id}].economics.costs_eur_range",
-                code="VARIANT_ECONOMICS_COST_RANGE_INVALID",
-                warns=warns,
-            )
-            confidence = variant.economics.get("confidence")
-            if confidence and confidence not in ALLOWED_CONFIDENCE:
-                warns.append(
-                    _issue(
-                        "VARIANT_ECONOMICS_CONFIDENCE_UNKNOWN",
-                        message=f"Unknown confidence enum: {confidence}",
-                        source="variants",
-                        location=f"variants[{variant.variant_id}].economics.confidence",
-                        hint="Use one of: low, medium, high.",
-                    )
-                )
+def _resolve_checks(
+    items: list[dict[str, str] | tuple],
+    rulepack: Rulepack,
+    known_rule_ids: set[str],
+    timings: dict[str, float] | None = None,
+) -> list[dict[str, str]]:
+    ctx = RuleContext(
+        known_rule_ids=known_rule_ids, known_domains=set(rulepack.regulated_domains or [])
+    )
+    resolved: list[dict[str, str]] = []
+    for item in items:
+        if not isinstance(item, tuple):
+            resolved.append(item)
+            continue
+        position, variant_id, value, index = item
+        start = perf_counter() if timings is not None else 0.0
+        rule = rule_at(position)
+        if rule.predicate(value, ctx):
+            resolved.append(rule_issue(position, variant_id, value, index))
+        if timings is not None:
+            timings[rule.code] = timings.get(rule.code, 0.0) + perf_counter() - start
+    return resolved
 
-        if not variant.legal:
-            warns.append(
-                _issue(
-                    "VARIANT_LEGAL_MISSING",
-                    message=f"Variant legal missing for {variant.variant_id}",
-                    source="variants",
-                    location=f"variants[{variant.variant_id}].legal",
-                )
-            )
-        else:
-            legal_gate = variant.legal.get("legal_gate") or variant.legal.get("gate")
-            if not legal_gate:
-                warns.append(
-                    _issue(
-                        "VARIANT_LEGAL_GATE_MISSING",
-                        source="variants",
-                        location=f"variants[{variant.variant_id}].legal.legal_gate",
-                    )
-                )
-            elif legal_gate not in ALLOWED_LEGAL_GATES:
-                warns.append(
-                    _issue(
-                        "VARIANT_LEGAL_GATE_UNKNOWN",
-                        message=f"Unknown legal gate enum: {legal_gate}",
-                        source="variants",
-                        location=f"variants[{variant.variant_id}].legal.legal_gate",
-                        hint="Use one of: ok, require_check, registration, license, blocked.",
-                    )
-                )
 
-            regulated_domain = variant.regulated_domain
-            if regulated_domain:
-                known_domains = set(app_data.rulepack.regulated_domains or [])
-                if regulated_domain not in known_domains:
-                    warns.append(
-                        _issue(
-                            "VARIANT_REGULATED_DOMAIN_UNKNOWN",
-                            message=f"Unknown regulated_domain '{regulated_domain}'",
-                            source="variants",
-                            location=f"variants[{variant.variant_id}].regulated_domain",
-                        )
-                    )
-                if legal_gate == "ok":
-                    warns.append(
-                        _issue(
-                            "VARIANT_REGULATED_DOMAIN_GATE_TOO_WEAK",
-                            message=(
-                                "Variant "
-                                f"{variant.variant_id} has regulated_domain="
-                                f"{regulated_domain} but legal_gate=ok"
-                            ),
-                            source="variants",
-                            location=f"variants[{variant.variant_id}].legal.legal_gate",
-                            hint="Use require_check or stricter for regulated domains.",
-                        )
-                    )
-                if not list(variant.legal.get("checklist") or []):
-                    warns.append(
-                        _issue(
-                            "VARIANT_REGULATED_DOMAIN_CHECKLIST_EMPTY",
-                            source="variants",
-                            location=f"variants[{variant.variant_id}].legal.checklist",
-                        )
-                    )
-
-            referenced_rules = variant.legal.get("rule_ids", [])
-            if isinstance(referenced_rules, list):
-                for idx, rule_id in enumerate(referenced_rules):
-                    if rule_id not in known_rule_ids:
-                        warns.append(
-                            _issue(
-                                "VARIANT_RULE_REF_UNKNOWN",
-                                message=(
-                                    f"Unknown rule reference '{rule_id}' in {variant.variant_id}"
-                                ),
-                                source="variants",
-                                location=f"variants[{variant.variant_id}].legal.rule_ids[{idx}]",
-                            )
-                        )
-
-        feasibility = variant.feasibility or {}
-        for key in ("min_capital", "min_time_per_week"):
-            value = feasibility.get(key)
-            if value is not None and isinstance(value, (int, float)) and value < 0:
-                warns.append(
-                    _issue(
-                        "VARIANT_FEASIBILITY_NEGATIVE_VALUE",
-                        message=f"{key} cannot be negative for {variant.variant_id}",
-                        source="variants",
-                        location=f"variants[{variant.variant_id}].feasibility.{key}",
-                    )
-                )
+def validate(app_data: AppData) -> ValidationReport:
+    return _build_report(app_data, _rulepack_section(app_data), _variant_section(app_data))
 
-        variant_staleness = evaluate_staleness(
-            variant.review_date,
-            app_data.meta.staleness_policy,
-            label=f"variant:{variant.variant_id}",
-            invalid_severity="warn",
-        )
-        if variant_staleness.age_days is None:
-            warns.append(
-                _issue(
-                    "VARIANT_REVIEW_DATE_INVALID",
-                    message=f"Variant review date invalid for {variant.variant_id}",
-                    source="variants",
-                    location=f"variants[{variant.variant_id}].review_date",
-                )
+
+def validate_with_timings(app_data: AppData) -> tuple[ValidationReport, dict[str, float]]:
+    """Run a full `validate` and report the time spent per check, in milliseconds.
+
+    Keys are variant rule codes plus ``staleness``, ``meta``, ``rulepack`` and ``report``.
+    """
+    timings: dict[str, float] = {}
+    start = perf_counter()
+    rulepack_section = _rulepack_section(app_data)
+    timings["rulepack"] = perf_counter() - start
+    variant_section = _variant_section(app_data, timings)
+    report = _build_report(app_data, rulepack_section, variant_section, timings)
+    return report, {code: round(seconds * 1000, 3) for code, seconds in timings.items()}
+
+
+def near_duplicate_warns(
+    variants: Iterable[Any], threshold: float = DEFAULT_THRESHOLD
+) -> list[dict[str, str]]:
+    """One ``VARIANT_NEAR_DUPLICATE`` warn per cluster of near-identical variants.
+
+    ``variants`` may mix `Variant` objects and variant mappings (pack seeds, drafts).
+    """
+    warns: list[dict[str, str]] = []
+    for cluster in find_near_duplicates(variants, threshold=threshold):
+        warns.append(
+            _issue(
+                "VARIANT_NEAR_DUPLICATE",
+                message=(
+                    f"Near-duplicate variants (similarity >= {cluster.similarity:.2f}): "
+                    f"{', '.join(cluster.variant_ids)}"
+                ),
+                source="variants",
+                location=f"variants[{cluster.variant_ids[0]}]",
+                hint="Merge the variants or make their title, summary, tags and steps distinct.",
             )
-        if variant_staleness.is_stale:
-            stale_variants.append(variant.variant_id)
-        variant_staleness_by_id[variant.variant_id] = asdict(variant_staleness)
+        )
+    return warns
 
-    stale = False
+
+def _summary_warns(
+    rulepack_staleness: StalenessResult, stale_variants: list[str]
+) -> list[dict[str, str]]:
+    warns: list[dict[str, str]] = []
     if rulepack_staleness.is_stale:
-        stale = True
         warns.append(
             _issue(
                 "STALE_RULEPACK_HARD" if rulepack_staleness.is_hard_stale else "STALE_RULEPACK",
@@ -445,19 +363,52 @@ def validate(app_data: AppData) -> ValidationReport:
                 location="variants[].review_date",
             )
         )
+    return warns
+
+
+def _status(has_fatals: bool, stale: bool) -> str:
+    if has_fatals:
+        return "invalid"
+    if stale:
+        return "stale"
+    return "valid"
+
+
+def _build_report(
+    app_data: AppData,
+    rulepack_section: _RulepackSection,
+    variant_section: _VariantSection,
+    timings: dict[str, float] | None = None,
+) -> ValidationReport:
+    start = perf_counter()
+    meta_fatals = _meta_fatals(app_data)
+    if timings is not None:
+        timings["meta"] = perf_counter() - start
+    known_rule_ids = rulepack_section.known_rule_ids
+    fatals = (
+        meta_fatals
+        + rulepack_section.fatals
+        + _resolve_checks(variant_section.fatals, app_data.rulepack, known_rule_ids, timings)
+    )
+    warns = rulepack_section.warns + _resolve_checks(
+        variant_section.warns, app_data.rulepack, known_rule_ids, timings
+    )
+    start = perf_counter()
+    rulepack_staleness = rulepack_section.staleness
+    stale_variants = variant_section.stale_variants
+    variant_staleness_by_id = variant_section.staleness_by_id
 
-    if fatals:
-        status = "invalid"
-    elif stale:
-        status = "stale"
-    else:
-        status = "valid"
+    stale = rulepack_staleness.is_stale
+    warns.extend(_summary_warns(rulepack_staleness, stale_variants))
+    status = _status(bool(fatals), stale)
 
     source_staleness_by_source = {
         source.source: _source_staleness(source, app_data.meta.staleness_policy.warn_after_days)
         for source in app_data.sources
     }
     source_staleness_aggregated = _aggregate_source_staleness(source_staleness_by_source)
+    if timings is not None:
+        timings["report"] = perf_counter() - start
 
     return ValidationReport(
         status=status,
@@ -477,3 +428,96 @@ def validate(app_data: AppData) -> ValidationReport:
             "aggregated": source_staleness_aggregated,
         },
     )
+
+
+def _as_of_key() -> str:
+    return f"{date.today().isoformat()}|{datetime.utcnow().date().isoformat()}|{__version__}"
+
+
+def validation_token(app_data: AppData) -> str:
+    """Identify a validation result: dataset fingerprint plus the dates staleness depends on.
+
+    Empty for datasets without a fingerprint (built in memory), which are never memoized.
+    """
+    if not app_data.fingerprint:
+        return ""
+    payload = f"{app_data.fingerprint}|{_as_of_key()}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _section_key(app_data: AppData, name: str) -> str:
+    """Key of a per-source section: the file's sha256, the staleness policy and the dates."""
+    source_hash = app_data.source_hashes.get(name)
+    if not source_hash:
+        return ""
+    payload = "|".join(
+        [
+            name,
+            source_hash,
+            repr(app_data.meta.staleness_policy),
+            rules_signature(),
+            _as_of_key(),
+        ]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cached_section(app_data: AppData, name: str, build: Callable[[AppData], Any]) -> Any:
+    key = _section_key(app_data, name)
+    if not key:
+        return build(app_data)
+    section = _SECTION_CACHE.get(key)
+    if section is None:
+        section = load_keyed("validation-section", key)
+        if section is None:
+            section = build(app_data)
+            store_keyed("validation-section", key, section)
+    _SECTION_CACHE.pop(key, None)
+    _SECTION_CACHE[key] = section
+    while len(_SECTION_CACHE) > _SECTION_CACHE_SIZE:
+        del _SECTION_CACHE[next(iter(_SECTION_CACHE))]
+    return section
+
+
+def validate_incremental(app_data: AppData) -> ValidationReport:
+    """`validate`, reusing the rulepack and variants sections of unchanged source files.
+
+    Cross-source checks (rule references, regulated domains) and the meta checks always
+    run, so the report equals a full `validate`. Like `validate_cached`, this trusts
+    `AppData.source_hashes` and must not be given copies changed with `replace`.
+    """
+    return _build_report(
+        app_data,
+        _cached_section(app_data, "rulepack", _rulepack_section),
+        _cached_section(app_data, "variants", _variant_section),
+    )
+
+
+def validate_cached(app_data: AppData, *, revalidate: bool = False) -> ValidationReport:
+    """`validate` memoized per `validation_token`, in-process and in the on-disk cache.
+
+    Only pass datasets as loaded by `load_app_data`: a copy changed with `replace` keeps
+    the original fingerprint. A miss validates incrementally (`validate_incremental`);
+    ``revalidate`` runs a full `validate` and refreshes the report caches.
+    """
+    token = validation_token(app_data)
+    if not token:
+        return validate(app_data)
+    if not revalidate:
+        report = _REPORT_CACHE.get(token)
+        if report is None:
+            report = load_keyed("validation", token)
+        if isinstance(report, ValidationReport):
+            _remember_report(token, report)
+            return report
+    report = validate(app_data) if revalidate else validate_incremental(app_data)
+    _remember_report(token, report)
+    store_keyed("validation", token, report)
+    return report
+
+
+def _remember_report(token: str, report: ValidationReport) -> None:
+    _REPORT_CACHE.pop(token, None)
+    _REPORT_CACHE[token] = report
+    while len(_REPORT_CACHE) > _REPORT_CACHE_SIZE:
+        del _REPORT_CACHE[next(iter(_REPORT_CACHE))]
@@ -0,0 +1,388 @@
+"""Validation of regional packs (``data/packs/<pack_id>``).
+
+Each pack is validated on its own (meta, pack rulepack, variant/bridge/route seeds and
+occupation map), so packs can be checked in parallel worker processes. Results are
+merged in pack-directory order, which keeps the combined report deterministic however
+the work was scheduled.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Iterator
+
+from money_map.core.model import StalenessPolicy
+from money_map.core.staleness import evaluate_staleness
+from money_map.core.validate import _issue, _status
+from money_map.core.validation_rules import ALLOWED_CONFIDENCE, ALLOWED_LEGAL_GATES
+from money_map.storage.fs import iter_records, read_mapping
+
+PACK_FILES = {
+    "meta": "meta.yaml",
+    "rulepack": "rulepack.yaml",
+    "variants": "variants.seed.yaml",
+    "bridges": "bridges.seed.yaml",
+    "routes": "routes.seed.yaml",
+    "occupation_map": "occupation_map.yaml",
+}
+# Matrix cells: columns A..P, rows 1..4 (see `ui.data_status.aggregate_pack_metrics`).
+MATRIX_CELLS = frozenset(f"{chr(column)}{row}" for column in range(65, 81) for row in range(1, 5))
+
+
+def discover_packs(data_dir: str | Path = "data") -> list[Path]:
+    """Pack directories under ``<data_dir>/packs`` that contain a ``meta.yaml``, by name."""
+    packs_dir = Path(data_dir) / "packs"
+    if not packs_dir.is_dir():
+        return []
+    return sorted(path for path in packs_dir.iterdir() if (path / PACK_FILES["meta"]).is_file())
+
+
+def iter_pack_variants(data_dir: str | Path = "data") -> Iterator[dict[str, Any]]:
+    """Variant seed records of every pack, in pack order, read one record at a time."""
+    for pack_dir in discover_packs(data_dir):
+        path = pack_dir / PACK_FILES["variants"]
+        if path.is_file():
+            yield from (
+                record for record in iter_records(path, "variants") if isinstance(record, dict)
+            )
+
+
+class _PackChecks:
+    """Collects issues for one pack; ``source`` names the pack file they refer to."""
+
+    def __init__(self, pack_id: str) -> None:
+        self.pack_id = pack_id
+        self.fatals: list[dict[str, str]] = []
+        self.warns: list[dict[str, str]] = []
+
+    def source(self, name: str) -> str:
+        return f"packs/{self.pack_id}/{PACK_FILES[name]}"
+
+    def fatal(self, code: str, name: str, location: str, message: str | None = None) -> None:
+        self.fatals.append(
+            _issue(code, message=message, source=self.source(name), location=location)
+        )
+
+    def warn(self, code: str, name: str, location: str, message: str | None = None) -> None:
+        self.warns.append(
+            _issue(code, message=message, source=self.source(name), location=location)
+        )
+
+    def unique_ids(self, name: str, items: list[Any], file: str | None = None) -> set[str]:
+        """Report missing and duplicate ``id`` fields; returns the ids seen."""
+        file = file or name
+        seen: set[str] = set()
+        for index, item in enumerate(items):
+            item_id = str(item.get("id") or "") if isinstance(item, dict) else ""
+            if not item_id:
+                self.fatal(f"PACK_{name.upper()}_ID_MISSING", file, f"{name}[{index}].id")
+                continue
+            if item_id in seen:
+                self.fatal(
+                    f"PACK_{name.upper()}_ID_DUPLICATE",
+                    file,
+                    f"{name}[{item_id}].id",
+                    message=f"Duplicate {name} id in pack {self.pack_id}: {item_id}",
+                )
+            seen.add(item_id)
+        return seen
+
+
+def _items(payload: dict[str, Any], key: str) -> list[Any]:
+    items = payload.get(key) or []
+    return items if isinstance(items, list) else []
+
+
+def _known(value: Any, names: set[str] | frozenset[str]) -> bool:
+    """``value in names`` that is False for unhashable values instead of raising."""
+    return isinstance(value, str) and value in names
+
+
+def _policy_days(checks: _PackChecks, policy: dict[str, Any], key: str, default: int) -> int:
+    value = policy.get(key, default)
+    try:
+        if isinstance(value, bool):
+            raise TypeError(value)
+        return int(value)
+    except (TypeError, ValueError):
+        checks.fatal(
+            "PACK_RULEPACK_STALENESS_POLICY_INVALID",
+            "rulepack",
+            f"rulepack.staleness_policy.{key}",
+            message=f"Invalid {key} '{value}' in pack {checks.pack_id}; using {default}",
+        )
+        return default
+
+
+def _regulated_domains(checks: _PackChecks, rulepack: dict[str, Any]) -> set[str]:
+    raw = rulepack.get("regulated_domains") or {}
+    names = list(raw) if isinstance(raw, (dict, list)) else [raw]
+    domains = {name for name in names if isinstance(name, str)}
+    if len(domains) != len(names):
+        checks.fatal(
+            "PACK_RULEPACK_DOMAINS_INVALID",
+            "rulepack",
+            "rulepack.regulated_domains",
+            message=f"Regulated domains in pack {checks.pack_id} must be names",
+        )
+    return domains
+
+
+def _check_rulepack(checks: _PackChecks, rulepack: dict[str, Any], as_of: date | None) -> dict:
+    policy_payload = rulepack.get("staleness_policy") or {}
+    if not isinstance(policy_payload, dict):
+        checks.fatal(
+            "PACK_RULEPACK_STALENESS_POLICY_INVALID", "rulepack", "rulepack.staleness_policy"
+        )
+        policy_payload = {}
+    policy = StalenessPolicy(
+        warn_after_days=_policy_days(checks, policy_payload, "warn_after_days", 180),
+        hard_after_days=_policy_days(checks, policy_payload, "hard_after_days", 365),
+    )
+    staleness = evaluate_staleness(
+        rulepack.get("reviewed_at"), policy, label=f"pack:{checks.pack_id}:rulepack", as_of=as_of
+    )
+    if staleness.age_days is None:
+        checks.fatal("PACK_RULEPACK_REVIEWED_AT_INVALID", "rulepack", "rulepack.reviewed_at")
+    elif staleness.is_stale:
+        checks.warn("PACK_RULEPACK_STALE", "rulepack", "rulepack.reviewed_at", staleness.message)
+
+    rules = _items(rulepack, "rules")
+    if not rules:
+        checks.warn("PACK_RULEPACK_RULES_EMPTY", "rulepack", "rulepack.rules")
+    checks.unique_ids("rules", rules, "rulepack")
+    domains = _regulated_domains(checks, rulepack)
+    for rule in rules:
+        domain = rule.get("domain") if isinstance(rule, dict) else None
+        if domain and not _known(domain, domains):
+            checks.warn(
+                "PACK_RULE_DOMAIN_UNKNOWN",
+                "rulepack",
+                f"rules[{rule.get('id')}].domain",
+                message=f"Unknown regulated domain '{domain}' in pack {checks.pack_id}",
+            )
+    return {"policy": policy, "domains": domains, "staleness": staleness, "rules": len(rules)}
+
+
+def _check_variants(
+    checks: _PackChecks, variants: list[Any], rulepack_info: dict, as_of: date | None
+) -> list[str]:
+    checks.unique_ids("variants", variants)
+    stale: list[str] = []
+    for variant in variants:
+        if not isinstance(variant, dict) or not variant.get("id"):
+            continue
+        variant_id = variant["id"]
+        location = f"variants[{variant_id}]"
+        if not variant.get("title"):
+            checks.fatal("PACK_VARIANT_TITLE_MISSING", "variants", f"{location}.title")
+        if not _known(variant.get("cell_id"), MATRIX_CELLS):
+            checks.fatal(
+                "PACK_VARIANT_CELL_UNKNOWN",
+                "variants",
+                f"{location}.cell_id",
+                message=f"Unknown matrix cell '{variant.get('cell_id')}' for {variant_id}",
+            )
+        low, high = variant.get("range_low"), variant.get("range_high")
+        if not all(isinstance(value, (int, float)) for value in (low, high)):
+            checks.warn("PACK_VARIANT_RANGE_INVALID", "variants", f"{location}.range_low")
+        elif low > high:
+            checks.warn("PACK_VARIANT_RANGE_ORDER", "variants", f"{location}.range_low")
+        if not _known(variant.get("confidence"), ALLOWED_CONFIDENCE):
+            checks.warn("PACK_VARIANT_CONFIDENCE_UNKNOWN", "variants", f"{location}.confidence")
+        if not _known(variant.get("legal_gate"), ALLOWED_LEGAL_GATES):
+            checks.warn("PACK_VARIANT_LEGAL_GATE_UNKNOWN", "variants", f"{location}.legal_gate")
+        domain = variant.get("regulated_domain")
+        if domain and not _known(domain, rulepack_info["domains"]):
+            checks.warn(
+                "PACK_VARIANT_REGULATED_DOMAIN_UNKNOWN",
+                "variants",
+                f"{location}.regulated_domain",
+                message=f"Unknown regulated_domain '{domain}' in {variant_id}",
+            )
+        staleness = evaluate_staleness(
+            variant.get("reviewed_at"),
+            rulepack_info["policy"],
+            label=f"pack:{checks.pack_id}:{variant_id}",
+            invalid_severity="warn",
+            as_of=as_of,
+        )
+        if staleness.age_days is None:
+            checks.warn("PACK_VARIANT_REVIEWED_AT_INVALID", "variants", f"{location}.reviewed_at")
+        elif staleness.is_stale:
+            stale.append(variant_id)
+    if stale:
+        checks.warn(
+            "PACK_STALE_VARIANTS",
+            "variants",
+            "variants[].reviewed_at",
+            message=f"Stale variants in pack {checks.pack_id}: {len(stale)}",
+        )
+    return stale
+
+
+def _check_bridges_and_routes(checks: _PackChecks, bridges: list[Any], routes: list[Any]) -> None:
+    bridge_ids = checks.unique_ids("bridges", bridges)
+    for bridge in bridges:
+        if not isinstance(bridge, dict):
+            continue
+        for key in ("from_cell", "to_cell"):
+            if not _known(bridge.get(key), MATRIX_CELLS):
+                checks.fatal(
+                    "PACK_BRIDGE_CELL_UNKNOWN",
+                    "bridges",
+                    f"bridges[{bridge.get('id')}].{key}",
+                    message=f"Unknown matrix cell '{bridge.get(key)}' in bridge {bridge.get('id')}",
+                )
+    checks.unique_ids("routes", routes)
+    for route in routes:
+        if not isinstance(route, dict):
+            continue
+        steps = _items(route, "steps")
+        if not steps:
+            checks.warn("PACK_ROUTE_STEPS_EMPTY", "routes", f"routes[{route.get('id')}].steps")
+        for index, step in enumerate(steps):
+            bridge_id = step.get("bridge_id") if isinstance(step, dict) else None
+            if not _known(bridge_id, bridge_ids):
+                checks.fatal(
+                    "PACK_ROUTE_BRIDGE_UNKNOWN",
+                    "routes",
+                    f"routes[{route.get('id')}].steps[{index}].bridge_id",
+                    message=f"Route {route.get('id')} references unknown bridge '{bridge_id}'",
+                )
+
+
+def _check_occupation_map(checks: _PackChecks, maps: list[Any]) -> None:
+    checks.unique_ids("maps", maps, "occupation_map")
+    for entry in maps:
+        if not isinstance(entry, dict):
+            continue
+        assign = entry.get("assign")
+        cell_id = assign.get("cell_id") if isinstance(assign, dict) else None
+        if not _known(cell_id, MATRIX_CELLS):
+            checks.fatal(
+                "PACK_OCCUPATION_MAP_CELL_UNKNOWN",
+                "occupation_map",
+                f"maps[{entry.get('id')}].assign.cell_id",
+                message=f"Unknown matrix cell '{cell_id}' in occupation map {entry.get('id')}",
+            )
+
+
+def validate_pack(pack_dir: str | Path, as_of: date | None = None) -> dict[str, Any]:
+    """Validate one pack directory; the result carries issues, counts and timings (ms)."""
+    pack_dir = Path(pack_dir)
+    checks = _PackChecks(pack_dir.name)
+    timings: dict[str, float] = {}
+
+    start = perf_counter()
+    payloads: dict[str, dict[str, Any]] = {}
+    for name, filename in PACK_FILES.items():
+        path = pack_dir / filename
+        if not path.is_file():
+            checks.fatal("PACK_FILE_MISSING", name, name, message=f"Missing pack file {path}")
+            payloads[name] = {}
+            continue
+        try:
+            payloads[name] = read_mapping(path)
+        except Exception as exc:
+            checks.fatal("PACK_FILE_INVALID", name, name, message=f"Unreadable {path}: {exc}")
+            payloads[name] = {}
+    timings["read"] = perf_counter() - start
+
+    start = perf_counter()
+    meta = payloads["meta"]
+    if meta and meta.get("pack_id") != pack_dir.name:
+        checks.warn(
+            "PACK_ID_MISMATCH",
+            "meta",
+            "meta.pack_id",
+            message=f"meta.pack_id '{meta.get('pack_id')}' differs from '{pack_dir.name}'",
+        )
+    rulepack_info = _check_rulepack(checks, payloads["rulepack"], as_of)
+    timings["rulepack"] = perf_counter() - start
+
+    start = perf_counter()
+    variants = _items(payloads["variants"], "variants")
+    if not variants:
+        checks.fatal("PACK_VARIANTS_EMPTY", "variants", "variants")
+    stale_variants = _check_variants(checks, variants, rulepack_info, as_of)
+    timings["variants"] = perf_counter() - start
+
+    start = perf_counter()
+    bridges = _items(payloads["bridges"], "bridges")
+    routes = _items(payloads["routes"], "routes")
+    _check_bridges_and_routes(checks, bridges, routes)
+    maps = _items(payloads["occupation_map"], "maps")
+    _check_occupation_map(checks, maps)
+    timings["bridges_routes_maps"] = perf_counter() - start
+
+    stale = rulepack_info["staleness"].is_stale
+    return {
+        "pack_id": checks.pack_id,
+        "pack_version": str(meta.get("pack_version", "") or ""),
+        "status": _status(bool(checks.fatals), stale),
+        "stale": stale,
+        "reviewed_at": str(payloads["rulepack"].get("reviewed_at", "") or ""),
+        "counts": {
+            "variants": len(variants),
+            "stale_variants": len(stale_variants),
+            "bridges": len(bridges),
+            "routes": len(routes),
+            "rules": rulepack_info["rules"],
+            "occupation_maps": len(maps),
+        },
+        "fatals": checks.fatals,
+        "warns": checks.warns,
+        "timings_ms": {key: round(seconds * 1000, 3) for key, seconds in timings.items()},
+    }
+
+
+def _validate_pack_task(args: tuple[str, date | None]) -> dict[str, Any]:
+    start = perf_counter()
+    result = validate_pack(*args)
+    result["timings_ms"]["total"] = round((perf_counter() - start) * 1000, 3)
+    return result
+
+
+def validate_packs(
+    data_dir: str | Path = "data",
+    *,
+    max_workers: int | None = None,
+    as_of: date | None = None,
+) -> dict[str, Any]:
+    """Validate every pack under ``<data_dir>/packs``, one worker process per pack.
+
+    Issues are merged in pack-directory order and tagged with their ``pack`` id, so the
+    report does not depend on which worker finished first. ``max_workers=1`` validates
+    in-process; if worker processes are unavailable the packs are validated sequentially.
+    """
+    start = perf_counter()
+    tasks = [(str(path), as_of) for path in discover_packs(data_dir)]
+    workers = min(len(tasks), max_workers or os.cpu_count() or 1)
+    results: list[dict[str, Any]] | None = None
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_validate_pack_task, tasks))
+        except (OSError, BrokenProcessPool, NotImplementedError):
+            results = None
+    if results is None:
+        results = [_validate_pack_task(task) for task in tasks]
+
+    fatals = [{"pack": pack["pack_id"], **issue} for pack in results for issue in pack["fatals"]]
+    warns = [{"pack": pack["pack_id"], **issue} for pack in results for issue in pack["warns"]]
+    return {
+        "status": _status(bool(fatals), any(pack["stale"] for pack in results)),
+        "packs": results,
+        "fatals": fatals,
+        "warns": warns,
+        "timings_ms": {
+            "total": round((perf_counter() - start) * 1000, 3),
+            **{pack["pack_id"]: pack["timings_ms"]["total"] for pack in results},
+        },
+    }
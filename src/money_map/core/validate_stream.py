@@ -0,0 +1,128 @@
+"""Streaming validation of large variant files in bounded memory.
+
+Variants are read one record at a time and checked with the same per-variant rules as
+`validate`. Only the variant ids seen so far (for duplicate detection) and the ids of
+stale variants are kept; each issue is yielded as soon as it is found.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import yaml
+
+from money_map.core.load import _load_variant, load_meta_and_rulepack, variants_path
+from money_map.core.model import AppData, Meta, Rulepack
+from money_map.core.validate import (
+    _check_variant,
+    _issue,
+    _meta_fatals,
+    _resolve_checks,
+    _rulepack_section,
+    _status,
+    _summary_warns,
+)
+from money_map.core.validation_rules import RuleContext
+from money_map.storage.fs import iter_records
+
+
+def _issue_record(severity: str, issue: dict[str, str]) -> dict[str, Any]:
+    return {"type": "issue", "severity": severity, **issue}
+
+
+def _invalid_record(index: int, problem: str) -> dict[str, str]:
+    return _issue(
+        "VARIANT_RECORD_INVALID",
+        message=f"Variant record {index} {problem}",
+        source="variants",
+        location=f"variants[{index}]",
+    )
+
+
+def stream_validation(
+    meta: Meta, rulepack: Rulepack, records: Iterable[Any]
+) -> Iterator[dict[str, Any]]:
+    """Yield ``issue`` records while checking ``records``, then one ``summary`` record.
+
+    Per severity, issues come in the same order as in `validate`. Records that are not
+    well-formed variants are reported as ``VARIANT_RECORD_INVALID`` fatals and skipped. A
+    YAML or JSON syntax error ends the stream with the same fatal.
+    """
+    context = AppData(meta=meta, rulepack=rulepack, variants=[], sources=[])
+    counts = {"fatal": 0, "warn": 0}
+
+    def _emit(severity: str, issues: Iterable[dict[str, str]]) -> Iterator[dict[str, Any]]:
+        for issue in issues:
+            counts[severity] += 1
+            yield _issue_record(severity, issue)
+
+    rulepack_section = _rulepack_section(context)
+    yield from _emit("fatal", _meta_fatals(context) + rulepack_section.fatals)
+    yield from _emit("warn", rulepack_section.warns)
+
+    ctx = RuleContext()
+    stale_variants: list[str] = []
+    total = 0
+    unreadable = False
+    iterator = iter(records)
+    while True:
+        index = total
+        try:
+            record = next(iterator)
+        except StopIteration:
+            break
+        except (yaml.YAMLError, ValueError) as exc:
+            # The parser cannot resume after a syntax error; report it and stop reading.
+            unreadable = True
+            yield from _emit("fatal", [_invalid_record(index, f"cannot be read: {exc}")])
+            break
+        total += 1
+        fatals: list[dict[str, str] | tuple] = []
+        warns: list[dict[str, str] | tuple] = []
+        try:
+            if not isinstance(record, dict):
+                raise ValueError(record if isinstance(record, Exception) else "not a mapping")
+            variant = _load_variant(record)
+            staleness = _check_variant(variant, meta.staleness_policy, ctx, fatals, warns)
+        except (AttributeError, TypeError, ValueError) as exc:
+            yield from _emit("fatal", [_invalid_record(index, f"is invalid: {exc}")])
+            continue
+        known_rule_ids = rulepack_section.known_rule_ids
+        yield from _emit("fatal", _resolve_checks(fatals, rulepack, known_rule_ids))
+        yield from _emit("warn", _resolve_checks(warns, rulepack, known_rule_ids))
+        if staleness.is_stale:
+            stale_variants.append(variant.variant_id)
+
+    if not total and not unreadable:
+        yield from _emit(
+            "fatal", [_issue("VARIANTS_EMPTY", source="variants", location="variants")]
+        )
+    yield from _emit("warn", _summary_warns(rulepack_section.staleness, stale_variants))
+
+    stale = rulepack_section.staleness.is_stale
+    yield {
+        "type": "summary",
+        "status": _status(counts["fatal"] > 0, stale),
+        "dataset_version": meta.dataset_version,
+        "reviewed_at": rulepack.reviewed_at,
+        "stale": stale,
+        "variants": total,
+        "stale_variants": len(stale_variants),
+        "fatals": counts["fatal"],
+        "warns": counts["warn"],
+    }
+
+
+def stream_validate_file(
+    data_dir: str | Path = "data", variants_file: str | Path | None = None
+) -> Iterator[dict[str, Any]]:
+    """Stream-validate ``variants_file`` (default: the dataset's own variants file).
+
+    ``meta`` and the rulepack come from ``data_dir``. YAML is read event by event and
+    ``.jsonl``/``.ndjson`` dumps line by line.
+    """
+    meta, rulepack = load_meta_and_rulepack(data_dir)
+    path = Path(variants_file) if variants_file else variants_path(data_dir)
+    records = iter_records(path, "variants", return_exceptions=True)
+    return stream_validation(meta, rulepack, records)
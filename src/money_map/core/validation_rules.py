@@ -0,0 +1,439 @@
+"""Declarative per-variant validation rules.
+
+Each `VariantRule` names an issue code, a selector that reads a value from a variant and
+a predicate that is true when that value violates the rule. Selectors and guards take the
+variant; predicates take the selected value and a `RuleContext`. The table is compiled
+once into plain tuples grouped by guard, so `check_variant` runs one tight loop per
+variant: each guard is called once per group, a selector shared by neighbouring rules is
+called once, and issue dicts are only formatted for violations. Message and location
+templates may use ``{variant_id}``, ``{value}`` and, for ``each`` rules, ``{index}``.
+
+Rules run in table order, which is also the order of the issues they report.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable
+
+from money_map.core.model import Variant
+from money_map.core.staleness import StalenessResult
+
+ALLOWED_LEGAL_GATES = {"ok", "require_check", "registration", "license", "blocked"}
+ALLOWED_CONFIDENCE = {"low", "medium", "high"}
+
+
+@dataclass
+class RuleContext:
+    """State a predicate may read: ids seen earlier in the pass and cross-source facts."""
+
+    seen_variant_ids: set[str] = field(default_factory=set)
+    staleness: StalenessResult | None = None
+    known_rule_ids: set[str] = field(default_factory=set)
+    known_domains: set[str] = field(default_factory=set)
+
+
+@dataclass(frozen=True)
+class VariantRule:
+    code: str
+    severity: str  # "fatal" or "warn"
+    selector: Callable[[Variant], Any]
+    predicate: Callable[[Any, RuleContext], bool]
+    location: str
+    message: str | None = None
+    hint: str = ""
+    # Run only when this is true for the variant (e.g. economics present).
+    when: Callable[[Variant], Any] | None = None
+    # The selector returns a sequence and every failing element is reported.
+    each: bool = False
+    # The predicate needs the rulepack: the value is recorded and checked on assembly,
+    # so cached variant results stay valid when only the rulepack changes.
+    cross_source: bool = False
+
+
+def _is_range(value: Any) -> bool:
+    # Runs twice per range per variant (shape, then order), so no generator here.
+    if not isinstance(value, list) or len(value) != 2:
+        return False
+    low, high = value
+    return isinstance(low, (int, float)) and isinstance(high, (int, float))
+
+
+def _legal_gate(legal: dict[str, Any]) -> Any:
+    return legal.get("legal_gate") or legal.get("gate")
+
+
+def _rule_refs(legal: dict[str, Any]) -> list[Any]:
+    referenced = legal.get("rule_ids", [])
+    return referenced if isinstance(referenced, list) else []
+
+
+def _missing(value: Any, _ctx: RuleContext) -> bool:
+    return not value
+
+
+def _variant_id(variant: Variant) -> str:
+    return variant.variant_id
+
+
+def _has_economics(variant: Variant) -> bool:
+    return bool(variant.economics)
+
+
+def _has_legal(variant: Variant) -> bool:
+    return bool(variant.legal)
+
+
+def _is_regulated(variant: Variant) -> bool:
+    return bool(variant.legal and variant.regulated_domain)
+
+
+def _range_rules(key: str, code: str) -> list[VariantRule]:
+    location = f"variants[{{variant_id}}].economics.{key}"
+
+    def _select(variant: Variant) -> Any:
+        return variant.economics.get(key)
+
+    return [
+        VariantRule(
+            code=code,
+            severity="warn",
+            selector=_select,
+            predicate=lambda value, _ctx: not _is_range(value),
+            location=location,
+            hint="Expected numeric range [min, max].",
+            when=_has_economics,
+        ),
+        VariantRule(
+            code=f"{code}_ORDER",
+            severity="warn",
+            selector=_select,
+            predicate=lambda value, _ctx: _is_range(value) and value[0] > value[1],
+            location=location,
+            hint="Range min must be <= max.",
+            when=_has_economics,
+        ),
+    ]
+
+
+def _negative_rule(key: str) -> VariantRule:
+    return VariantRule(
+        code="VARIANT_FEASIBILITY_NEGATIVE_VALUE",
+        severity="warn",
+        selector=lambda variant: (variant.feasibility or {}).get(key),
+        predicate=lambda value, _ctx: (
+            value is not None and isinstance(value, (int, float)) and value < 0
+        ),
+        location=f"variants[{{variant_id}}].feasibility.{key}",
+        message=f"{key} cannot be negative for {{variant_id}}",
+    )
+
+
+VARIANT_RULES: list[VariantRule] = [
+    VariantRule(
+        code="VARIANT_ID_MISSING",
+        severity="fatal",
+        selector=_variant_id,
+        predicate=_missing,
+        location="variants[].variant_id",
+    ),
+    VariantRule(
+        code="VARIANT_ID_DUPLICATE",
+        severity="fatal",
+        selector=_variant_id,
+        predicate=lambda value, ctx: bool(value) and value in ctx.seen_variant_ids,
+        location="variants[{variant_id}].variant_id",
+        message="Duplicate variant_id: {variant_id}",
+    ),
+    VariantRule(
+        code="VARIANT_TITLE_MISSING",
+        severity="fatal",
+        selector=lambda variant: variant.title,
+        predicate=_missing,
+        location="variants[{variant_id}].title",
+        message="Variant title missing for {variant_id}",
+    ),
+    VariantRule(
+        code="VARIANT_SUMMARY_MISSING",
+        severity="warn",
+        selector=lambda variant: variant.summary,
+        predicate=_missing,
+        location="variants[{variant_id}].summary",
+        message="Variant summary missing for {variant_id}",
+    ),
+    VariantRule(
+        code="VARIANT_PREP_STEPS_EMPTY",
+        severity="warn",
+        selector=lambda variant: variant.prep_steps,
+        predicate=_missing,
+        location="variants[{variant_id}].prep_steps",
+    ),
+    VariantRule(
+        code="VARIANT_ECONOMICS_MISSING",
+        severity="warn",
+        selector=lambda variant: variant.economics,
+        predicate=_missing,
+        location="variants[{variant_id}].economics",
+        message="Variant economics missing for {variant_id}",
+    ),
+    *_range_rules("time_to_first_money_days_range", "VARIANT_ECONOMICS_TIME_RANGE_INVALID"),
+    *_range_rules("typical_net_month_eur_range", "VARIANT_ECONOMICS_NET_RANGE_INVALID"),
+    *_range_rules("costs_eur_range", "VARIANT_ECONOMICS_COST_RANGE_INVALID"),
+    VariantRule(
+        code="VARIANT_ECONOMICS_CONFIDENCE_UNKNOWN",
+        severity="warn",
+        selector=lambda variant: variant.economics.get("confidence"),
+        predicate=lambda value, _ctx: bool(value) and value not in ALLOWED_CONFIDENCE,
+        location="variants[{variant_id}].economics.confidence",
+        message="Unknown confidence enum: {value}",
+        hint="Use one of: low, medium, high.",
+        when=_has_economics,
+    ),
+    VariantRule(
+        code="VARIANT_LEGAL_MISSING",
+        severity="warn",
+        selector=lambda variant: variant.legal,
+        predicate=_missing,
+        location="variants[{variant_id}].legal",
+        message="Variant legal missing for {variant_id}",
+    ),
+    VariantRule(
+        code="VARIANT_LEGAL_GATE_MISSING",
+        severity="warn",
+        selector=lambda variant: _legal_gate(variant.legal),
+        predicate=_missing,
+        location="variants[{variant_id}].legal.legal_gate",
+        when=_has_legal,
+    ),
+    VariantRule(
+        code="VARIANT_LEGAL_GATE_UNKNOWN",
+        severity="warn",
+        selector=lambda variant: _legal_gate(variant.legal),
+        predicate=lambda value, _ctx: bool(value) and value not in ALLOWED_LEGAL_GATES,
+        location="variants[{variant_id}].legal.legal_gate",
+        message="Unknown legal gate enum: {value}",
+        hint="Use one of: ok, require_check, registration, license, blocked.",
+        when=_has_legal,
+    ),
+    VariantRule(
+        code="VARIANT_REGULATED_DOMAIN_UNKNOWN",
+        severity="warn",
+        selector=lambda variant: variant.regulated_domain,
+        predicate=lambda value, ctx: value not in ctx.known_domains,
+        location="variants[{variant_id}].regulated_domain",
+        message="Unknown regulated_domain '{value}'",
+        when=_is_regulated,
+        cross_source=True,
+    ),
+    VariantRule(
+        code="VARIANT_REGULATED_DOMAIN_GATE_TOO_WEAK",
+        severity="warn",
+        selector=lambda variant: (variant.regulated_domain, _legal_gate(variant.legal)),
+        predicate=lambda value, _ctx: value[1] == "ok",
+        location="variants[{variant_id}].legal.legal_gate",
+        message="Variant {variant_id} has regulated_domain={value[0]} but legal_gate=ok",
+        hint="Use require_check or stricter for regulated domains.",
+        when=_is_regulated,
+    ),
+    VariantRule(
+        code="VARIANT_REGULATED_DOMAIN_CHECKLIST_EMPTY",
+        severity="warn",
+        selector=lambda variant: variant.legal.get("checklist"),
+        predicate=lambda value, _ctx: not list(value or []),
+        location="variants[{variant_id}].legal.checklist",
+        when=_is_regulated,
+    ),
+    VariantRule(
+        code="VARIANT_RULE_REF_UNKNOWN",
+        severity="warn",
+        selector=lambda variant: _rule_refs(variant.legal),
+        predicate=lambda value, ctx: value not in ctx.known_rule_ids,
+        location="variants[{variant_id}].legal.rule_ids[{index}]",
+        message="Unknown rule reference '{value}' in {variant_id}",
+        when=_has_legal,
+        each=True,
+        cross_source=True,
+    ),
+    _negative_rule("min_capital"),
+    _negative_rule("min_time_per_week"),
+    VariantRule(
+        code="VARIANT_REVIEW_DATE_INVALID",
+        severity="warn",
+        selector=lambda variant: variant.review_date,
+        predicate=lambda _value, ctx: ctx.staleness is not None and ctx.staleness.age_days is None,
+        location="variants[{variant_id}].review_date",
+        message="Variant review date invalid for {variant_id}",
+    ),
+]
+
+_SIGNATURE: str | None = None
+# (table the plan was built from, plan); see `_plan`.
+_PLAN: tuple[list[VariantRule], tuple] | None = None
+
+
+def register_variant_rule(rule: VariantRule, *, before: str | None = None) -> None:
+    """Add a rule to the table (at the end, or before the first rule with code ``before``)."""
+    global _SIGNATURE, _PLAN
+    if rule.severity not in {"fatal", "warn"}:
+        raise ValueError(f"Unknown rule severity: {rule.severity}")
+    if not callable(rule.selector) or not callable(rule.predicate):
+        raise TypeError(f"Rule {rule.code} needs a callable selector and predicate")
+    if rule.when is not None and not callable(rule.when):
+        raise TypeError(f"Rule {rule.code} needs a callable guard")
+    position = len(VARIANT_RULES)
+    if before is not None:
+        position = next(
+            (index for index, existing in enumerate(VARIANT_RULES) if existing.code == before),
+            position,
+        )
+    VARIANT_RULES.insert(position, rule)
+    _SIGNATURE = None
+    _PLAN = None
+
+
+def _describe(func: Callable[..., Any] | None) -> str:
+    """Name of ``func`` plus a digest of its code, so edited lambdas change the signature."""
+    if func is None:
+        return "None"
+    name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return name
+    digest = hashlib.sha256(code.co_code + repr(code.co_consts).encode("utf-8")).hexdigest()
+    return f"{name}#{digest[:12]}"
+
+
+def rules_signature() -> str:
+    """Identity of the current rule table; part of the cached validation section key."""
+    global _SIGNATURE
+    if _SIGNATURE is None:
+        _SIGNATURE = "|".join(
+            ":".join(
+                [
+                    rule.code,
+                    rule.severity,
+                    _describe(rule.when),
+                    _describe(rule.selector),
+                    _describe(rule.predicate),
+                    rule.location,
+                    str(rule.message),
+                    str(rule.each),
+                    str(rule.cross_source),
+                ]
+            )
+            for rule in VARIANT_RULES
+        )
+    return _SIGNATURE
+
+
+def _plan() -> tuple:
+    """The rule table as ``(guard, steps)`` groups of consecutive rules sharing a guard.
+
+    A step is ``(position, is_fatal, selector, predicate, rule)``. The predicate is None
+    for `_missing`, which the loop inlines, and ``rule`` is only set for ``each`` and
+    cross-source rules, which go through `_check_rule`. Rebuilt when the
+    table changes.
+    """
+    global _PLAN
+    if _PLAN is None or _PLAN[0] is not VARIANT_RULES:
+        groups: list[tuple[Any, list[tuple]]] = []
+        for position, rule in enumerate(VARIANT_RULES):
+            if not groups or groups[-1][0] is not rule.when:
+                groups.append((rule.when, []))
+            groups[-1][1].append(
+                (
+                    position,
+                    rule.severity == "fatal",
+                    rule.selector,
+                    None if rule.predicate is _missing else rule.predicate,
+                    rule if rule.each or rule.cross_source else None,
+                )
+            )
+        _PLAN = (VARIANT_RULES, tuple((when, tuple(steps)) for when, steps in groups))
+    return _PLAN[1]
+
+
+def check_variant(
+    variant: Variant,
+    ctx: RuleContext,
+    fatals: list[dict[str, str] | tuple],
+    warns: list[dict[str, str] | tuple],
+    timings: dict[str, float] | None = None,
+) -> None:
+    """Run every rule over ``variant`` in table order.
+
+    Cross-source rules append ``(position, variant_id, value, index)`` tuples that
+    `rule_issue` turns into issues once the rulepack is known. ``timings`` (seconds per
+    rule code) is filled when given.
+    """
+    if timings is not None:
+        _check_variant_timed(variant, ctx, fatals, warns, timings)
+        return
+    variant_id = variant.variant_id
+    for when, steps in _plan():
+        if when is not None and not when(variant):
+            continue
+        last_selector = value = None
+        for position, is_fatal, selector, predicate, rule in steps:
+            if selector is not last_selector:
+                value = selector(variant)
+                last_selector = selector
+            if rule is not None:
+                _check_rule(rule, position, variant_id, value, ctx, fatals, warns)
+            elif not value if predicate is None else predicate(value, ctx):
+                (fatals if is_fatal else warns).append(rule_issue(position, variant_id, value))
+    ctx.seen_variant_ids.add(variant_id)
+
+
+def _check_rule(
+    rule: VariantRule,
+    position: int,
+    variant_id: str,
+    value: Any,
+    ctx: RuleContext,
+    fatals: list[dict[str, str] | tuple],
+    warns: list[dict[str, str] | tuple],
+) -> None:
+    """Check one rule against its selected value; cross-source values are only recorded."""
+    target = fatals if rule.severity == "fatal" else warns
+    items = enumerate(value) if rule.each else ((None, value),)
+    for index, item in items:
+        if rule.cross_source:
+            target.append((position, variant_id, item, index))
+        elif rule.predicate(item, ctx):
+            target.append(rule_issue(position, variant_id, item, index))
+
+
+def _check_variant_timed(
+    variant: Variant,
+    ctx: RuleContext,
+    fatals: list[dict[str, str] | tuple],
+    warns: list[dict[str, str] | tuple],
+    timings: dict[str, float],
+) -> None:
+    """`check_variant` rule by rule, adding each rule's time to ``timings``."""
+    variant_id = variant.variant_id
+    for position, rule in enumerate(VARIANT_RULES):
+        start = perf_counter()
+        if rule.when is None or rule.when(variant):
+            _check_rule(rule, position, variant_id, rule.selector(variant), ctx, fatals, warns)
+        timings[rule.code] = timings.get(rule.code, 0.0) + perf_counter() - start
+    ctx.seen_variant_ids.add(variant_id)
+
+
+def rule_at(position: int) -> VariantRule:
+    return VARIANT_RULES[position]
+
+
+def rule_issue(position: int, variant_id: str, value: Any, index: int | None = None) -> dict:
+    rule = VARIANT_RULES[position]
+    fields = {"variant_id": variant_id, "value": value, "index": index}
+    return {
+        "code": rule.code,
+        "message": rule.message.format(**fields) if rule.message else rule.code,
+        "source": "variants",
+        "location": rule.location.format(**fields),
+        "hint": rule.hint,
+    }
@@ -0,0 +1,258 @@
+"""Memory-mapped columnar store of the variant fields read by `recommend`.
+
+`money-map compile` writes ``compiled/variants.columns`` next to the dataset artifact.
+The file holds one fixed-width column per numeric/enum field plus a variant id table, so
+any number of worker processes can `mmap` it and share a single page-cached copy instead
+of unpickling private `Variant` objects.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from array import array
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+from money_map.core.economics import ALLOWED_CONFIDENCE, _normalize_range
+from money_map.core.feasibility import _LANGUAGE_ORDER, _language_rank
+from money_map.core.model import Variant
+from money_map.core.rules import _normalized_legal_gate
+from money_map.core.staleness import _parse_date
+
+STORE_FORMAT_VERSION = 2
+STORE_MAGIC = b"MMVCOLS\x00"
+_BYTE_ORDER_MARK = 0x01020304
+# magic, byte-order mark, format version, rows, compiled_ns of the matching artifact
+_HEADER = struct.Struct("=8sIIIq")
+
+LEGAL_GATES = ("ok", "require_check", "registration", "license", "blocked")
+CONFIDENCE_LEVELS = ("low", "medium", "high", "unknown")
+# `min_language_rank` values below zero: no requirement, or a level outside _LANGUAGE_ORDER.
+LANGUAGE_NOT_REQUIRED = -2
+LANGUAGE_UNKNOWN = -1
+
+# Range bounds are int64 and clamped to its limits (see `_range`); review ordinals are at
+# most `date.max.toordinal()`, so int32 holds them.
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+# Widest items first so every column stays naturally aligned.
+COLUMNS: tuple[tuple[str, str], ...] = (
+    ("min_capital", "d"),
+    ("min_time_per_week", "d"),
+    ("time_to_first_money_min", "q"),
+    ("time_to_first_money_max", "q"),
+    ("net_month_min", "q"),
+    ("net_month_max", "q"),
+    ("costs_min", "q"),
+    ("costs_max", "q"),
+    ("review_ordinal", "i"),
+    ("min_language_rank", "b"),
+    ("legal_gate", "b"),
+    ("confidence", "b"),
+    ("has_economics", "b"),
+    ("regulated_domain", "b"),
+)
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _fixed_size(rows: int) -> int:
+    """Bytes taken by the header, the columns and the id offsets for ``rows`` rows."""
+    size = _HEADER.size
+    for _name, code in COLUMNS:
+        size = _align(size) + rows * array(code).itemsize
+    return _align(size) + (rows + 1) * array("I").itemsize
+
+
+def _number(value: object) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return 0.0
+    return float(value)
+
+
+def _range(value: object) -> list[int]:
+    low, high = _normalize_range(value, [0, 0])
+    return [min(max(low, _INT64_MIN), _INT64_MAX), min(max(high, _INT64_MIN), _INT64_MAX)]
+
+
+def _review_ordinal(value: object) -> int:
+    """Proleptic ordinal of the review date, 0 when missing or invalid."""
+    if isinstance(value, datetime):
+        return value.date().toordinal()
+    if isinstance(value, date):
+        return value.toordinal()
+    if isinstance(value, str) and value.strip():
+        parsed = _parse_date(value.strip())
+        return parsed.toordinal() if parsed else 0
+    return 0
+
+
+def _variant_row(variant: Variant) -> dict[str, Any]:
+    feasibility = variant.feasibility or {}
+    economics = variant.economics or {}
+    legal = variant.legal or {}
+    min_language = feasibility.get("min_language_level")
+    first_money = _range(economics.get("time_to_first_money_days_range"))
+    net_month = _range(economics.get("typical_net_month_eur_range"))
+    costs = _range(economics.get("costs_eur_range"))
+    confidence = str(economics.get("confidence", "unknown")).lower()
+    if confidence not in ALLOWED_CONFIDENCE:
+        confidence = "unknown"
+    gate = _normalized_legal_gate(legal.get("legal_gate") or legal.get("gate") or "ok")
+    return {
+        "min_capital": _number(feasibility.get("min_capital", 0)),
+        "min_time_per_week": _number(feasibility.get("min_time_per_week", 0)),
+        "time_to_first_money_min": first_money[0],
+        "time_to_first_money_max": first_money[1],
+        "net_month_min": net_month[0],
+        "net_month_max": net_month[1],
+        "costs_min": costs[0],
+        "costs_max": costs[1],
+        "review_ordinal": _review_ordinal(variant.review_date),
+        "min_language_rank": (
+            _language_rank(min_language) if min_language else LANGUAGE_NOT_REQUIRED
+        ),
+        "legal_gate": LEGAL_GATES.index(gate),
+        "confidence": CONFIDENCE_LEVELS.index(confidence),
+        "has_economics": int(bool(variant.economics)),
+        "regulated_domain": int(bool(variant.regulated_domain)),
+    }
+
+
+def encode_variant_store(variants: list[Variant], compiled_ns: int = 0) -> bytes:
+    rows = [_variant_row(variant) for variant in variants]
+    chunks = [
+        _HEADER.pack(STORE_MAGIC, _BYTE_ORDER_MARK, STORE_FORMAT_VERSION, len(rows), compiled_ns)
+    ]
+    size = _HEADER.size
+    for name, code in COLUMNS:
+        padding = _align(size) - size
+        data = array(code, [row[name] for row in rows]).tobytes()
+        chunks.extend([b"\x00" * padding, data])
+        size += padding + len(data)
+
+    encoded_ids = [variant.variant_id.encode("utf-8") for variant in variants]
+    offsets = [0]
+    for raw in encoded_ids:
+        offsets.append(offsets[-1] + len(raw))
+    padding = _align(size) - size
+    chunks.extend([b"\x00" * padding, array("I", offsets).tobytes(), b"".join(encoded_ids)])
+    return b"".join(chunks)
+
+
+def write_variant_store(path: Path, variants: list[Variant], compiled_ns: int = 0) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(encode_variant_store(variants, compiled_ns))
+    os.replace(tmp_path, path)
+
+
+class VariantStore:
+    """Read-only column views over an encoded store (an mmap or an in-memory buffer).
+
+    Columns are `memoryview` objects indexed by row; nothing is copied per variant.
+    """
+
+    def __init__(self, buffer: Any, *, mapping: mmap.mmap | None = None) -> None:
+        self._mapping = mapping
+        self._view = memoryview(buffer)
+        header = _HEADER.unpack_from(self._view, 0) if len(self._view) >= _HEADER.size else None
+        if (
+            header is None
+            or header[:3] != (STORE_MAGIC, _BYTE_ORDER_MARK, STORE_FORMAT_VERSION)
+            or len(self._view) < _fixed_size(header[3])
+        ):
+            self._view.release()
+            raise ValueError("Unsupported or truncated variant store.")
+        rows, compiled_ns = header[3], header[4]
+        self.rows = rows
+        self.compiled_ns = compiled_ns
+
+        self._columns: dict[str, memoryview] = {}
+        offset = _HEADER.size
+        for name, code in COLUMNS:
+            offset = _align(offset)
+            end = offset + rows * array(code).itemsize
+            self._columns[name] = self._view[offset:end].cast(code)
+            offset = end
+        offset = _align(offset)
+        end = offset + (rows + 1) * array("I").itemsize
+        self._id_offsets = self._view[offset:end].cast("I")
+        self._id_blob = self._view[end : end + self._id_offsets[rows]]
+        self._positions: dict[str, int] | None = None
+
+    @classmethod
+    def from_variants(cls, variants: list[Variant]) -> VariantStore:
+        return cls(encode_variant_store(variants))
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __enter__(self) -> VariantStore:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def column(self, name: str) -> memoryview:
+        return self._columns[name]
+
+    def variant_id(self, index: int) -> str:
+        start, end = self._id_offsets[index], self._id_offsets[index + 1]
+        return bytes(self._id_blob[start:end]).decode("utf-8")
+
+    def variant_ids(self) -> list[str]:
+        return [self.variant_id(index) for index in range(self.rows)]
+
+    def position(self, variant_id: str) -> int | None:
+        if self._positions is None:
+            self._positions = {vid: index for index, vid in enumerate(self.variant_ids())}
+        return self._positions.get(variant_id)
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Decoded values of one row, with enum codes mapped back to their labels."""
+        values: dict[str, Any] = {name: column[index] for name, column in self._columns.items()}
+        values["variant_id"] = self.variant_id(index)
+        values["legal_gate"] = LEGAL_GATES[values["legal_gate"]]
+        values["confidence"] = CONFIDENCE_LEVELS[values["confidence"]]
+        rank = values["min_language_rank"]
+        values["min_language_level"] = _LANGUAGE_ORDER[rank] if rank >= 0 else None
+        ordinal = values["review_ordinal"]
+        values["review_date"] = date.fromordinal(ordinal).isoformat() if ordinal else None
+        values["has_economics"] = bool(values["has_economics"])
+        values["regulated_domain"] = bool(values["regulated_domain"])
+        return values
+
+    def close(self) -> None:
+        for view in self._columns.values():
+            view.release()
+        self._columns = {}
+        self._id_offsets.release()
+        self._id_blob.release()
+        self._view.release()
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+
+def open_variant_store(path: Path, *, compiled_ns: int | None = None) -> VariantStore | None:
+    """Map ``path`` read-only; ``None`` when missing, unreadable or built for another artifact."""
+    try:
+        with path.open("rb") as fh:
+            mapping = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        store = VariantStore(mapping, mapping=mapping)
+    except ValueError:
+        mapping.close()
+        return None
+    if compiled_ns is not None and store.compiled_ns != compiled_ns:
+        store.close()
+        return None
+    return store
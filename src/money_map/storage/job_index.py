@@ -0,0 +1,164 @@
+"""Persistent SQLite index of every job seen across snapshots.
+
+One row per job key (see `money_map.storage.job_snapshots.record_key`) records when the
+job was first and last seen, when its content last changed and its content digest, plus
+a few display columns. `JobIndex.upsert` classifies a whole ingestion batch as new,
+updated or unchanged and applies it in one transaction, so questions such as "new in the
+last 7 days" are answered from the index instead of by scanning snapshot files.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from money_map.storage.job_snapshots import record_digest, record_key
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    changed_at TEXT NOT NULL,
+    title TEXT,
+    company TEXT,
+    city TEXT,
+    published_at TEXT,
+    url TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_first_seen ON jobs (first_seen);
+CREATE INDEX IF NOT EXISTS jobs_changed_at ON jobs (changed_at);
+"""
+
+_COLUMNS = (
+    "key, content_hash, first_seen, last_seen, changed_at, title, company, city, published_at, url"
+)
+
+
+@dataclass(frozen=True)
+class IndexedJob:
+    key: str
+    content_hash: str
+    first_seen: str
+    last_seen: str
+    changed_at: str  # first_seen until the content changes
+    title: str | None
+    company: str | None
+    city: str | None
+    published_at: str | None
+    url: str | None
+
+
+@dataclass(frozen=True)
+class UpsertStats:
+    new: int
+    updated: int
+    unchanged: int
+
+
+def _timestamp(value: dt.date | dt.datetime) -> str:
+    """ISO text that sorts chronologically; naive datetimes are taken as UTC."""
+    if isinstance(value, dt.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=dt.timezone.utc)
+        return value.astimezone(dt.timezone.utc).isoformat(timespec="seconds")
+    return value.isoformat()
+
+
+def _text(value: Any) -> str | None:
+    return None if value in (None, "") else str(value)
+
+
+class JobIndex:
+    """Job index stored in the SQLite database at ``path`` (created on first use)."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> JobIndex:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def upsert(self, jobs: Iterable[dict[str, Any]], seen_at: dt.date | dt.datetime) -> UpsertStats:
+        """Record ``jobs`` as seen at ``seen_at``; a later duplicate in the batch wins."""
+        now = _timestamp(seen_at)
+        rows = {}
+        for job in jobs:
+            digest = record_digest(job)
+            key = record_key(job, digest)
+            rows[key] = (
+                key,
+                digest,
+                _text(job.get("title")),
+                _text(job.get("company")),
+                _text(job.get("city")),
+                _text(job.get("publishedAt")),
+                _text(job.get("url")),
+            )
+        with self._conn:
+            self._conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS incoming ("
+                "key TEXT PRIMARY KEY, content_hash TEXT NOT NULL, title TEXT, company TEXT, "
+                "city TEXT, published_at TEXT, url TEXT)"
+            )
+            self._conn.execute("DELETE FROM incoming")
+            self._conn.executemany(
+                "INSERT INTO incoming VALUES (?, ?, ?, ?, ?, ?, ?)", rows.values()
+            )
+            new, updated, unchanged = self._conn.execute(
+                "SELECT COUNT(*) - COUNT(jobs.key), "
+                "COUNT(jobs.key) - COALESCE(SUM(jobs.content_hash = incoming.content_hash), 0), "
+                "COALESCE(SUM(jobs.content_hash = incoming.content_hash), 0) "
+                "FROM incoming LEFT JOIN jobs ON jobs.key = incoming.key"
+            ).fetchone()
+            # WHERE true disambiguates the ON CONFLICT clause from a join constraint.
+            self._conn.execute(
+                f"INSERT INTO jobs ({_COLUMNS}) "
+                "SELECT key, content_hash, :now, :now, :now, title, company, city, "
+                "published_at, url FROM incoming WHERE true "
+                "ON CONFLICT (key) DO UPDATE SET "
+                "last_seen = excluded.last_seen, "
+                "changed_at = CASE WHEN jobs.content_hash = excluded.content_hash "
+                "THEN jobs.changed_at ELSE excluded.changed_at END, "
+                "content_hash = excluded.content_hash, title = excluded.title, "
+                "company = excluded.company, city = excluded.city, "
+                "published_at = excluded.published_at, url = excluded.url",
+                {"now": now},
+            )
+            self._conn.execute("DELETE FROM incoming")
+        return UpsertStats(new, updated, unchanged)
+
+    def get(self, key: str) -> IndexedJob | None:
+        row = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE key = ?", (key,)).fetchone()
+        return IndexedJob(*row) if row is not None else None
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def new_since(self, since: dt.date | dt.datetime) -> list[IndexedJob]:
+        """Jobs first seen at or after ``since``, newest first."""
+        return self._since("first_seen", since)
+
+    def updated_since(self, since: dt.date | dt.datetime) -> list[IndexedJob]:
+        """Previously seen jobs whose content changed at or after ``since``, newest first."""
+        return [job for job in self._since("changed_at", since) if job.changed_at != job.first_seen]
+
+    def _since(self, column: str, since: dt.date | dt.datetime) -> list[IndexedJob]:
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM jobs WHERE {column} >= ? ORDER BY {column} DESC, key",
+            (_timestamp(since),),
+        )
+        return [IndexedJob(*row) for row in rows]
@@ -0,0 +1,369 @@
+"""Append-only, day-partitioned store for normalized job snapshots.
+
+Each day is a directory with gzip segments and an index log::
+
+    <root>/2026-03-01/seg-000001.jsonl.gz
+    <root>/2026-03-01/index.tsv
+
+An append writes the new and changed records as one gzip member at the end of the
+current segment, then appends one index line per record: segment, member offset,
+position in the member, content digest and key (``hashId``, else ``refnr``, else the
+content digest). The last index line per key wins. Unchanged records cost nothing, and
+no existing bytes are rewritten, so ingestion scales with the incoming jobs, not with
+the day's history. A crash between the two writes leaves an unreferenced member, which
+compaction drops; a crash during the index write leaves a torn last line, which readers
+ignore and the next append truncates.
+
+Superseded versions stay in the segments until `compact` rewrites the live records of
+a day into a fresh segment. `compact_in_background` runs that on a worker thread for the
+days appended to since they were last checked, so old days cost one small file read.
+Compaction and appends to the same day are serialized within one process only; a reader
+in another process that finds its segments compacted away reloads the index.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+SEGMENT_MAX_BYTES = 8 * 1024 * 1024
+_INDEX_NAME = "index.tsv"
+# Size of index.tsv when the day was last checked for compaction.
+_CHECKED_NAME = "compaction.mark"
+_READ_ATTEMPTS = 3
+_SEGMENT_GLOB = "seg-*.jsonl.gz"
+
+
+@dataclass(frozen=True, slots=True)
+class IndexEntry:
+    segment: int
+    offset: int  # byte offset of the gzip member holding the record
+    position: int  # line number inside that member
+    digest: str
+
+
+@dataclass(frozen=True)
+class AppendStats:
+    new: int
+    changed: int
+    unchanged: int
+    total: int  # live records in the partition after the append
+
+
+def record_digest(record: dict[str, Any]) -> str:
+    payload = json.dumps(record, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def record_key(record: dict[str, Any], digest: str) -> str:
+    for field in ("hashId", "refnr"):
+        value = record.get(field)
+        if value not in (None, ""):
+            return f"{field}:{' '.join(str(value).splitlines())}"
+    return f"digest:{digest}"
+
+
+def _index_line(key: str, entry: IndexEntry) -> str:
+    # The key goes last, so it may contain tabs; keys never contain line breaks.
+    return f"{entry.segment}\t{entry.offset}\t{entry.position}\t{entry.digest}\t{key}"
+
+
+def _segment_name(number: int) -> str:
+    return f"seg-{number:06d}.jsonl.gz"
+
+
+def _read_member(path: Path, offset: int) -> list[bytes]:
+    """Decompress the gzip member starting at ``offset`` and return its lines."""
+    decompressor = zlib.decompressobj(wbits=31)
+    chunks: list[bytes] = []
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        while not decompressor.eof:
+            block = handle.read(64 * 1024)
+            if not block:
+                break
+            chunks.append(decompressor.decompress(block))
+    return b"".join(chunks).splitlines()
+
+
+class _Partition:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[str, IndexEntry] = {}
+        self.index_lines = 0
+        self.torn = False  # the index ends in a partial line that the next append truncates
+        index_path = path / _INDEX_NAME
+        data = index_path.read_bytes() if index_path.exists() else b""
+        complete, _newline, tail = data.rpartition(b"\n")
+        self.index_size = len(data) - len(tail)
+        self.torn = bool(tail)
+        for line in complete.decode("utf-8", errors="replace").split("\n"):
+            fields = line.split("\t", 4)
+            if len(fields) != 5 or not all(field.isdigit() for field in fields[:3]):
+                continue
+            segment, offset, position, digest, key = fields
+            self.entries[key] = IndexEntry(int(segment), int(offset), int(position), digest)
+            self.index_lines += 1
+        segments = sorted(path.glob(_SEGMENT_GLOB))
+        self.segment = int(segments[-1].name[4:10]) if segments else 1
+
+    def segment_path(self, number: int) -> Path:
+        return self.path / _segment_name(number)
+
+
+class SnapshotStore:
+    """Day partitions of job records under ``root``; see the module docstring."""
+
+    def __init__(self, root: str | Path, *, segment_max_bytes: int = SEGMENT_MAX_BYTES) -> None:
+        self.root = Path(root)
+        self.segment_max_bytes = segment_max_bytes
+        self._partitions: dict[str, _Partition] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def _lock(self, day: str) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(day, threading.Lock())
+
+    def _partition(self, day: str) -> _Partition:
+        partition = self._partitions.get(day)
+        if partition is None:
+            partition = _Partition(self.root / day)
+            self._partitions[day] = partition
+        return partition
+
+    def partitions(self) -> list[str]:
+        """Days with data, oldest first."""
+        if not self.root.is_dir():
+            return []
+        return sorted(
+            path.name
+            for path in self.root.iterdir()
+            if path.is_dir() and (path / _INDEX_NAME).exists()
+        )
+
+    def append(self, day: date | str, records: Iterable[dict[str, Any]]) -> AppendStats:
+        """Store the new and changed ``records`` of ``day``; unchanged ones are skipped."""
+        day = str(day)
+        with self._lock(day):
+            partition = self._partition(day)
+            pending: dict[str, tuple[str, dict[str, Any]]] = {}
+            new = changed = unchanged = 0
+            for record in records:
+                digest = record_digest(record)
+                key = record_key(record, digest)
+                current = partition.entries.get(key)
+                if key in pending:
+                    # A later duplicate in the same batch wins, as in the old merge.
+                    pending[key] = (digest, record)
+                elif current is not None and current.digest == digest:
+                    unchanged += 1
+                else:
+                    pending[key] = (digest, record)
+                    if current is None:
+                        new += 1
+                    else:
+                        changed += 1
+            if pending:
+                self._write(partition, pending)
+            return AppendStats(new, changed, unchanged, len(partition.entries))
+
+    def _write(self, partition: _Partition, pending: dict[str, tuple[str, dict[str, Any]]]) -> None:
+        partition.path.mkdir(parents=True, exist_ok=True)
+        segment_path = partition.segment_path(partition.segment)
+        if segment_path.exists() and segment_path.stat().st_size >= self.segment_max_bytes:
+            partition.segment += 1
+            segment_path = partition.segment_path(partition.segment)
+        lines = [
+            json.dumps(record, ensure_ascii=False, default=str)
+            for _digest, record in pending.values()
+        ]
+        member = gzip.compress(("\n".join(lines) + "\n").encode("utf-8"))
+        with segment_path.open("ab") as handle:
+            offset = handle.tell()
+            handle.write(member)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+        index_lines = []
+        for position, (key, (digest, _record)) in enumerate(pending.items()):
+            entry = IndexEntry(partition.segment, offset, position, digest)
+            partition.entries[key] = entry
+            index_lines.append(_index_line(key, entry))
+        payload = ("\n".join(index_lines) + "\n").encode("utf-8")
+        with (partition.path / _INDEX_NAME).open("ab") as handle:
+            if partition.torn:
+                handle.truncate(partition.index_size)
+                partition.torn = False
+            handle.write(payload)
+        partition.index_lines += len(index_lines)
+        partition.index_size += len(payload)
+
+    def iter_records(self, day: date | str) -> Iterator[dict[str, Any]]:
+        """Live records of ``day`` in storage order, decompressing each member once."""
+        for line in self.iter_lines(day):
+            yield json.loads(line)
+
+    def _reload(self, day: str) -> None:
+        with self._lock(day):
+            self._partitions.pop(day, None)
+
+    def iter_lines(self, day: date | str) -> Iterator[bytes]:
+        """Like `iter_records`, but yields the undecoded JSON lines."""
+        day = str(day)
+        done: set[str] = set()
+        for attempt in range(_READ_ATTEMPTS):
+            with self._lock(day):
+                partition = self._partition(day)
+                entries = sorted(
+                    partition.entries.items(),
+                    key=lambda item: (item[1].segment, item[1].offset, item[1].position),
+                )
+            member: tuple[int, int] | None = None
+            lines: list[bytes] = []
+            try:
+                for key, entry in entries:
+                    if key in done:
+                        continue
+                    if member != (entry.segment, entry.offset):
+                        member = (entry.segment, entry.offset)
+                        lines = _read_member(partition.segment_path(entry.segment), entry.offset)
+                    done.add(key)
+                    yield lines[entry.position]
+                return
+            except FileNotFoundError:
+                # Another process compacted the day; continue from its new index.
+                if attempt == _READ_ATTEMPTS - 1:
+                    raise
+                self._reload(day)
+
+    def get(self, day: date | str, key: str) -> dict[str, Any] | None:
+        """The live record stored under ``key`` (see `record_key`), if any."""
+        day = str(day)
+        for attempt in range(_READ_ATTEMPTS):
+            entry = self._partition(day).entries.get(key)
+            if entry is None:
+                return None
+            try:
+                lines = _read_member(self.root / day / _segment_name(entry.segment), entry.offset)
+            except FileNotFoundError:
+                if attempt == _READ_ATTEMPTS - 1:
+                    raise
+                self._reload(day)
+                continue
+            return json.loads(lines[entry.position])
+        return None
+
+    def count(self, day: date | str) -> int:
+        return len(self._partition(str(day)).entries)
+
+    def garbage_ratio(self, day: date | str) -> float:
+        """Share of stored record versions that are superseded."""
+        return self._ratio(self._partition(str(day)))
+
+    @staticmethod
+    def _ratio(partition: _Partition) -> float:
+        if not partition.index_lines:
+            return 0.0
+        return (partition.index_lines - len(partition.entries)) / partition.index_lines
+
+    def compact(self, day: date | str) -> None:
+        """Rewrite the live records of ``day`` into one new segment and a fresh index."""
+        day = str(day)
+        with self._lock(day):
+            self._compact(self._partition(day))
+
+    def _compact(self, partition: _Partition) -> None:
+        if not partition.entries:
+            self._mark_checked(partition)
+            return
+        old_segments = sorted(partition.path.glob(_SEGMENT_GLOB))
+        keys = sorted(
+            partition.entries,
+            key=lambda k: (
+                partition.entries[k].segment,
+                partition.entries[k].offset,
+                partition.entries[k].position,
+            ),
+        )
+        records: dict[str, tuple[str, dict[str, Any]]] = {}
+        cache: dict[tuple[int, int], list[bytes]] = {}
+        for key in keys:
+            entry = partition.entries[key]
+            member = (entry.segment, entry.offset)
+            if member not in cache:
+                cache.clear()
+                cache[member] = _read_member(partition.segment_path(entry.segment), entry.offset)
+            records[key] = (entry.digest, json.loads(cache[member][entry.position]))
+
+        target = partition.segment + 1
+        lines = [
+            json.dumps(record, ensure_ascii=False, default=str) for _d, record in records.values()
+        ]
+        tmp_segment = partition.path / (_segment_name(target) + ".tmp")
+        tmp_segment.write_bytes(gzip.compress(("\n".join(lines) + "\n").encode("utf-8")))
+        tmp_index = partition.path / (_INDEX_NAME + ".tmp")
+        tmp_index.write_text(
+            "".join(
+                _index_line(key, IndexEntry(target, 0, position, digest)) + "\n"
+                for position, (key, (digest, _record)) in enumerate(records.items())
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_segment, partition.segment_path(target))
+        os.replace(tmp_index, partition.path / _INDEX_NAME)
+        for path in old_segments:
+            path.unlink()
+        partition.segment = target
+        partition.entries = {
+            key: IndexEntry(target, 0, position, digest)
+            for position, (key, (digest, _record)) in enumerate(records.items())
+        }
+        partition.index_lines = len(partition.entries)
+        partition.index_size = (partition.path / _INDEX_NAME).stat().st_size
+        partition.torn = False
+        self._mark_checked(partition)
+
+    def _mark_checked(self, partition: _Partition) -> None:
+        if partition.path.is_dir():
+            (partition.path / _CHECKED_NAME).write_text(str(partition.index_size))
+
+    def changed_partitions(self) -> list[str]:
+        """Days appended to since they were last compacted or checked for compaction."""
+        changed = []
+        for day in self.partitions():
+            mark = self.root / day / _CHECKED_NAME
+            size = (self.root / day / _INDEX_NAME).stat().st_size
+            if not mark.exists() or mark.read_text().strip() != str(size):
+                changed.append(day)
+        return changed
+
+    def compact_in_background(
+        self, days: Iterable[date | str] | None = None, *, min_garbage: float = 0.3
+    ) -> threading.Thread:
+        """On a thread, compact the days whose garbage ratio reaches ``min_garbage``.
+
+        ``days`` defaults to `changed_partitions`; every day considered is marked as checked.
+        """
+        candidates = [str(day) for day in (self.changed_partitions() if days is None else days)]
+
+        def _run() -> None:
+            for day in candidates:
+                with self._lock(day):
+                    partition = self._partition(day)
+                    if self._ratio(partition) >= min_garbage:
+                        self._compact(partition)
+                    else:
+                        self._mark_checked(partition)
+
+        thread = threading.Thread(target=_run, name="snapshot-compaction", daemon=True)
+        thread.start()
+        return thread
@@ -23,7 +23,8 @@ from money_map.core.profile import (
     validate_profile,
 )
 from money_map.core.recommend import is_variant_stale, recommend
-from money_map.core.validate import validate
+from money_map.core.scoring import variant_facts
+from money_map.core.validate import validate_cached
 from money_map.render.plan_md import render_plan_md
 from money_map.render.result_json import render_result_json
 from money_map.storage.fs import read_yaml
@@ -284,7 +285,7 @@ def _get_app_data():
 @st.cache_data
 def _get_validation() -> dict:
     app_data = _get_app_data()
-    report = validate(app_data)
+    report = validate_cached(app_data)
     return {
         "status": report.status,
         "fatals": report.fatals,
@@ -310,6 +311,7 @@ def _get_recommendations(profile_json: str, objective: str, filters: dict, top_n
         objective,
         filters,
         top_n,
+        facts=variant_facts(app_data),
     )
 
 
@@ -455,6 +457,7 @@ def _profile_preview_snapshot(profile: dict) -> dict[str, object]:
         profile.get("objective", "fastest_money"),
         broad_filters,
         max(1, len(app_data.variants)),
+        facts=variant_facts(app_data),
     )
 
     ranked = recs.ranked_variants
@@ -2770,6 +2773,7 @@ def run_app() -> None:
                 profile.get("objective", "fastest_money"),
                 {},
                 len(app_data.variants),
+                facts=variant_facts(app_data),
             )
             selected_rec = next(
                 (r for r in recommendations.ranked_variants if r.variant.variant_id == variant_id),
@@ -7,7 +7,7 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Callable
 
-from money_map.storage.fs import read_mapping
+from money_map.storage.fs import read_mappings
 
 
 def data_status_visibility(view_mode: str) -> dict[str, bool]:
@@ -190,11 +190,23 @@ def aggregate_pack_metrics(
     pack_dir = Path(pack_dir)
     now_date = now or datetime.utcnow().date()
 
-    variants_payload = read_mapping(pack_dir / "variants.seed.yaml")
-    bridges_payload = read_mapping(pack_dir / "bridges.seed.yaml")
-    routes_payload = read_mapping(pack_dir / "routes.seed.yaml")
-    rulepack_payload = read_mapping(pack_dir / "rulepack.yaml")
-    meta_payload = read_mapping(pack_dir / "meta.yaml")
+    (
+        variants_payload,
+        bridges_payload,
+        routes_payload,
+        rulepack_payload,
+        meta_payload,
+    ) = read_mappings(
+        [
+            pack_dir / "variants.seed.yaml",
+            pack_dir / "bridges.seed.yaml",
+            pack_dir / "routes.seed.yaml",
+            pack_dir / "rulepack.yaml",
+            pack_dir / "meta.yaml",
+        ],
+        # Streamlit reruns this often; worker processes cost more than these files.
+        max_workers=1,
+    )
 
     variants = variants_payload.get("variants", [])
     all_cells = [
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Generator, Iterable, Iterator
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
 from money_map.storage.fs import read_yaml
+from money_map.storage.job_snapshots import SnapshotStore
 
 JOBS_ENDPOINT = "https://rest.arbeitsagentur.de/jobboerse/jobsuche-service/pc/v4/jobs"
 JOBS_API_KEY = "jobboerse-jobsuche"
@@ -25,15 +27,15 @@ def _pick(obj: dict[str, Any], *keys: str) -> Any:
     return None
 
 
-def normalize_job(job: dict[str, Any]) -> dict[str, Any]:
-    location = _pick(job, "arbeitsort", "arbeitsOrt", "ort", "location")
+def normalize_job(job: dict[str, Any], *, include_raw: bool = True) -> dict[str, Any]:
+    location = _pick(job, "arbeitsort", "arbeitsOrt", "ort", "location", "city")
     city = ""
     if isinstance(location, dict):
         city = str(_pick(location, "ort", "stadt", "city") or "")
     elif isinstance(location, str):
         city = location
 
-    return {
+    row = {
         "hashId": str(_pick(job, "hashId", "hashid") or ""),
         "refnr": str(_pick(job, "refnr", "referenznummer") or ""),
         "title": str(_pick(job, "titel", "beruf", "title") or ""),
@@ -43,8 +45,10 @@ def normalize_job(job: dict[str, Any]) -> dict[str, Any]:
             _pick(job, "aktuelleVeroeffentlichungsdatum", "eintrittsdatum", "publishedAt") or ""
         ),
         "url": str(_pick(job, "externeUrl", "jobcenterUrl", "url") or ""),
-        "raw": job,
     }
+    if include_raw:
+        row["raw"] = job
+    return row
 
 
 def _extract_jobs(payload: Any) -> list[dict[str, Any]]:
@@ -75,19 +79,78 @@ def fetch_live_jobs(
     return [normalize_job(item) for item in _extract_jobs(payload)]
 
 
-def latest_snapshot() -> tuple[list[dict[str, Any]], str | None]:
+def _snapshot_lines() -> tuple[Generator[bytes, None, None], str | None]:
+    """Undecoded rows of the newest snapshot: a day partition of the store or a JSONL file."""
     files = sorted(JOBS_SNAPSHOT_DIR.glob("*.jsonl"))
+    store = SnapshotStore(JOBS_SNAPSHOT_DIR)
+    days = store.partitions()
+    # Flat files are named YYYY-MM-DD_HHMMSS.jsonl; the store wins ties on the same day.
+    if days and (not files or days[-1] >= files[-1].name[:10]):
+        return store.iter_lines(days[-1]), days[-1]
     if not files:
-        return [], None
-    latest = files[-1]
-    rows: list[dict[str, Any]] = []
-    for line in latest.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
+        return (line for line in ()), None
+    return _file_lines(files[-1]), files[-1].name
+
+
+def _file_lines(path: Path) -> Generator[bytes, None, None]:
+    with path.open("rb") as handle:
+        yield from handle
+
+
+def iter_snapshot_rows(
+    lines: Iterable[bytes],
+    *,
+    city: str = "",
+    published_since: date | None = None,
+    include_raw: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Normalize snapshot lines lazily, keeping rows in ``city`` published since the date.
+
+    ``city`` is a case-insensitive substring of the row's city. Lines that cannot contain
+    it are skipped before JSON decoding, and the date is checked before normalizing.
+    """
+    needle = city.strip().casefold()
+    since = published_since.isoformat() if published_since is not None else ""
+    for line in lines:
+        if not line.strip():
             continue
+        if needle:
+            text = line.decode("utf-8", errors="replace")
+            # Escaped non-ASCII text cannot be matched before decoding.
+            if needle not in text.casefold() and "\\u" not in text:
+                continue
         item = json.loads(line)
-        rows.append(normalize_job(item if isinstance(item, dict) else {}))
-    return rows, latest.name
+        if not isinstance(item, dict):
+            item = {}
+        if since:
+            published = _pick(
+                item, "aktuelleVeroeffentlichungsdatum", "eintrittsdatum", "publishedAt"
+            )
+            if str(published or "")[:10] < since:
+                continue
+        row = normalize_job(item, include_raw=include_raw)
+        if needle and needle not in row["city"].casefold():
+            continue
+        yield row
+
+
+def latest_snapshot(
+    *,
+    limit: int | None = None,
+    city: str = "",
+    published_since: date | None = None,
+    include_raw: bool = True,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Up to ``limit`` matching rows of the newest snapshot; reading stops at the limit."""
+    lines, name = _snapshot_lines()
+    rows = iter_snapshot_rows(
+        lines, city=city, published_since=published_since, include_raw=include_raw
+    )
+    try:
+        return list(islice(rows, limit)), name
+    finally:
+        rows.close()
+        lines.close()
 
 
 def seed_slice(size: int) -> list[dict[str, Any]]:
@@ -129,9 +192,15 @@ def resolve_jobs_source(
     except Exception:
         pass
 
-    snapshot_rows, snapshot_name = latest_snapshot()
+    since = datetime.now(timezone.utc).date() - timedelta(days=days)
+    snapshot_rows, snapshot_name = latest_snapshot(
+        limit=size, city=city, published_since=since, include_raw=False
+    )
+    if not snapshot_rows:
+        # The snapshot may spell the city differently (Munich/München): show its newest rows.
+        snapshot_rows, snapshot_name = latest_snapshot(limit=size, include_raw=False)
     if snapshot_rows:
-        return snapshot_rows[:size], {
+        return snapshot_rows, {
             "source": "cache",
             "snapshot": snapshot_name or "",
             "fetched_at": datetime.now(timezone.utc).isoformat(),
@@ -3,6 +3,8 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 try:
@@ -10,3 +12,18 @@ try:
 except ModuleNotFoundError:
     if str(SRC) not in sys.path:
         sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture(scope="session")
+def _session_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("money_map_cache")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(_session_cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the on-disk dataset cache out of the checkout (subprocesses inherit it).
+
+    The directory is shared by the session so repeated loads of the seed data stay warm;
+    tests that need an empty cache point `MONEY_MAP_CACHE_DIR` at their own tmp_path.
+    """
+    monkeypatch.setenv("MONEY_MAP_CACHE_DIR", str(_session_cache_dir))
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from shutil import copytree
+
+from money_map.core.classify import (
+    Classifier,
+    _sample_index,
+    _sample_variants,
+    _variant_taxonomy_from_tags,
+    classify_idea_text,
+    get_classifier,
+)
+from money_map.core.load import load_app_data
+from money_map.storage.fs import read_yaml, write_yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_classifier_matches_whole_token_phrases_of_any_length() -> None:
+    app_data = load_app_data(ROOT / "data")
+    classifier = Classifier(
+        {
+            "mobile car wash": {"taxonomy": {"labor": 3.0}, "cell": {"A1": 1.0}},
+            "car wash": {"taxonomy": {"service_fee": 1.0}, "cell": {"A2": 0.0}},
+            "wash": {"taxonomy": {"subscription": 0.0}},
+            "e-commerce": {"taxonomy": {"asset_rental": 9.0}},
+        },
+        {
+            "taxonomy": {"labor": {"keywords": ["wash", "wash"], "typical_cells": ["B1"]}},
+            "tag_keywords": {"value_measure": {"recurring": ["subscription plan"]}},
+        },
+    )
+
+    result = classifier.classify("Mobile car wash subscription plan, e-commerce", app_data)
+
+    assert result.matched_keywords == ["car wash", "mobile car wash", "wash"]
+    assert [(c.taxonomy_id, c.score) for c in result.top3] == [
+        ("labor", 4.6),
+        ("service_fee", 1.0),
+        ("subscription", 0.0),
+    ]
+    assert result.top3[0].reasons == ["keyword_score=3.00", "mapping_hits=wash, wash"]
+    assert result.top3[2].reasons == ["keyword_score=0.00"]
+    assert result.suggested_tags["value_measure"] == "recurring"
+    assert result.cell_guess == "B1"
+    assert result.backup_cell_guess == "A1"
+
+
+def test_classify_many_matches_single_texts() -> None:
+    app_data = load_app_data(ROOT / "data")
+    classifier = get_classifier(ROOT / "data")
+    texts = [
+        "remote freelance writing for local businesses",
+        "",
+        "subscription monthly recurring remote",
+        "local childcare and commission percent for referrals",
+    ]
+
+    assert classifier.classify_many(texts, app_data) == [
+        classifier.classify(text, app_data) for text in texts
+    ]
+
+
+def test_get_classifier_recompiles_when_keywords_change(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    copytree(ROOT / "data", data_dir)
+    app_data = load_app_data(data_dir)
+
+    first = get_classifier(data_dir)
+    assert get_classifier(data_dir) is first
+    assert "remote" in classify_idea_text("remote", app_data, data_dir).matched_keywords
+
+    keywords_path = data_dir / "keywords.yaml"
+    keywords = read_yaml(keywords_path)
+    keywords["keywords"]["team lead"] = {"taxonomy": {"labor": 5.0}}
+    write_yaml(keywords_path, keywords)
+    stat = keywords_path.stat()
+    os.utime(keywords_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert get_classifier(data_dir) is not first
+    result = classify_idea_text("Remote team lead", app_data, data_dir)
+    assert "team lead" in result.matched_keywords
+    assert result.top3[0].taxonomy_id == "labor"
+
+
+def test_sample_variants_come_from_a_cached_index() -> None:
+    app_data = load_app_data(ROOT / "data")
+
+    first = _sample_variants(app_data, "service_fee", "A2")
+    again = _sample_variants(app_data, "service_fee", "B1")
+
+    assert _sample_index(app_data) is _sample_index(app_data)
+    assert [card.cell for card in first] == ["A2"] * len(first)
+    assert [card.cell for card in again] == ["B1"] * len(again)
+    assert [card.variant_id for card in first] == [card.variant_id for card in again]
+    expected = sorted(
+        variant.variant_id
+        for variant in app_data.variants
+        if _variant_taxonomy_from_tags(variant.tags) == "service_fee"
+    )[:5]
+    assert [card.variant_id for card in first] == expected
+    fallback = _sample_variants(app_data, "no_such_taxonomy", "A1")
+    assert [card.variant_id for card in fallback] == sorted(
+        variant.variant_id for variant in app_data.variants
+    )[:5]
+    assert {card.taxonomy_id for card in fallback} == {"no_such_taxonomy"}
+
+
+def test_fuzzy_stage_matches_german_compounds_at_reduced_weight() -> None:
+    app_data = load_app_data(ROOT / "data")
+    classifier = Classifier(
+        {
+            "übersetzung": {"taxonomy": {"service_fee": 2.0}, "cell": {"A2": 1.0}},
+            "reparatur": {"taxonomy": {"labor": 2.0}},
+        },
+        {"taxonomy": {"labor": {"keywords": ["werkstatt"], "typical_cells": ["A1"]}}},
+    )
+    idea = "Übersetzungsdienst und Fahrradreparatur"
+
+    exact = classifier.classify(idea, app_data)
+    fuzzy = classifier.classify(idea, app_data, fuzzy=True)
+
+    assert exact.top3[0].reasons == ["fallback_default"]
+    assert [(c.taxonomy_id, c.score) for c in fuzzy.top3] == [
+        ("labor", 1.0),
+        ("service_fee", 1.0),
+    ]
+    assert fuzzy.top3[1].reasons == ["fuzzy_score=1.00"]
+    assert fuzzy.matched_keywords == []
+    assert fuzzy.reasons[0] == (
+        "Fuzzy matches: übersetzungsdienst~übersetzung, fahrradreparatur~reparatur"
+    )
+    assert classifier.classify("reparatur", app_data, fuzzy=True).top3[0].score == 2.0
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from money_map.app.api import classify_batch
+from money_map.core.classify import classify_idea_text
+from money_map.core.load import load_app_data
+
+ROOT = Path(__file__).resolve().parents[1]
+IDEAS = [
+    "Ich möchte Nachhilfe in Mathe geben",
+    "Fahrradreparatur in der eigenen Werkstatt",
+    "Übersetzungen Englisch Deutsch als Freelancer",
+    "",
+    "Ich möchte Nachhilfe in Mathe geben",
+]
+
+
+def _run_cli(*args: str, cwd: Path) -> subprocess.CompletedProcess:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(ROOT / "src")
+    return subprocess.run(
+        [sys.executable, "-m", "money_map.app.cli", "classify-batch", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=cwd,
+        check=False,
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_classify_batch_matches_single_calls_in_input_order(max_workers: int) -> None:
+    app_data = load_app_data(ROOT / "data")
+    expected = [classify_idea_text(text, app_data, ROOT / "data") for text in IDEAS]
+
+    results = list(
+        classify_batch(iter(IDEAS), data_dir=ROOT / "data", max_workers=max_workers, chunk_size=2)
+    )
+
+    assert [asdict(result) for result in results] == [asdict(result) for result in expected]
+
+
+def test_cli_classify_batch_writes_one_line_per_idea(tmp_path: Path) -> None:
+    ideas_path = tmp_path / "ideas.jsonl"
+    ideas_path.write_text(
+        f"{json.dumps(IDEAS[0])}\n\n"
+        f"{json.dumps({'id': 'bike', 'idea_text': IDEAS[1]})}\n"
+        f"{json.dumps({'text': IDEAS[2]})}\n",
+        encoding="utf-8",
+    )
+    output_path = tmp_path / "out.jsonl"
+
+    result = _run_cli(
+        "--in",
+        str(ideas_path),
+        "--out",
+        str(output_path),
+        "--data-dir",
+        str(ROOT / "data"),
+        "--workers",
+        "1",
+        cwd=tmp_path,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "classified 3 ideas" in result.stderr
+    lines = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    assert [line["index"] for line in lines] == [0, 1, 2]
+    assert [line["id"] for line in lines] == [None, "bike", None]
+    assert [line["idea_text"] for line in lines] == IDEAS[:3]
+    assert all(line["top3"] for line in lines)
+
+
+def test_cli_classify_batch_rejects_line_without_text(tmp_path: Path) -> None:
+    ideas_path = tmp_path / "ideas.jsonl"
+    ideas_path.write_text('"ok"\n{"title": "no text"}\n', encoding="utf-8")
+
+    result = _run_cli("--in", str(ideas_path), "--data-dir", str(ROOT / "data"), cwd=tmp_path)
+
+    assert result.returncode == 1
+    assert "INVALID_IDEAS_JSONL" in result.stderr
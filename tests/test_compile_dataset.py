@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from pathlib import Path
+from shutil import copytree
+
+import pytest
+
+from money_map.app.api import compile_dataset
+from money_map.core.compiled import compiled_path
+from money_map.core.errors import DataValidationError
+from money_map.core.load import load_app_data, load_compiled
+from money_map.storage.fs import read_yaml, write_yaml
+
+
+def _copy_data(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setenv("MONEY_MAP_DISABLE_CACHE", "1")
+    root = Path(__file__).resolve().parents[1]
+    data_dir = tmp_path / "data"
+    copytree(root / "data", data_dir, ignore=lambda *_args: ["compiled"])
+    return data_dir
+
+
+def test_compile_writes_artifact_with_indexes(tmp_path: Path, monkeypatch) -> None:
+    data_dir = _copy_data(tmp_path, monkeypatch)
+
+    summary = compile_dataset(data_dir)
+
+    assert Path(summary["artifact_path"]) == compiled_path(data_dir)
+    compiled = load_compiled(data_dir)
+    assert compiled is not None
+    variant_ids = sorted(v.variant_id for v in compiled.app_data.variants)
+    by_cell = compiled.indexes["by_cell"]
+    assert sorted(vid for ids in by_cell.values() for vid in ids) == variant_ids
+    assert set(compiled.indexes) == {
+        "by_cell",
+        "by_taxonomy",
+        "by_legal_gate",
+        "by_required_asset",
+    }
+    assert compiled.validation.status == summary["validation_status"]
+
+
+def test_load_app_data_uses_fresh_artifact_and_falls_back_when_stale(
+    tmp_path: Path, monkeypatch
+) -> None:
+    data_dir = _copy_data(tmp_path, monkeypatch)
+    reference = load_app_data(data_dir, use_cache=False)
+    compile_dataset(data_dir)
+
+    def _no_parse(*_args, **_kwargs):
+        raise AssertionError("fresh artifact must not parse YAML")
+
+    with monkeypatch.context() as patch:
+        patch.setattr("money_map.core.load.read_mappings", _no_parse)
+        from_artifact = load_app_data(data_dir)
+    assert from_artifact == reference
+
+    meta_path = data_dir / "meta.yaml"
+    meta = read_yaml(meta_path)
+    meta["dataset_version"] = "9.9.9"
+    write_yaml(meta_path, meta)
+
+    assert load_compiled(data_dir) is None
+    assert load_app_data(data_dir).meta.dataset_version == "9.9.9"
+
+
+def test_compile_refuses_datasets_with_fatals(tmp_path: Path, monkeypatch) -> None:
+    data_dir = _copy_data(tmp_path, monkeypatch)
+    rulepack_path = data_dir / "rulepacks" / "DE.yaml"
+    rulepack = read_yaml(rulepack_path)
+    rulepack["reviewed_at"] = "not-a-date"
+    write_yaml(rulepack_path, rulepack)
+
+    with pytest.raises(DataValidationError):
+        compile_dataset(data_dir)
+    assert not compiled_path(data_dir).exists()
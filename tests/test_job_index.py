@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import datetime as dt
+from pathlib import Path
+
+from money_map.storage.job_index import JobIndex
+
+
+def _job(hash_id: str, title: str, **extra) -> dict:
+    return {"hashId": hash_id, "title": title, "city": "Berlin", **extra}
+
+
+def test_upsert_tracks_new_updated_and_unchanged_jobs(tmp_path: Path) -> None:
+    path = tmp_path / "jobs_index.sqlite"
+    day1 = dt.datetime(2026, 3, 1, 8, 0, tzinfo=dt.timezone.utc)
+    day2 = dt.datetime(2026, 3, 8, 8, 0, tzinfo=dt.timezone.utc)
+
+    with JobIndex(path) as index:
+        first = index.upsert([_job("a", "Koch"), _job("b", "Fahrer"), {"title": "x"}], day1)
+    with JobIndex(path) as index:
+        second = index.upsert(
+            [_job("a", "Koch"), _job("b", "Fahrerin"), _job("c", "Pfleger"), _job("c", "Pflege")],
+            day2,
+        )
+
+        assert (first.new, first.updated, first.unchanged) == (3, 0, 0)
+        assert (second.new, second.updated, second.unchanged) == (1, 1, 1)
+        assert index.count() == 4
+        a = index.get("hashId:a")
+        assert (a.first_seen, a.last_seen, a.changed_at) == (
+            "2026-03-01T08:00:00+00:00",
+            "2026-03-08T08:00:00+00:00",
+            "2026-03-01T08:00:00+00:00",
+        )
+        b = index.get("hashId:b")
+        assert (b.title, b.first_seen, b.changed_at) == (
+            "Fahrerin",
+            "2026-03-01T08:00:00+00:00",
+            "2026-03-08T08:00:00+00:00",
+        )
+        assert index.get("hashId:c").title == "Pflege"
+        assert [job.key for job in index.new_since(dt.date(2026, 3, 2))] == ["hashId:c"]
+        assert [job.key for job in index.updated_since(dt.date(2026, 3, 2))] == ["hashId:b"]
+        assert len(index.new_since(dt.date(2026, 3, 1))) == 4
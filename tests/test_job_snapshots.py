@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from money_map.storage.job_snapshots import SnapshotStore
+from money_map.ui.jobs_live import latest_snapshot
+
+
+def _job(hash_id: str, title: str, **extra) -> dict:
+    return {"hashId": hash_id, "refnr": f"ref-{hash_id}", "title": title, **extra}
+
+
+def test_append_stores_only_new_and_changed_records(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path)
+    first = store.append("2026-03-01", [_job("a", "Koch"), _job("b", "Fahrer"), {"title": "x"}])
+    segment = tmp_path / "2026-03-01" / "seg-000001.jsonl.gz"
+    size_after_first = segment.stat().st_size
+
+    second = store.append(
+        "2026-03-01", [_job("a", "Koch"), _job("b", "Fahrerin"), _job("c", "Pfleger")]
+    )
+
+    assert (first.new, first.changed, first.unchanged, first.total) == (3, 0, 0, 3)
+    assert (second.new, second.changed, second.unchanged, second.total) == (1, 1, 1, 4)
+    assert segment.stat().st_size > size_after_first
+    index_lines = (tmp_path / "2026-03-01" / "index.tsv").read_text().splitlines()
+    assert len(index_lines) == 5
+
+    reopened = SnapshotStore(tmp_path)
+    records = list(reopened.iter_records("2026-03-01"))
+    assert sorted(record["title"] for record in records) == ["Fahrerin", "Koch", "Pfleger", "x"]
+    assert reopened.get("2026-03-01", "hashId:b")["title"] == "Fahrerin"
+    assert reopened.get("2026-03-01", "hashId:missing") is None
+    assert reopened.garbage_ratio("2026-03-01") == 1 / 5
+    assert reopened.partitions() == ["2026-03-01"]
+
+
+def test_compaction_drops_superseded_versions(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path, segment_max_bytes=64)
+    for version in range(4):
+        store.append("2026-03-02", [_job(str(i), f"Job {i} v{version}") for i in range(3)])
+    day_dir = tmp_path / "2026-03-02"
+    assert len(list(day_dir.glob("seg-*.jsonl.gz"))) == 4
+    before = list(store.iter_records("2026-03-02"))
+
+    thread = store.compact_in_background(["2026-03-02"], min_garbage=0.5)
+    thread.join()
+
+    assert [path.name for path in day_dir.glob("seg-*.jsonl.gz")] == ["seg-000005.jsonl.gz"]
+    assert store.garbage_ratio("2026-03-02") == 0.0
+    assert list(SnapshotStore(tmp_path).iter_records("2026-03-02")) == before
+    assert [record["title"] for record in before] == ["Job 0 v3", "Job 1 v3", "Job 2 v3"]
+    stats = store.append("2026-03-02", [_job("3", "Job 3")])
+    assert stats.total == 4
+    assert SnapshotStore(tmp_path).get("2026-03-02", "hashId:3")["title"] == "Job 3"
+
+
+def test_latest_snapshot_reads_newest_store_partition(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("money_map.ui.jobs_live.JOBS_SNAPSHOT_DIR", tmp_path)
+    (tmp_path / "2026-03-01_120000.jsonl").write_text(
+        '{"hashId": "old", "titel": "Alt"}\n', encoding="utf-8"
+    )
+    SnapshotStore(tmp_path).append("2026-03-02", [_job("new", "Neu")])
+
+    rows, name = latest_snapshot()
+
+    assert name == "2026-03-02"
+    assert [(row["hashId"], row["title"]) for row in rows] == [("new", "Neu")]
+
+
+def test_torn_index_line_is_ignored_and_truncated_by_next_append(tmp_path: Path) -> None:
+    SnapshotStore(tmp_path).append("2026-03-03", [_job("a", "Koch")])
+    index_path = tmp_path / "2026-03-03" / "index.tsv"
+    with index_path.open("a", encoding="utf-8") as handle:
+        handle.write("1\t99")  # crash in the middle of an index write
+
+    store = SnapshotStore(tmp_path)
+    assert [record["title"] for record in store.iter_records("2026-03-03")] == ["Koch"]
+    store.append("2026-03-03", [_job("b", "Fahrer")])
+
+    assert "1\t99" not in index_path.read_text()
+    reopened = SnapshotStore(tmp_path)
+    assert sorted(r["title"] for r in reopened.iter_records("2026-03-03")) == ["Fahrer", "Koch"]
+
+
+def test_background_compaction_only_loads_changed_days(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path)
+    for day in ("2026-03-01", "2026-03-02"):
+        store.append(day, [_job("a", "v1")])
+        store.append(day, [_job("a", "v2")])
+    store.compact_in_background(min_garbage=0.9).join()
+    assert SnapshotStore(tmp_path).changed_partitions() == []
+
+    store.append("2026-03-02", [_job("b", "Koch")])
+    fresh = SnapshotStore(tmp_path)
+    assert fresh.changed_partitions() == ["2026-03-02"]
+    fresh.compact_in_background(min_garbage=0.3).join()
+
+    assert fresh.changed_partitions() == []
+    assert list(fresh._partitions) == ["2026-03-02"]
+    assert fresh.garbage_ratio("2026-03-02") == 0.0
+
+
+def test_reader_reloads_index_after_compaction_elsewhere(tmp_path: Path) -> None:
+    writer = SnapshotStore(tmp_path, segment_max_bytes=64)
+    for i in range(3):
+        writer.append("2026-03-04", [_job(str(i), f"Job {i} v1")])
+        writer.append("2026-03-04", [_job(str(i), f"Job {i} v2")])
+    reader = SnapshotStore(tmp_path)
+    lines = reader.iter_lines("2026-03-04")
+    first = next(lines)
+
+    SnapshotStore(tmp_path).compact("2026-03-04")
+
+    rest = list(lines)
+    assert [json.loads(line)["title"] for line in [first, *rest]] == [
+        "Job 0 v2",
+        "Job 1 v2",
+        "Job 2 v2",
+    ]
+    assert reader.get("2026-03-04", "hashId:1")["title"] == "Job 1 v2"
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from money_map.app.jobs_ingest import (
+    JobQuery,
+    JobsucheClient,
+    TokenBucket,
+    ingest_queries,
+)
+
+
+def _page(prefix: str, count: int, total: int | None) -> dict:
+    payload: dict = {"stellenangebote": [{"hashId": f"{prefix}-{i}"} for i in range(count)]}
+    if total is not None:
+        payload["maxErgebnisse"] = total
+    return payload
+
+
+class _StubJobsuche(ThreadingHTTPServer):
+    """Replays recorded pages keyed by (was, wo, page); counts connections and requests."""
+
+    daemon_threads = True
+
+    def __init__(self, pages: dict, failures: dict | None = None) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.pages = pages
+        self.failures = dict(failures or {})
+        self.connections = 0
+        self.requests: list[tuple[str, str, int]] = []
+        self.lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/jobs"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *_args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        query = parse_qs(urlsplit(self.path).query, keep_blank_values=True)
+        key = (query["was"][0], query["wo"][0], int(query["page"][0]))
+        with self.server.lock:
+            self.server.requests.append(key)
+            status = 200
+            if self.server.failures.get(key):
+                status, remaining = self.server.failures[key]
+                self.server.failures[key] = (status, remaining - 1) if remaining > 1 else None
+        payload = self.server.pages.get(key) if status == 200 else {"error": status}
+        if payload is None:
+            status, payload = 404, {"error": "not found"}
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def stub_server():
+    servers: list[_StubJobsuche] = []
+
+    def _start(pages: dict, failures: dict | None = None) -> _StubJobsuche:
+        server = _StubJobsuche(pages, failures)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield _start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(server: _StubJobsuche, **kwargs) -> JobsucheClient:
+    return JobsucheClient(server.endpoint, timeout_s=5.0, sleep=lambda _s: None, **kwargs)
+
+
+def test_ingest_walks_all_pages_of_every_query(stub_server) -> None:
+    server = stub_server(
+        {
+            ("koch", "München", 1): _page("k1", 2, total=5),
+            ("koch", "München", 2): _page("k2", 2, total=5),
+            ("koch", "München", 3): _page("k3", 1, total=5),
+            ("fahrer", "München", 1): _page("f1", 1, total=1),
+        },
+        failures={("koch", "München", 2): (503, 1)},
+    )
+    client = _client(server)
+    progress = []
+    queries = [JobQuery("koch", "München"), JobQuery("fahrer", "München")]
+
+    results = ingest_queries(queries, client, page_size=2, workers=2, on_progress=progress.append)
+    client.close()
+
+    assert [result.query for result in results] == queries
+    koch, fahrer = results
+    assert [job["hashId"] for job in koch.jobs] == ["k1-0", "k1-1", "k2-0", "k2-1", "k3-0"]
+    assert (koch.pages, koch.total, koch.retries, koch.error) == (3, 5, 1, None)
+    assert [job["hashId"] for job in fahrer.jobs] == ["f1-0"]
+    koch_progress = [item for item in progress if item.query == queries[0]]
+    assert [item.pages_done for item in koch_progress] == [1, 2, 3]
+    assert {item.pages_total for item in koch_progress} == {3}
+    assert koch_progress[-1].jobs == 5
+    # Keep-alive: at most one connection per worker thread, even across the retry.
+    assert len(server.requests) == 5
+    assert server.connections <= 2
+
+
+def test_ingest_walks_pages_until_short_page_without_total(stub_server) -> None:
+    server = stub_server(
+        {
+            ("", "Berlin", 1): _page("p1", 2, total=None),
+            ("", "Berlin", 2): _page("p2", 2, total=None),
+            ("", "Berlin", 3): _page("p3", 0, total=None),
+        }
+    )
+    client = _client(server)
+
+    (result,) = ingest_queries([JobQuery(wo="Berlin")], client, page_size=2, max_pages=10)
+    client.close()
+
+    assert result.pages == 3
+    assert len(result.jobs) == 4
+    assert result.total is None
+
+
+def test_ingest_reports_failing_query_and_keeps_others(stub_server) -> None:
+    server = stub_server(
+        {("ok", "", 1): _page("ok", 1, total=1)},
+        failures={("flaky", "", 1): (503, 5)},
+    )
+    client = _client(server, max_retries=2)
+
+    flaky, missing, ok = ingest_queries(
+        [JobQuery("flaky"), JobQuery("missing"), JobQuery("ok")], client, page_size=10
+    )
+    client.close()
+
+    assert "Giving up after 3 attempts" in flaky.error
+    assert "HTTP 404" in missing.error
+    assert ok.error is None and len(ok.jobs) == 1
+    assert server.requests.count(("flaky", "", 1)) == 3
+    assert server.requests.count(("missing", "", 1)) == 1
+
+
+def test_token_bucket_spaces_requests_after_burst() -> None:
+    now = [0.0]
+
+    def _sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    bucket = TokenBucket(2.0, capacity=2, clock=lambda: now[0], sleep=_sleep)
+
+    waits = [bucket.acquire() for _ in range(5)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == pytest.approx([0.5, 0.5, 0.5])
+    assert now[0] == pytest.approx(1.5)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 
+from money_map.core.cache import prune_cache
 from money_map.core.load import load_app_data
+from money_map.storage.fs import read_mappings
 
 
 def _write_json(path, payload):
@@ -56,3 +60,84 @@ def test_load_app_data_reads_json_fallback(tmp_path) -> None:
     assert app_data.meta.staleness_policy.stale_after_days == 45
     assert app_data.rulepack.rules[0].rule_id == "R1"
     assert app_data.variants[0].variant_id == "de.test.variant"
+
+
+def _write_minimal_dataset(data_dir, dataset_version="1.0.0"):
+    _write_json(data_dir / "meta.json", {"dataset_version": dataset_version})
+    _write_json(
+        data_dir / "variants.json",
+        {"variants": [{"variant_id": "de.cache.variant", "title": "Cached", "summary": "S"}]},
+    )
+    _write_json(
+        data_dir / "rulepacks" / "DE.json",
+        {"reviewed_at": "2026-01-01", "rules": [{"rule_id": "R1", "reason": "test"}]},
+    )
+
+
+def test_load_app_data_warm_load_skips_parsing(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("MONEY_MAP_CACHE_DIR", str(tmp_path / "cache"))
+    data_dir = tmp_path / "data"
+    _write_minimal_dataset(data_dir)
+
+    cold = load_app_data(data_dir)
+    assert cold.fingerprint
+
+    def _no_parse(*_args, **_kwargs):
+        raise AssertionError("warm load must not parse source files")
+
+    monkeypatch.setattr("money_map.core.load.read_mappings", _no_parse)
+    warm = load_app_data(data_dir)
+
+    assert warm == cold
+
+
+def test_load_app_data_cache_invalidates_on_source_change(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("MONEY_MAP_CACHE_DIR", str(tmp_path / "cache"))
+    data_dir = tmp_path / "data"
+    _write_minimal_dataset(data_dir, dataset_version="1.0.0")
+    first = load_app_data(data_dir)
+
+    _write_minimal_dataset(data_dir, dataset_version="2.0.0")
+    second = load_app_data(data_dir)
+
+    assert first.meta.dataset_version == "1.0.0"
+    assert second.meta.dataset_version == "2.0.0"
+    assert second.fingerprint != first.fingerprint
+
+
+def test_source_registry_reuses_index_for_untouched_files(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("MONEY_MAP_CACHE_DIR", str(tmp_path / "cache"))
+    data_dir = tmp_path / "data"
+    _write_minimal_dataset(data_dir, dataset_version="1.0.0")
+    _write_json(data_dir / "packs" / "p1" / "bridges.seed.json", {"bridges": [{"id": "b1"}]})
+    load_app_data(data_dir)
+
+    _write_minimal_dataset(data_dir, dataset_version="1.0.1")
+
+    parsed_names: list[str] = []
+
+    def _tracking_read_mappings(paths, **kwargs):
+        parsed_names.extend(path.name for path in paths)
+        return read_mappings(paths, **kwargs)
+
+    monkeypatch.setattr("money_map.core.load.read_mappings", _tracking_read_mappings)
+    app_data = load_app_data(data_dir)
+
+    bridges = [source for source in app_data.sources if source.type == "bridges"]
+    assert app_data.meta.dataset_version == "1.0.1"
+    assert "bridges.seed.json" not in parsed_names
+    assert bridges and bridges[0].items == 1
+    assert bridges[0].notes["group"] == "pack"
+
+
+def test_prune_cache_evicts_expired_then_least_recently_used(tmp_path) -> None:
+    now = time.time()
+    for name, age_days in (("old", 40), ("lru", 3), ("mid", 2), ("new", 1)):
+        path = tmp_path / f"{name}.pickle"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (now - age_days * 86400, now - age_days * 86400))
+
+    removed = prune_cache(tmp_path, max_bytes=200, max_age_s=30 * 86400)
+
+    assert removed == 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["mid.pickle", "new.pickle"]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from money_map.core.economics import assess_economics
+from money_map.core.feasibility import assess_feasibility
+from money_map.core.model import Variant
+
+
+def _variant(variant_id: str) -> Variant:
+    # Build strings at runtime so they are distinct objects before interning.
+    return Variant(
+        variant_id=variant_id,
+        title="Title",
+        summary="",
+        cell_id="".join(["A", "1"]),
+        taxonomy_id="".join(["service", "_fee"]),
+        tags=["".join(["regu", "lated"])],
+        economics={"".join(["confi", "dence"]): "".join(["Me", "dium"]).lower()},
+        legal={"legal_gate": "".join(["require", "_check"])},
+    )
+
+
+def test_variant_is_slotted_with_interned_strings_and_tuple_tags() -> None:
+    first, second = _variant("v1"), _variant("v2")
+
+    assert not hasattr(first, "__dict__")
+    assert first.tags == ("regulated",)
+    assert first.cell_id is second.cell_id
+    assert first.taxonomy_id is second.taxonomy_id
+    assert first.tags[0] is second.tags[0]
+    assert first.legal["legal_gate"] is second.legal["legal_gate"]
+    assert first.economics["confidence"] is second.economics["confidence"]
+
+
+def test_slotted_models_round_trip_through_pickle() -> None:
+    variant = _variant("v1")
+    feasibility = assess_feasibility({"assets": []}, variant)
+    economics = assess_economics(variant)
+
+    assert pickle.loads(pickle.dumps(variant)) == variant
+    assert pickle.loads(pickle.dumps(feasibility)) == feasibility
+    assert pickle.loads(pickle.dumps(economics)) == economics
+    assert not hasattr(economics, "__dict__")
+
+
+def test_variant_rejects_non_mapping_sections_like_dict() -> None:
+    with pytest.raises(ValueError):
+        Variant(variant_id="v", title="", summary="", economics="abc")
+    with pytest.raises(TypeError):
+        Variant(variant_id="v", title="", summary="", legal=5)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import random
+from dataclasses import replace
+from pathlib import Path
+
+from money_map.app.api import validate_data
+from money_map.core.load import load_app_data
+from money_map.core.near_duplicates import (
+    find_near_duplicates,
+    jaccard,
+    minhash_signature,
+    variant_features,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _random_variants(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    vocab = [f"word{index}" for index in range(2000)]
+    variants = []
+    for index in range(count):
+        words = rng.sample(vocab, 30)
+        variants.append(
+            {
+                "id": f"v{index}",
+                "title": " ".join(words[:5]),
+                "summary": " ".join(words[5:20]),
+                "prep_steps": [" ".join(words[20:])],
+                "tags": ["seed"],
+            }
+        )
+    return variants
+
+
+def test_signature_agreement_tracks_jaccard_similarity() -> None:
+    first, second = _random_variants(2)
+    near = {**first, "summary": first["summary"] + " extra words here"}
+    features = [variant_features(item) for item in (first, near, second)]
+    signatures = [minhash_signature(item, 128) for item in features]
+
+    def agreement(left: tuple, right: tuple) -> float:
+        return sum(a == b for a, b in zip(left, right)) / len(left)
+
+    assert abs(agreement(signatures[0], signatures[1]) - jaccard(features[0], features[1])) < 0.15
+    assert agreement(signatures[0], signatures[2]) < 0.1
+    assert minhash_signature(frozenset(), 8) == minhash_signature(frozenset(), 8)
+
+
+def test_find_near_duplicates_reports_planted_clusters_only() -> None:
+    variants = _random_variants(3000)
+    app_data = load_app_data(ROOT / "data")
+    seed = app_data.variants[0]
+    copies = [
+        {**variants[10], "id": "copy.10", "title": variants[10]["title"].upper()},
+        {**variants[10], "id": "copy.10b", "summary": variants[10]["summary"] + " again"},
+        {**variants[20], "id": "copy.20", "tags": ["seed", "draft"]},
+        # Half of the words changed: related, but below the threshold.
+        {**variants[30], "id": "far.30", "summary": "a b c d e f g h i j", "prep_steps": []},
+        replace(seed, variant_id="draft.copy"),
+    ]
+
+    clusters = find_near_duplicates([*variants, *copies, seed], threshold=0.8)
+
+    assert [cluster.variant_ids for cluster in clusters] == sorted(
+        [
+            tuple(sorted((seed.variant_id, "draft.copy"))),
+            ("copy.10", "copy.10b", "v10"),
+            ("copy.20", "v20"),
+        ]
+    )
+    assert all(cluster.similarity >= 0.8 for cluster in clusters)
+
+
+def test_blank_variants_are_not_near_duplicates() -> None:
+    blank = [{"id": f"blank.{index}", "title": "", "summary": None} for index in range(5)]
+    copy = {**_random_variants(1)[0], "id": "copy.0"}
+
+    clusters = find_near_duplicates([*blank, *_random_variants(1), copy])
+
+    assert jaccard(frozenset(), frozenset()) == 0.0
+    assert [cluster.variant_ids for cluster in clusters] == [("copy.0", "v0")]
+
+
+def test_validate_data_reports_near_duplicate_pack_variants() -> None:
+    payload = validate_data(ROOT / "data", near_duplicates=0.8)
+
+    messages = [
+        issue["message"] for issue in payload["warns"] if issue["code"] == "VARIANT_NEAR_DUPLICATE"
+    ]
+    assert messages
+    assert any("de.muc.a1.01" in message for message in messages)
+    assert "near_duplicates" in payload["timings_ms"]
+    assert not any(
+        issue["code"] == "VARIANT_NEAR_DUPLICATE" for issue in validate_data(ROOT / "data")["warns"]
+    )
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+from money_map.app import api
+from money_map.app.api import recommend_batch, recommend_variants
+from money_map.core.load import load_profile
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _profiles() -> list[dict]:
+    base = load_profile(ROOT / "profiles" / "demo_fast_start.yaml")
+    return [
+        base,
+        {**base, "capital_eur": 0},
+        {**base, "time_per_week": 40, "capital_eur": 5000},
+        {**base, "language_level": "A1"},
+        base,
+    ]
+
+
+def _ranking(result) -> list[tuple[str, float]]:
+    return [(rec.variant.variant_id, rec.score) for rec in result.ranked_variants]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_recommend_batch_matches_single_calls_in_input_order(max_workers: int) -> None:
+    profiles = _profiles()
+    expected = [
+        recommend_variants(None, top_n=3, data_dir=ROOT / "data", profile_data=profile)
+        for profile in profiles
+    ]
+
+    results = list(
+        recommend_batch(
+            iter(profiles),
+            top_n=3,
+            data_dir=ROOT / "data",
+            max_workers=max_workers,
+            chunk_size=2,
+        )
+    )
+
+    assert [result.profile_hash for result in results] == [
+        result.profile_hash for result in expected
+    ]
+    assert [_ranking(result) for result in results] == [_ranking(result) for result in expected]
+    assert all("timings_ms" in result.diagnostics for result in results)
+
+
+class _BreakingExecutor:
+    """Runs the first ``ok`` submits inline, then reports a broken pool."""
+
+    def __init__(self, *_args, ok: int = 2, **_kwargs) -> None:
+        self.ok = ok
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        return None
+
+    def submit(self, func, *args):
+        if self.ok == 0:
+            raise BrokenProcessPool("worker died")
+        self.ok -= 1
+        future: Future = Future()
+        future.set_result(func(*args))
+        return future
+
+
+def test_map_chunks_falls_back_without_losing_the_chunk_being_submitted(monkeypatch) -> None:
+    monkeypatch.setattr(api, "ProcessPoolExecutor", _BreakingExecutor)
+    chunks = iter([[1], [2], [3], [4], [5]])
+
+    results = list(api._map_chunks(chunks, 4, lambda: None, (), lambda chunk: chunk[0] * 10))
+
+    assert results == [10, 20, 30, 40, 50]
+
+
+def test_cli_recommend_batch_streams_one_line_per_profile(tmp_path: Path) -> None:
+    profiles_path = tmp_path / "profiles.jsonl"
+    profiles = _profiles()[:3]
+    profiles_path.write_text(
+        "\n".join(json.dumps(profile, default=str) for profile in profiles) + "\n\n",
+        encoding="utf-8",
+    )
+    output_path = tmp_path / "out.jsonl"
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(ROOT / "src")
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "money_map.app.cli",
+            "recommend-batch",
+            "--profiles-jsonl",
+            str(profiles_path),
+            "--top",
+            "2",
+            "--data-dir",
+            str(ROOT / "data"),
+            "--workers",
+            "1",
+            "--output",
+            str(output_path),
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=tmp_path,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    lines = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    assert [line["index"] for line in lines] == [0, 1, 2]
+    assert all(len(line["recommendations"]) <= 2 for line in lines)
+
+
+def test_cli_recommend_batch_rejects_invalid_line(tmp_path: Path) -> None:
+    profiles_path = tmp_path / "profiles.jsonl"
+    profiles_path.write_text('{"capital_eur": 100}\n[1, 2]\n', encoding="utf-8")
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(ROOT / "src")
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "money_map.app.cli",
+            "recommend-batch",
+            "--profiles-jsonl",
+            str(profiles_path),
+            "--data-dir",
+            str(ROOT / "data"),
+            "--workers",
+            "1",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=tmp_path,
+        check=False,
+    )
+
+    assert result.returncode == 1
+    assert "INVALID_PROFILES_JSONL" in result.stderr
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from money_map.core.economics import assess_economics
+from money_map.core.feasibility import assess_feasibility
+from money_map.core.load import load_app_data
+from money_map.core.recommend import _explanation_signals, recommend
+from money_map.core.rules import evaluate_legal
+from money_map.core.scoring import build_catalogue_columns, score_catalogue, variant_facts
+
+
+def _catalogue():
+    root = Path(__file__).resolve().parents[1]
+    app_data = load_app_data(root / "data")
+    seed = app_data.variants[0]
+    extra = [
+        replace(seed, variant_id="edge.no_economics", economics={}),
+        replace(seed, variant_id="edge.blocked", legal={"legal_gate": "Blocked"}),
+        replace(seed, variant_id="edge.regulated", tags=("regulated",), review_date=""),
+        replace(seed, variant_id="edge.domain", regulated_domain="finance"),
+    ]
+    return app_data, list(app_data.variants) + extra
+
+
+def _scalar_score(profile, variant, app_data, objective) -> float:
+    policy = app_data.meta.staleness_policy
+    feasibility = assess_feasibility(profile, variant)
+    economics = assess_economics(variant)
+    legal = evaluate_legal(app_data.rulepack, variant, policy)
+    score = sum(
+        value for value, _ in _explanation_signals(feasibility, economics, legal, objective)
+    )
+    if not variant.economics:
+        score -= 50
+    if feasibility.status == "not_feasible":
+        score -= 75
+    return score
+
+
+@pytest.mark.parametrize("objective", ["fastest_money", "max_net", "balanced"])
+@pytest.mark.parametrize(
+    "profile",
+    [
+        {"language_level": "B1", "capital_eur": 300, "time_per_week": 10, "assets": ["laptop"]},
+        {"language_level": "A1", "capital_eur": 0, "time_per_week": 2, "assets": []},
+    ],
+)
+def test_column_scores_match_per_variant_scoring(profile, objective) -> None:
+    app_data, variants = _catalogue()
+    columns = build_catalogue_columns(variants, app_data.rulepack, app_data.meta.staleness_policy)
+
+    scored = score_catalogue(profile, columns, objective)
+
+    for row, score, status in zip(scored.rows, scored.scores, scored.statuses):
+        assert score == _scalar_score(profile, variants[row], app_data, objective)
+        assert status == assess_feasibility(profile, variants[row]).status
+
+
+def test_recommend_filters_and_diagnostics_follow_variant_order() -> None:
+    app_data, variants = _catalogue()
+    profile = {
+        "language_level": "A1",
+        "capital_eur": 0,
+        "time_per_week": 1,
+        "assets": [],
+        "constraints": ["no_regulated"],
+    }
+
+    result = recommend(
+        profile,
+        variants,
+        app_data.rulepack,
+        app_data.meta.staleness_policy,
+        filters={"exclude_blocked": True, "max_time_to_money_days": 14},
+        top_n=len(variants),
+    )
+
+    diagnostics = result.diagnostics
+    assert diagnostics["evaluated"] == len(variants)
+    assert diagnostics["filtered_out"] == sum(diagnostics["reasons"].values())
+    assert diagnostics["candidates"] + diagnostics["reasons"].get(
+        "constraint_regulated", 0
+    ) + diagnostics["reasons"].get("missing_assets_all", 0) == len(variants)
+    ranked_ids = [rec.variant.variant_id for rec in result.ranked_variants]
+    assert "edge.blocked" not in ranked_ids
+    assert "edge.regulated" not in ranked_ids
+    scores = [(-rec.score, rec.variant.variant_id) for rec in result.ranked_variants]
+    assert scores == sorted(scores)
+
+
+def test_recommend_builds_results_only_for_top_n(monkeypatch) -> None:
+    app_data, variants = _catalogue()
+    profile = {"language_level": "B1", "capital_eur": 300, "time_per_week": 10, "assets": []}
+    full = recommend(
+        profile,
+        variants,
+        app_data.rulepack,
+        app_data.meta.staleness_policy,
+        top_n=len(variants),
+    )
+
+    calls = []
+    original = evaluate_legal
+
+    def _counting(*args, **kwargs):
+        calls.append(args[1].variant_id)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr("money_map.core.scoring.evaluate_legal", _counting)
+    top = recommend(profile, variants, app_data.rulepack, app_data.meta.staleness_policy, top_n=3)
+
+    assert top.ranked_variants == full.ranked_variants[:3]
+    assert top.diagnostics == full.diagnostics
+    assert calls == [rec.variant.variant_id for rec in top.ranked_variants]
+
+
+def test_variant_facts_are_cached_per_fingerprint_and_as_of_date() -> None:
+    app_data, _variants = _catalogue()
+    as_of = date(2026, 1, 1)
+
+    facts = variant_facts(app_data, as_of=as_of)
+
+    assert variant_facts(app_data, as_of=as_of) is facts
+    assert variant_facts(app_data, as_of=date(2026, 1, 2)) is not facts
+    changed = replace(app_data, fingerprint=app_data.fingerprint + "-changed")
+    assert variant_facts(changed, as_of=as_of) is not facts
+    assert variant_facts(replace(app_data, fingerprint=""), as_of=as_of) is not facts
+
+
+def test_variant_facts_use_their_as_of_date() -> None:
+    app_data, _variants = _catalogue()
+    variant = replace(app_data.variants[0], review_date="2025-01-01")
+    policy = app_data.meta.staleness_policy
+    fresh = build_catalogue_columns([variant], app_data.rulepack, policy, as_of=date(2025, 1, 2))
+    late = date(2025, 1, 1) + timedelta(days=policy.warn_after_days + 1)
+    stale = build_catalogue_columns([variant], app_data.rulepack, policy, as_of=late)
+
+    assert not fresh.stale[0] and not fresh.fixed_results(0)[2].is_stale
+    assert stale.stale[0] and stale.fixed_results(0)[2].is_stale
+    profile = {"assets": list(variant.feasibility.get("required_assets", []))}
+    result = recommend(profile, [variant], app_data.rulepack, policy, facts=stale)
+    assert result.ranked_variants[0].stale
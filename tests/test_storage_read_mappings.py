@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import yaml
+
+from money_map.storage import fs
+from money_map.storage.fs import read_mappings, read_yaml
+
+
+def _write_packs(tmp_path, count: int) -> list:
+    paths = []
+    for idx in range(count):
+        path = tmp_path / f"pack_{idx}.yaml"
+        path.write_text(yaml.safe_dump({"pack_id": idx, "items": list(range(idx))}), "utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_read_yaml_prefers_libyaml_loader() -> None:
+    if hasattr(yaml, "CSafeLoader"):
+        assert fs._SafeLoader is yaml.CSafeLoader
+    assert read_yaml("data/meta.yaml")["dataset_version"]
+
+
+def test_read_mappings_keeps_input_order_in_process_pool(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(fs, "_PARALLEL_MIN_BYTES", 0)
+    paths = _write_packs(tmp_path, 6)
+    json_path = tmp_path / "extra.json"
+    json_path.write_text(json.dumps({"pack_id": "json"}), "utf-8")
+
+    results = read_mappings([*paths, json_path], max_workers=3)
+
+    assert [item["pack_id"] for item in results] == [0, 1, 2, 3, 4, 5, "json"]
+    assert results == read_mappings([*paths, json_path], max_workers=1)
+
+
+def test_read_mappings_reports_errors_in_place(tmp_path) -> None:
+    paths = _write_packs(tmp_path, 2)
+    broken = tmp_path / "broken.yaml"
+    broken.write_text("- not\n- a mapping\n", "utf-8")
+
+    results = read_mappings([paths[0], broken, paths[1]], return_exceptions=True)
+
+    assert results[0]["pack_id"] == 0
+    assert isinstance(results[1], ValueError)
+    assert results[2]["pack_id"] == 1
+    with pytest.raises(ValueError):
+        read_mappings([paths[0], broken])
+
+
+def test_read_mappings_parses_a_single_large_file_in_process(tmp_path, monkeypatch) -> None:
+    paths = _write_packs(tmp_path, 3)
+    monkeypatch.setattr(fs, "_PARALLEL_MIN_BYTES", paths[2].stat().st_size)
+
+    def _no_pool(*_args, **_kwargs):
+        raise AssertionError("one large file must not start a process pool")
+
+    monkeypatch.setattr(fs, "ProcessPoolExecutor", _no_pool)
+
+    assert [item["pack_id"] for item in read_mappings(paths, max_workers=3)] == [0, 1, 2]
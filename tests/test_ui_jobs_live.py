@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import json
+from datetime import date, datetime, timezone
+from itertools import islice
 from pathlib import Path
 
-from money_map.ui.jobs_live import create_variant_draft, map_job_to_occupation, resolve_jobs_source
+from money_map.ui.jobs_live import (
+    create_variant_draft,
+    iter_snapshot_rows,
+    latest_snapshot,
+    map_job_to_occupation,
+    resolve_jobs_source,
+)
 
 
 def test_map_job_to_occupation_matches_known_role() -> None:
@@ -35,3 +44,67 @@ def test_resolve_jobs_source_falls_back_without_snapshot(tmp_path: Path, monkeyp
     rows, meta = resolve_jobs_source(city="Munich", radius_km=10, days=3, size=2, profile="qa")
     assert meta["source"] == "seed"
     assert len(rows) >= 1
+
+
+def _write_snapshot(path: Path, rows: list) -> None:
+    path.write_text("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+
+
+def test_iter_snapshot_rows_filters_and_stops_at_limit() -> None:
+    rows = [
+        {
+            "hashId": "m1",
+            "titel": "Koch",
+            "arbeitsort": {"ort": "München"},
+            "publishedAt": "2026-03-05",
+        },
+        {
+            "hashId": "b1",
+            "titel": "Fahrer",
+            "arbeitsort": {"ort": "Berlin"},
+            "publishedAt": "2026-03-05",
+        },
+        {"hashId": "m2", "title": "Alt", "city": "MÜNCHEN", "publishedAt": "2026-02-01"},
+        {"hashId": "m3", "title": "Pfleger", "city": "München-Pasing", "publishedAt": "2026-03-04"},
+    ]
+    # An undecodable line after the matches proves that reading stops at the limit.
+    lines = [json.dumps(row, ensure_ascii=False).encode() for row in rows] + [b"{broken"]
+
+    found = list(
+        islice(iter_snapshot_rows(lines, city="münchen", published_since=date(2026, 3, 1)), 2)
+    )
+
+    assert [(row["hashId"], row["city"]) for row in found] == [
+        ("m1", "München"),
+        ("m3", "München-Pasing"),
+    ]
+    assert "raw" not in found[0]
+    assert [row["hashId"] for row in iter_snapshot_rows(lines[:4], city="Berlin")] == ["b1"]
+
+
+def test_resolve_jobs_source_reads_only_size_rows_from_snapshot(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setattr("money_map.ui.jobs_live.JOBS_SNAPSHOT_DIR", tmp_path)
+    today = datetime.now(timezone.utc).date().isoformat()
+    _write_snapshot(
+        tmp_path / "2026-03-01_120000.jsonl",
+        [
+            {"hashId": f"j{i}", "title": "Koch", "city": "München", "publishedAt": today}
+            for i in range(5)
+        ],
+    )
+
+    def _offline(**_kwargs):
+        raise OSError("offline")
+
+    monkeypatch.setattr("money_map.ui.jobs_live.fetch_live_jobs", _offline)
+    rows, meta = resolve_jobs_source(city="München", radius_km=10, days=3, size=2, profile="")
+    assert (meta["source"], meta["snapshot"]) == ("cache", "2026-03-01_120000.jsonl")
+    assert [row["hashId"] for row in rows] == ["j0", "j1"]
+
+    # No row matches the city spelling, so the newest rows are shown unfiltered.
+    rows, meta = resolve_jobs_source(city="Munich", radius_km=10, days=3, size=3, profile="")
+    assert meta["source"] == "cache"
+    assert [row["hashId"] for row in rows] == ["j0", "j1", "j2"]
+    assert latest_snapshot()[0][0]["raw"]["hashId"] == "j0"
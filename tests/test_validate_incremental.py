@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from shutil import copytree, ignore_patterns
+
+from money_map.core import validate as validate_module
+from money_map.core.load import load_app_data
+from money_map.storage.fs import read_yaml, write_yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _report_json(report) -> str:
+    payload = asdict(report)
+    payload.pop("generated_at")
+    return json.dumps(payload, default=str)
+
+
+def test_validate_incremental_reuses_unchanged_variants_section(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("MONEY_MAP_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(validate_module, "_SECTION_CACHE", {})
+    data_dir = tmp_path / "data"
+    copytree(ROOT / "data", data_dir, ignore=ignore_patterns("compiled"))
+
+    built: list[str] = []
+    original = validate_module._variant_section
+
+    def _counting(app_data):
+        built.append(app_data.source_hashes["variants"])
+        return original(app_data)
+
+    monkeypatch.setattr(validate_module, "_variant_section", _counting)
+
+    app_data = load_app_data(data_dir, use_cache=False)
+    assert _report_json(validate_module.validate_incremental(app_data)) == _report_json(
+        validate_module.validate(app_data)
+    )
+
+    variants_path = data_dir / "variants.yaml"
+    variants = read_yaml(variants_path)
+    variants["variants"][0]["legal"]["rule_ids"] = ["de.legal.blocked.default"]
+    variants["variants"][0]["regulated_domain"] = "transport"
+    write_yaml(variants_path, variants)
+    rulepack_path = data_dir / "rulepacks" / "DE.yaml"
+    rulepack = read_yaml(rulepack_path)
+    write_yaml(rulepack_path, rulepack)
+    edited = load_app_data(data_dir, use_cache=False)
+    validate_module.validate_incremental(edited)
+    assert len(built) == 3  # full validate, first incremental run, edited variants
+
+    rulepack["rules"] = [
+        rule for rule in rulepack["rules"] if rule["rule_id"] != "de.legal.blocked.default"
+    ]
+    rulepack["regulated_domains"] = [
+        domain for domain in rulepack["regulated_domains"] if domain != "transport"
+    ]
+    write_yaml(rulepack_path, rulepack)
+    rulepack_only = load_app_data(data_dir, use_cache=False)
+    incremental = validate_module.validate_incremental(rulepack_only)
+
+    assert len(built) == 3
+    codes = {issue["code"] for issue in incremental.warns}
+    assert {"VARIANT_RULE_REF_UNKNOWN", "VARIANT_REGULATED_DOMAIN_UNKNOWN"} <= codes
+    assert _report_json(incremental) == _report_json(validate_module.validate(rulepack_only))
+    assert len(built) == 4
+
+
+def test_validate_incremental_reads_sections_from_disk(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("MONEY_MAP_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(validate_module, "_SECTION_CACHE", {})
+    app_data = load_app_data(ROOT / "data")
+    first = validate_module.validate_incremental(app_data)
+
+    validate_module._SECTION_CACHE.clear()
+    monkeypatch.setattr(validate_module, "_variant_section", None)
+    monkeypatch.setattr(validate_module, "_rulepack_section", None)
+    assert _report_json(validate_module.validate_incremental(app_data)) == _report_json(first)
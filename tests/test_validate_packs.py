@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+from shutil import copytree
+
+from money_map.core.validate_packs import discover_packs, validate_pack, validate_packs
+from money_map.storage.fs import read_yaml, write_yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+AS_OF = date(2026, 3, 1)
+
+
+def _copy_pack(data_dir: Path, pack_id: str) -> Path:
+    pack_dir = data_dir / "packs" / pack_id
+    copytree(ROOT / "data" / "packs" / "de_muc", pack_dir)
+    meta = read_yaml(pack_dir / "meta.yaml")
+    write_yaml(pack_dir / "meta.yaml", {**meta, "pack_id": pack_id})
+    return pack_dir
+
+
+def test_seed_pack_validates_clean() -> None:
+    result = validate_pack(ROOT / "data" / "packs" / "de_muc", as_of=AS_OF)
+
+    assert result["status"] == "valid"
+    assert result["fatals"] == []
+    assert result["warns"] == []
+    assert result["counts"]["variants"] > 0
+    assert {"read", "rulepack", "variants", "bridges_routes_maps"} <= set(result["timings_ms"])
+
+
+def test_validate_packs_merges_issues_in_pack_order(tmp_path: Path) -> None:
+    broken = _copy_pack(tmp_path, "b_broken")
+    _copy_pack(tmp_path, "a_clean")
+    (tmp_path / "packs" / "not_a_pack").mkdir()
+
+    variants = read_yaml(broken / "variants.seed.yaml")
+    variants["variants"][1]["id"] = variants["variants"][0]["id"]
+    variants["variants"][2]["cell_id"] = "Z9"
+    write_yaml(broken / "variants.seed.yaml", variants)
+    routes = read_yaml(broken / "routes.seed.yaml")
+    routes["routes"][0]["steps"][0]["bridge_id"] = "br.missing"
+    write_yaml(broken / "routes.seed.yaml", routes)
+
+    assert [path.name for path in discover_packs(tmp_path)] == ["a_clean", "b_broken"]
+    parallel = validate_packs(tmp_path, max_workers=2, as_of=AS_OF)
+    sequential = validate_packs(tmp_path, max_workers=1, as_of=AS_OF)
+
+    assert parallel["status"] == "invalid"
+    assert [pack["pack_id"] for pack in parallel["packs"]] == ["a_clean", "b_broken"]
+    assert [(issue["pack"], issue["code"]) for issue in parallel["fatals"]] == [
+        ("b_broken", "PACK_VARIANTS_ID_DUPLICATE"),
+        ("b_broken", "PACK_VARIANT_CELL_UNKNOWN"),
+        ("b_broken", "PACK_ROUTE_BRIDGE_UNKNOWN"),
+    ]
+    assert parallel["fatals"] == sequential["fatals"]
+    assert parallel["warns"] == sequential["warns"]
+    assert set(parallel["timings_ms"]) == {"total", "a_clean", "b_broken"}
+
+
+def test_malformed_pack_types_become_fatals_instead_of_raising(tmp_path: Path) -> None:
+    pack_dir = _copy_pack(tmp_path, "bad_types")
+    rulepack = read_yaml(pack_dir / "rulepack.yaml")
+    rulepack["staleness_policy"] = {"warn_after_days": "soon", "hard_after_days": [1]}
+    rulepack["regulated_domains"] = [{"childcare": 1}, "crafts"]
+    write_yaml(pack_dir / "rulepack.yaml", rulepack)
+    variants = read_yaml(pack_dir / "variants.seed.yaml")
+    variants["variants"][0]["cell_id"] = ["A1"]
+    variants["variants"][1]["confidence"] = {"level": "high"}
+    write_yaml(pack_dir / "variants.seed.yaml", variants)
+    maps = read_yaml(pack_dir / "occupation_map.yaml")
+    maps["maps"][0]["assign"] = {"cell_id": {"cell": "A1"}}
+    write_yaml(pack_dir / "occupation_map.yaml", maps)
+
+    result = validate_pack(pack_dir, as_of=AS_OF)
+
+    codes = [issue["code"] for issue in result["fatals"]]
+    assert codes == [
+        "PACK_RULEPACK_STALENESS_POLICY_INVALID",
+        "PACK_RULEPACK_STALENESS_POLICY_INVALID",
+        "PACK_RULEPACK_DOMAINS_INVALID",
+        "PACK_VARIANT_CELL_UNKNOWN",
+        "PACK_OCCUPATION_MAP_CELL_UNKNOWN",
+    ]
+    assert result["fatals"][0]["location"] == "rulepack.staleness_policy.warn_after_days"
+    assert "PACK_VARIANT_CONFIDENCE_UNKNOWN" in {issue["code"] for issue in result["warns"]}
+    assert result["status"] == "invalid"
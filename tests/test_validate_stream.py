@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import yaml
+
+from money_map.core.load import load_app_data
+from money_map.core.validate import validate
+from money_map.core.validate_stream import stream_validate_file
+from money_map.storage.fs import iter_records, read_yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _issues(records: list[dict], severity: str) -> list[dict]:
+    return [
+        {key: value for key, value in record.items() if key not in {"type", "severity"}}
+        for record in records
+        if record["type"] == "issue" and record["severity"] == severity
+    ]
+
+
+def test_stream_validation_matches_validate_on_seed_data() -> None:
+    records = list(stream_validate_file(ROOT / "data"))
+    report = validate(load_app_data(ROOT / "data"))
+
+    assert _issues(records, "fatal") == report.fatals
+    assert _issues(records, "warn") == report.warns
+    summary = records[-1]
+    assert summary["type"] == "summary"
+    assert summary["status"] == report.status
+    assert summary["variants"] == len(read_yaml(ROOT / "data" / "variants.yaml")["variants"])
+
+
+def test_stream_validation_reads_jsonl_dump(tmp_path: Path) -> None:
+    seed = read_yaml(ROOT / "data" / "variants.yaml")["variants"][0]
+    dump = tmp_path / "variants.jsonl"
+    lines = [
+        json.dumps({**seed, "legal": {**seed["legal"], "rule_ids": ["de.unknown"]}}, default=str),
+        json.dumps(seed, default=str),
+        "[1, 2]",
+        "{broken",
+    ]
+    dump.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    records = list(stream_validate_file(ROOT / "data", dump))
+
+    fatal_codes = [issue["code"] for issue in _issues(records, "fatal")]
+    assert fatal_codes == [
+        "VARIANT_ID_DUPLICATE",
+        "VARIANT_RECORD_INVALID",
+        "VARIANT_RECORD_INVALID",
+    ]
+    assert "VARIANT_RULE_REF_UNKNOWN" in {issue["code"] for issue in _issues(records, "warn")}
+    assert records[-1]["status"] == "invalid"
+    assert records[-1]["variants"] == 4
+
+
+def test_stream_validation_reports_malformed_sections_and_keeps_going(tmp_path: Path) -> None:
+    seed = read_yaml(ROOT / "data" / "variants.yaml")["variants"][0]
+    dump = tmp_path / "variants.jsonl"
+    lines = [
+        json.dumps({**seed, "variant_id": "bad.economics", "economics": "abc"}, default=str),
+        json.dumps({**seed, "variant_id": "bad.legal", "legal": 5}, default=str),
+        json.dumps(seed, default=str),
+    ]
+    dump.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    records = list(stream_validate_file(ROOT / "data", dump))
+
+    invalid = [i for i in _issues(records, "fatal") if i["code"] == "VARIANT_RECORD_INVALID"]
+    assert [issue["location"] for issue in invalid] == ["variants[0]", "variants[1]"]
+    assert records[-1]["type"] == "summary"
+    assert records[-1]["variants"] == 3
+
+
+def test_stream_validation_reports_yaml_syntax_error_mid_stream(tmp_path: Path) -> None:
+    seed = read_yaml(ROOT / "data" / "variants.yaml")["variants"][0]
+    path = tmp_path / "variants.yaml"
+    text = yaml.safe_dump({"variants": [seed]}, sort_keys=False, allow_unicode=True)
+    path.write_text(text + "- variant_id: [unclosed\n", encoding="utf-8")
+
+    records = list(stream_validate_file(ROOT / "data", path))
+
+    fatals = _issues(records, "fatal")
+    assert fatals[-1]["code"] == "VARIANT_RECORD_INVALID"
+    assert fatals[-1]["location"] == "variants[1]"
+    assert "cannot be read" in fatals[-1]["message"]
+    assert records[-1]["status"] == "invalid"
+    assert records[-1]["variants"] == 1
+
+
+def test_iter_records_yaml_matches_full_load(tmp_path: Path) -> None:
+    path = tmp_path / "variants.yaml"
+    path.write_text(
+        "schema_version: 1\n"
+        "notes: {nested: [1, {a: b}]}\n"
+        "variants:\n"
+        "- &base\n"
+        "  variant_id: a\n"
+        "  review_date: 2025-01-01\n"
+        "  tags: [x, y]\n"
+        "- <<: *base\n"
+        "  variant_id: b\n"
+        "after: true\n",
+        encoding="utf-8",
+    )
+    expected = yaml.safe_load(path.read_text(encoding="utf-8"))["variants"]
+    assert list(iter_records(path, "variants")) == expected
+    assert list(iter_records(path, "missing")) == []
+
+
+def test_iter_records_yaml_resolves_anchors_from_skipped_sections(tmp_path: Path) -> None:
+    path = tmp_path / "variants.yaml"
+    path.write_text(
+        "defaults: &d {summary: shared, tags: &t [x]}\n"
+        "variants:\n"
+        "- <<: *d\n"
+        "  variant_id: a\n"
+        "  title: A\n"
+        "- {variant_id: b, tags: *t}\n",
+        encoding="utf-8",
+    )
+    expected = yaml.safe_load(path.read_text(encoding="utf-8"))["variants"]
+    assert list(iter_records(path, "variants")) == expected
+
+
+def test_stream_validation_reports_undefined_alias_per_record(tmp_path: Path) -> None:
+    seed = read_yaml(ROOT / "data" / "variants.yaml")["variants"][0]
+    path = tmp_path / "variants.yaml"
+    text = yaml.safe_dump({"variants": [seed]}, sort_keys=False, allow_unicode=True)
+    path.write_text(
+        text + "- {<<: *missing, variant_id: b}\n- {variant_id: c, title: C}\n",
+        encoding="utf-8",
+    )
+
+    records = list(stream_validate_file(ROOT / "data", path))
+
+    invalid = [i for i in _issues(records, "fatal") if i["code"] == "VARIANT_RECORD_INVALID"]
+    assert [issue["location"] for issue in invalid] == ["variants[1]"]
+    assert "undefined alias 'missing'" in invalid[0]["message"]
+    assert records[-1]["variants"] == 3
+
+
+def test_cli_validate_stream_exit_code(tmp_path: Path) -> None:
+    dump = tmp_path / "variants.jsonl"
+    dump.write_text('{"variant_id": ""}\n', encoding="utf-8")
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(ROOT / "src")
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "money_map.app.cli",
+            "validate",
+            "--stream",
+            "--data-dir",
+            str(ROOT / "data"),
+            "--variants",
+            str(dump),
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=tmp_path,
+        check=False,
+    )
+
+    assert result.returncode == 1, result.stderr
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert records[-1]["type"] == "summary"
+    assert "VARIANT_ID_MISSING" in {record.get("code") for record in records}
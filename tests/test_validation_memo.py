@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import contextvars
+import json
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from money_map.app import api, observability
+from money_map.core import validate as validate_module
+from money_map.core.load import load_app_data
+from money_map.storage.fs import write_json
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def counted_validate(monkeypatch, tmp_path):
+    monkeypatch.setenv("MONEY_MAP_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(validate_module, "_REPORT_CACHE", {})
+    calls: list[str] = []
+
+    def _counting(name: str):
+        original = getattr(validate_module, name)
+
+        def _wrapper(app_data):
+            calls.append(name)
+            return original(app_data)
+
+        return _wrapper
+
+    for name in ("validate", "validate_incremental"):
+        monkeypatch.setattr(validate_module, name, _counting(name))
+    return calls
+
+
+def test_validate_cached_reuses_report_in_process_and_on_disk(counted_validate) -> None:
+    app_data = load_app_data(ROOT / "data")
+
+    first = validate_module.validate_cached(app_data)
+    assert validate_module.validate_cached(app_data) is first
+    assert len(counted_validate) == 1
+
+    validate_module._REPORT_CACHE.clear()
+    from_disk = validate_module.validate_cached(app_data)
+    assert len(counted_validate) == 1
+    assert from_disk == first
+
+    validate_module.validate_cached(app_data, revalidate=True)
+    assert len(counted_validate) == 2
+
+
+def test_validate_cached_skips_datasets_without_fingerprint(counted_validate) -> None:
+    app_data = replace(load_app_data(ROOT / "data"), fingerprint="")
+    validate_module.validate_cached(app_data)
+    validate_module.validate_cached(app_data)
+    assert len(counted_validate) == 2
+
+
+def test_api_calls_share_validation_and_report_file(
+    counted_validate, monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setattr(
+        observability, "_RUN_CONTEXT", contextvars.ContextVar("run_context", default=None)
+    )
+    profile = ROOT / "profiles" / "demo_fast_start.yaml"
+    out_dir = tmp_path / "exports"
+    run_context = observability.init_run_context("recommend", str(ROOT / "data"), str(out_dir))
+
+    api.recommend_variants(profile, top_n=1, data_dir=ROOT / "data")
+    api.recommend_variants(profile, top_n=1, data_dir=ROOT / "data")
+    api.classify_idea("Ich biete Nachhilfe online an", data_dir=ROOT / "data")
+
+    assert len(counted_validate) == 1
+    written = list(out_dir.glob("validate-report-*.json"))
+    assert [path.name for path in written] == [f"validate-report-{run_context.run_id}.json"]
+
+    api.recommend_variants(profile, top_n=1, data_dir=ROOT / "data", revalidate=True)
+    assert len(counted_validate) == 2
+
+
+def test_validate_report_text_is_memoized_across_runs_with_fresh_timestamp(
+    counted_validate, monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setattr(api, "_REPORT_TEXTS", {})
+    app_data = load_app_data(ROOT / "data")
+    stamps = iter(["2026-01-01T00:00:00", "2026-01-02T00:00:00"])
+
+    class _Clock:
+        @staticmethod
+        def utcnow():
+            return datetime.fromisoformat(next(stamps))
+
+    monkeypatch.setattr(api, "datetime", _Clock)
+
+    _, first = api._validate_app_data(app_data, tmp_path, "run-a")
+    _, second = api._validate_app_data(app_data, tmp_path, "run-b")
+
+    assert len(api._REPORT_TEXTS) == 1
+    assert len(counted_validate) == 1
+    for payload, stamp in ((first, "2026-01-01T00:00:00"), (second, "2026-01-02T00:00:00")):
+        written = json.loads(Path(payload["report_path"]).read_text(encoding="utf-8"))
+        assert written["generated_at"] == payload["generated_at"] == stamp
+        assert written == {key: value for key, value in payload.items() if key != "report_path"}
+    expected = tmp_path / "expected.json"
+    write_json(expected, {k: v for k, v in second.items() if k != "report_path"}, default=str)
+    assert Path(second["report_path"]).read_text(encoding="utf-8") == expected.read_text(
+        encoding="utf-8"
+    )
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from money_map.core import validation_rules
+from money_map.core.load import load_app_data
+from money_map.core.validate import validate, validate_with_timings
+from money_map.core.validation_rules import VariantRule, register_variant_rule, rules_signature
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def rule_table(monkeypatch):
+    monkeypatch.setattr(validation_rules, "VARIANT_RULES", list(validation_rules.VARIANT_RULES))
+    monkeypatch.setattr(validation_rules, "_SIGNATURE", None)
+    return validation_rules.VARIANT_RULES
+
+
+def test_rule_table_reports_variant_issues_in_table_order() -> None:
+    app_data = load_app_data(ROOT / "data")
+    variant = app_data.variants[0]
+    broken = replace(
+        variant,
+        title="",
+        economics={
+            **variant.economics,
+            "typical_net_month_eur_range": [900, 100],
+            "confidence": "certain",
+        },
+        legal={**variant.legal, "legal_gate": "maybe", "rule_ids": ["de.unknown"]},
+        feasibility={**variant.feasibility, "min_capital": -5},
+    )
+    report = validate(replace(app_data, variants=[broken, *app_data.variants]))
+
+    assert [issue["code"] for issue in report.fatals] == [
+        "VARIANT_TITLE_MISSING",
+        "VARIANT_ID_DUPLICATE",
+    ]
+    own = [issue for issue in report.warns if f"[{variant.variant_id}]" in issue["location"]]
+    assert [issue["code"] for issue in own][:4] == [
+        "VARIANT_ECONOMICS_NET_RANGE_INVALID_ORDER",
+        "VARIANT_ECONOMICS_CONFIDENCE_UNKNOWN",
+        "VARIANT_LEGAL_GATE_UNKNOWN",
+        "VARIANT_RULE_REF_UNKNOWN",
+    ]
+    confidence = own[1]
+    assert confidence["message"] == "Unknown confidence enum: certain"
+    assert confidence["location"] == f"variants[{variant.variant_id}].economics.confidence"
+    rule_ref = own[3]
+    assert rule_ref["location"] == f"variants[{variant.variant_id}].legal.rule_ids[0]"
+    negative = [i for i in own if i["code"] == "VARIANT_FEASIBILITY_NEGATIVE_VALUE"]
+    assert negative[0]["message"] == f"min_capital cannot be negative for {variant.variant_id}"
+
+
+def test_register_variant_rule_extends_table_and_signature(rule_table) -> None:
+    app_data = load_app_data(ROOT / "data")
+    before = rules_signature()
+    register_variant_rule(
+        VariantRule(
+            code="VARIANT_TITLE_TOO_SHORT",
+            severity="warn",
+            selector=lambda variant: variant.title,
+            predicate=lambda value, _ctx: len(value) < 100,
+            location="variants[{variant_id}].title",
+            message="Title of {variant_id} is short: {value}",
+        ),
+        before="VARIANT_SUMMARY_MISSING",
+    )
+
+    assert rules_signature() != before
+    assert [rule.code for rule in rule_table].index("VARIANT_TITLE_TOO_SHORT") == 3
+    warns = validate(app_data).warns
+    assert sum(issue["code"] == "VARIANT_TITLE_TOO_SHORT" for issue in warns) == len(
+        app_data.variants
+    )
+    with pytest.raises(ValueError):
+        register_variant_rule(replace(rule_table[0], severity="info"))
+    with pytest.raises(TypeError):
+        register_variant_rule(replace(rule_table[0], predicate="not value"))
+
+
+def test_validate_with_timings_matches_validate() -> None:
+    app_data = load_app_data(ROOT / "data")
+    report, timings = validate_with_timings(app_data)
+
+    assert report.fatals == validate(app_data).fatals
+    assert report.warns == validate(app_data).warns
+    expected = {rule.code for rule in validation_rules.VARIANT_RULES}
+    assert expected | {"staleness", "meta", "rulepack", "report"} <= set(timings)
+    assert all(elapsed >= 0 for elapsed in timings.values())
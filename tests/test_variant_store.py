@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+from shutil import copytree
+
+from money_map.app.api import compile_dataset
+from money_map.core.compiled import variant_store_path
+from money_map.core.economics import assess_economics
+from money_map.core.load import load_app_data, load_variant_store
+from money_map.core.model import Variant
+from money_map.core.variant_store import VariantStore, open_variant_store
+
+
+def test_store_columns_match_economics_and_requirements() -> None:
+    root = Path(__file__).resolve().parents[1]
+    variants = load_app_data(root / "data").variants
+
+    with VariantStore.from_variants(variants) as store:
+        assert len(store) == len(variants)
+        for index, variant in enumerate(variants):
+            row = store.row(index)
+            economics = assess_economics(variant)
+            assert row["variant_id"] == variant.variant_id
+            assert [row["time_to_first_money_min"], row["time_to_first_money_max"]] == (
+                economics.time_to_first_money_days_range
+            )
+            assert [row["net_month_min"], row["net_month_max"]] == (
+                economics.typical_net_month_eur_range
+            )
+            assert [row["costs_min"], row["costs_max"]] == economics.costs_eur_range
+            assert row["confidence"] == economics.confidence
+            assert row["min_capital"] == variant.feasibility.get("min_capital", 0)
+            assert row["min_language_level"] == variant.feasibility.get("min_language_level")
+            assert store.position(variant.variant_id) == index
+
+
+def test_store_normalizes_missing_and_invalid_fields() -> None:
+    variant = Variant(
+        variant_id="v.odd",
+        title="Odd",
+        summary="",
+        economics={"time_to_first_money_days_range": [30, 7], "confidence": "HIGH"},
+        legal={"gate": "Unknown"},
+        feasibility={"min_language_level": "Z9"},
+        review_date="not-a-date",
+    )
+
+    row = VariantStore.from_variants([variant]).row(0)
+
+    assert row["time_to_first_money_min"] == 7
+    assert row["time_to_first_money_max"] == 30
+    assert row["confidence"] == "high"
+    assert row["legal_gate"] == "require_check"
+    assert row["min_language_rank"] == -1
+    assert row["review_date"] is None
+
+
+def test_store_keeps_ranges_beyond_int32_and_clamps_to_int64() -> None:
+    variant = Variant(
+        variant_id="v.large",
+        title="Large",
+        summary="",
+        economics={
+            "typical_net_month_eur_range": [0, 3_000_000_000],
+            "costs_eur_range": [-(10**20), 10**20],
+        },
+    )
+
+    row = VariantStore.from_variants([variant]).row(0)
+
+    assert [row["net_month_min"], row["net_month_max"]] == [0, 3_000_000_000]
+    assert [row["costs_min"], row["costs_max"]] == [-(2**63), 2**63 - 1]
+
+
+def test_compile_writes_mappable_store(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("MONEY_MAP_DISABLE_CACHE", "1")
+    root = Path(__file__).resolve().parents[1]
+    data_dir = tmp_path / "data"
+    copytree(root / "data", data_dir, ignore=lambda *_args: ["compiled"])
+
+    summary = compile_dataset(data_dir)
+
+    store = load_variant_store(data_dir)
+    assert store is not None
+    assert len(store) == summary["variants"]
+    assert store.variant_ids() == [v.variant_id for v in load_app_data(data_dir).variants]
+    store.close()
+
+    path = variant_store_path(data_dir)
+    assert open_variant_store(path, compiled_ns=store.compiled_ns + 1) is None
+    path.write_bytes(path.read_bytes()[:40])
+    assert open_variant_store(path) is None